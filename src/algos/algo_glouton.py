@@ -0,0 +1,133 @@
+import numpy as np
+from structures.union_find import UnionFind
+from structures.stats_recherche import StatsRecherche
+import utils
+
+
+# Algorithme glouton des arêtes (Glouton)
+
+def _aretes_candidates(D, sommets, voisins):
+    """
+    Arêtes entre chaque sommet et ses voisins candidats, sans doublons ((u, v) et (v, u)),
+    triées par longueur croissante.
+
+    Args:
+        D (numpy.ndarray): La matrice des distances (indices de sommets)
+        sommets (numpy.ndarray): Les sommets (m,)
+        voisins (numpy.ndarray): voisins[i] sont les candidats du sommet sommets[i] (m, k)
+
+    Returns:
+        numpy.ndarray: Le tableau (nb_aretes, 2) des arêtes, u < v
+    """
+    u = np.repeat(np.asarray(sommets, dtype=np.int64), voisins.shape[1])
+    v = np.asarray(voisins, dtype=np.int64).ravel()
+    n = int(max(u.max(), v.max())) + 1
+    # Une arête est codée min * n + max : np.unique retire les doublons
+    codes = np.unique(np.minimum(u, v) * n + np.maximum(u, v))
+    aretes = np.stack((codes // n, codes % n), axis=1)
+    longueurs = D[aretes[:, 0], aretes[:, 1]]
+    return aretes[np.argsort(longueurs, kind='stable')]
+
+
+def _accepter_aretes(aretes, degre, liens, fragments):
+    """
+    Parcourt les arêtes dans l'ordre et accepte celles qui gardent des degrés <= 2
+    et relient deux fragments différents (pas de cycle prématuré).
+
+    Returns:
+        int: Le nombre d'arêtes acceptées
+    """
+    acceptees = 0
+    for a, b in aretes.tolist():
+        # unir n'est appelé (et ne modifie les fragments) que si les degrés le permettent
+        if degre[a] < 2 and degre[b] < 2 and fragments.unir(a, b):
+            degre[a] += 1
+            degre[b] += 1
+            liens[a].append(b)
+            liens[b].append(a)
+            acceptees += 1
+            if fragments.nb_ensembles == 1:
+                break
+    return acceptees
+
+
+def algo_glouton(G, k_voisins=10, voisins=None, k_raccord=8, avec_stats=False):
+    """
+    Implémente l'algorithme glouton des arêtes (greedy edge)
+    Principe :
+
+    1. Lister les arêtes candidates (chaque ville et ses k plus proches voisins), par longueur croissante
+    2. Accepter une arête si ses deux villes ont un degré < 2 et si elle relie deux fragments
+       différents (union-find) : on obtient des chemins disjoints (fragments)
+    3. Raccorder les fragments : même règle sur les arêtes entre extrémités de fragments
+       (k_raccord plus proches extrémités, doublé si aucune arête n'est acceptée),
+       jusqu'à un seul chemin, refermé en cycle
+
+    Complexité : O(n k log(n k)) pour le tri des arêtes, l'union-find est quasi constant par arête.
+    Les listes de voisins sont lues dans D (O(n^2) si elles ne sont pas fournies).
+    Le cycle obtenu est en général bien meilleur que ceux de PPP ou OptPrim : le 2-opt a moins de travail.
+
+    Args:
+        G (GrapheMD): Le graphe des distances entre les points
+        k_voisins (int): Le nombre de voisins candidats par ville (si voisins est absent)
+        voisins (numpy.ndarray): Les listes de voisins candidats (n, k), ex: utils.calculer_voisins_candidats
+        k_raccord (int): Le nombre initial d'extrémités candidates par extrémité, pour le raccord
+        avec_stats (bool): Retourner aussi les statistiques
+
+    Returns:
+        list: Une liste représentant le cycle hamiltonien trouvé (commençant par la ville 0)
+        Si avec_stats : tuple (cycle, stats) avec stats (StatsRecherche) contenant
+            aretes_candidates, aretes_acceptees, fragments (après l'étape 2) et passes_raccord
+    """
+    G.exiger_symetrique("Glouton")
+    stats = StatsRecherche("Glouton") if avec_stats else None
+    n = G.n
+    if n <= 3:
+        cycle = list(range(n))
+        return (cycle, stats) if avec_stats else cycle
+
+    D = np.asarray(G.D)
+    if voisins is None:
+        voisins = utils.calculer_voisins_candidats(G, k_voisins)
+
+    # 1-2. Arêtes candidates, acceptées par ordre de longueur croissante
+    aretes = _aretes_candidates(D, np.arange(n), np.asarray(voisins))
+    degre = [0] * n
+    liens = [[] for _ in range(n)]
+    fragments = UnionFind(n)
+    acceptees = _accepter_aretes(aretes, degre, liens, fragments)
+    nb_fragments = fragments.nb_ensembles
+
+    # 3. Raccord des fragments par leurs extrémités (degré < 2 ; une ville isolée est ses deux extrémités)
+    passes = 0
+    while fragments.nb_ensembles > 1:
+        extremites = np.flatnonzero(np.asarray(degre) < 2)
+        m = len(extremites)
+        k = min(k_raccord, m - 1)
+        D_ext = np.array(D[np.ix_(extremites, extremites)], dtype=np.float64)
+        np.fill_diagonal(D_ext, np.inf)
+        proches = np.argpartition(D_ext, k - 1, axis=1)[:, :k]
+        aretes_ext = extremites[_aretes_candidates(D_ext, np.arange(m), proches)]
+        nouvelles = _accepter_aretes(aretes_ext, degre, liens, fragments)
+        acceptees += nouvelles
+        passes += 1
+        if nouvelles == 0:
+            # Extrémités candidates toutes dans le même fragment : on élargit le voisinage
+            k_raccord *= 2
+
+    # Parcours du chemin d'une extrémité à l'autre, puis rotation pour commencer par 0
+    debut = next(v for v in range(n) if degre[v] < 2)
+    chemin = [debut]
+    precedent, courant = -1, debut
+    for _ in range(n - 1):
+        suivant = liens[courant][0] if liens[courant][0] != precedent else liens[courant][-1]
+        precedent, courant = courant, suivant
+        chemin.append(courant)
+    zero = chemin.index(0)
+    cycle = chemin[zero:] + chemin[:zero]
+
+    if avec_stats:
+        stats.compteurs.update(aretes_candidates=len(aretes), aretes_acceptees=acceptees,
+                               fragments=nb_fragments, passes_raccord=passes)
+        return cycle, stats
+    return cycle
@@ -0,0 +1,73 @@
+import numpy as np
+
+
+# Algorithme de construction par courbe de Hilbert (très grandes instances)
+
+def calculer_indices_hilbert(points, ordre=16):
+    """
+    Calcule, pour chaque point, sa position d sur une courbe de Hilbert d'ordre donné.
+    Les points sont ramenés sur une grille 2^ordre x 2^ordre (même échelle sur x et y),
+    puis la conversion (x, y) -> d est faite pour tous les points à la fois.
+
+    Args:
+        points (list | numpy.ndarray): Les coordonnées (x, y) des villes
+        ordre (int): La finesse de la grille (2^ordre cases par côté, au plus 31)
+
+    Returns:
+        numpy.ndarray: Le tableau (n,) des positions sur la courbe
+    """
+    P = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    taille = 1 << ordre
+
+    # 1. Discrétisation sur la grille
+    mini = P.min(axis=0)
+    etendue = float((P.max(axis=0) - mini).max())
+    if etendue == 0.0:
+        etendue = 1.0
+    grille = np.floor((P - mini) / etendue * (taille - 1)).astype(np.int64)
+    x = grille[:, 0].copy()
+    y = grille[:, 1].copy()
+
+    # 2. Conversion (x, y) -> d, quadrant par quadrant (du plus grand au plus petit)
+    d = np.zeros(len(P), dtype=np.int64)
+    s = taille >> 1
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        d += s * s * ((3 * rx) ^ ry)
+
+        # Rotation du quadrant pour que la courbe reste continue
+        retourner = ~ry & rx
+        x[retourner] = taille - 1 - x[retourner]
+        y[retourner] = taille - 1 - y[retourner]
+        echanger = ~ry
+        x[echanger], y[echanger] = y[echanger], x[echanger]
+        s >>= 1
+
+    return d
+
+
+def algo_hilbert(G, ordre=16):
+    """
+    Construit un cycle hamiltonien en visitant les villes dans l'ordre d'une courbe de Hilbert.
+    Principe :
+        1. Associer à chaque ville sa position d sur la courbe de Hilbert
+        2. Trier les villes selon d : deux villes proches sur la courbe sont proches dans le plan
+
+    Complexité : O(n log n) en temps, O(n) en mémoire. La matrice D n'est jamais lue,
+    on peut donc l'utiliser avec un GrapheMD construit sans matrice (avec_matrice=False)
+    pour des instances de 100k à 1M villes.
+
+    Args:
+        G (GrapheMD): Le graphe (seuls G.points sont utilisés)
+        ordre (int): La finesse de la grille de la courbe
+
+    Returns:
+        list: Une liste représentant le cycle hamiltonien trouvé (point de départ de opt_ppp)
+    """
+    if G.n == 0:
+        return []
+
+    G.exiger_euclidien("Hilbert")
+    d = calculer_indices_hilbert(G.points, ordre)
+    return np.argsort(d, kind='stable').tolist()
@@ -1,3 +1,4 @@
+import numpy as np
 from structures.graphe_md import GrapheMD 
 
 
@@ -15,6 +16,9 @@ def algo_ppp(G):
         - Inserer Qi dans C juste a cote de Qj , soit a gauche ou a droite de Qj 
           en choisissant la position qui minimise l'augmentation de la longueur totale du cycle C
 
+    Matrice asymétrique : le cycle est parcouru dans l'ordre de la liste, les coûts d'insertion
+    sont calculés dans ce sens ; la proximité au cycle utilise min(D[i][j], D[j][i]).
+
     Args:
         G (GrapheMD): Le graphe des distances entre les points
     
@@ -30,35 +34,38 @@ def algo_ppp(G):
     if n == 1:
         return [0]
     
+    # Sélection : distance dans les deux sens si la matrice est asymétrique
+    D_selection = D if G.symetrique else np.minimum(D, D.T)
+
     # --- 1. Initialisation du cycle avec le point 0 et son plus proche voisin
+    # dist_cycle[u] : distance de u a la ville du cycle la plus proche (inf si u est deja dans le cycle)
+    # proche[u]     : cette ville du cycle la plus proche de u
+    # Ces deux tableaux sont mis a jour a chaque insertion : la selection devient O(n)
+    # au lieu de O(n * |cycle|), soit O(n^2) au total au lieu de O(n^3)
     cycle = [0]
-    non_visites = set(range(1, n))
+    dist_cycle = np.array(D_selection[0], dtype=np.float64)
+    proche = np.zeros(n, dtype=np.intp)
+    dans_cycle = np.zeros(n, dtype=bool)
+    dans_cycle[0] = True
+    dist_cycle[0] = np.inf
 
     # Trouver le plus proche voisin du point 0
-    plus_proche_voisin = min(non_visites, key=lambda x: D[0][x])
+    plus_proche_voisin = int(np.argmin(dist_cycle))
     cycle.append(plus_proche_voisin)
-    non_visites.remove(plus_proche_voisin)
+    _ajouter_au_cycle(plus_proche_voisin, D_selection, dist_cycle, proche, dans_cycle)
 
     # --- 2. Boucle principale de l'algorithme PPP
     # Inserer les points restants dans le cycle
-    while non_visites:
+    while len(cycle) < n:
         # 1. Etape 1 : La selection 
         # Trouver la ville Qi la plus proche du cycle courant 
         # On cherche le coouple (Qi , Qj) tel que :
-        #     - Qi appartient a non_visites
+        #     - Qi n'appartient pas au cycle
         #     - Qj appartient a cycle
         #     - La distance D(Qi , Qj) est minimale
-        min_distance = float('inf')
-        Qi = -1 
-        Qj = -1
-        for u in non_visites: 
-            for idx , v in enumerate(cycle):
-                dist = D[u][v]
-                if dist < min_distance : 
-                    min_distance = dist
-                    Qi = u 
-                    Qj = v 
-                    Qj_index = idx
+        Qi = int(np.argmin(dist_cycle))
+        Qj = int(proche[Qi])
+        Qj_index = cycle.index(Qj)
 
         # 2. Etape 2 : L'insertion
         # Inserer Qi dans le cycle C juste a cote de Qj
@@ -86,6 +93,79 @@ def algo_ppp(G):
             # Insérer Qi à droite de Qj
             cycle.insert(Qj_droite_index, Qi)
 
-        non_visites.remove(Qi)
+        _ajouter_au_cycle(Qi, D_selection, dist_cycle, proche, dans_cycle)
+
+    return cycle
+
+
+def _ajouter_au_cycle(ville, D, dist_cycle, proche, dans_cycle):
+    """ Met a jour les distances au cycle apres l'ajout de ville (vectorise, O(n)). """
+    dans_cycle[ville] = True
+    dist_cycle[ville] = np.inf
+    ligne = D[ville]
+    plus_proches = (ligne < dist_cycle) & ~dans_cycle
+    dist_cycle[plus_proches] = ligne[plus_proches]
+    proche[plus_proches] = ville  
+
+def algo_ppp_lot(D):
+    """
+    PPP sur B instances de même taille à la fois : chaque étape de PPP (sélection de Qi,
+    position de Qj, choix gauche/droite, insertion, mise à jour des distances au cycle)
+    est une opération NumPy sur les B instances. Les cycles obtenus sont exactement
+    ceux de algo_ppp sur chaque instance.
+
+    Args:
+        D (numpy.ndarray): La pile (B, n, n) des matrices de distances
+            (utils.calculer_matrices_lot pour des coordonnées (B, n, 2))
+
+    Returns:
+        numpy.ndarray: Le tableau (B, n) des cycles
+    """
+    D = np.asarray(D)
+    B, n = D.shape[0], D.shape[1]
+    if n <= 1:
+        return np.zeros((B, n), dtype=np.intp)
+    lignes = np.arange(B)
+    D_selection = D if np.array_equal(D, D.swapaxes(1, 2)) else np.minimum(D, D.swapaxes(1, 2))
+
+    def ajouter(ville):
+        dans_cycle[lignes, ville] = True
+        dist_cycle[lignes, ville] = np.inf
+        ligne = D_selection[lignes, ville]
+        plus_proches = (ligne < dist_cycle) & ~dans_cycle
+        dist_cycle[plus_proches] = ligne[plus_proches]
+        proche[plus_proches] = np.broadcast_to(ville[:, None], (B, n))[plus_proches]
+
+    # --- 1. Initialisation : le point 0 et son plus proche voisin
+    cycles = np.zeros((B, n), dtype=np.intp)
+    dist_cycle = np.array(D_selection[:, 0], dtype=np.float64)
+    proche = np.zeros((B, n), dtype=np.intp)
+    dans_cycle = np.zeros((B, n), dtype=bool)
+    dans_cycle[:, 0] = True
+    dist_cycle[:, 0] = np.inf
+    cycles[:, 1] = np.argmin(dist_cycle, axis=1)
+    ajouter(cycles[:, 1])
+
+    # --- 2. Insertions : le cycle de chaque instance a la même longueur L à chaque étape
+    for L in range(2, n):
+        Qi = np.argmin(dist_cycle, axis=1)
+        Qj = proche[lignes, Qi]
+        Qj_index = np.argmax(cycles[:, :L] == Qj[:, None], axis=1)
+        Qj_droite_index = (Qj_index + 1) % L
+        Qj_gauche = cycles[lignes, (Qj_index - 1) % L]
+        Qj_droite = cycles[lignes, Qj_droite_index]
+
+        cout_gauche = D[lignes, Qj_gauche, Qi] + D[lignes, Qi, Qj] - D[lignes, Qj_gauche, Qj]
+        cout_droite = D[lignes, Qj, Qi] + D[lignes, Qi, Qj_droite] - D[lignes, Qj, Qj_droite]
+        position = np.where(cout_gauche < cout_droite, Qj_index, Qj_droite_index)
+
+        # Insertion de Qi en position : les villes suivantes sont décalées d'une case
+        colonnes = np.arange(L + 1)
+        source = np.where(colonnes < position[:, None], colonnes, colonnes - 1).clip(0, L - 1)
+        nouveaux = np.take_along_axis(cycles[:, :L], source, axis=1)
+        nouveaux[lignes, position] = Qi
+        cycles[:, :L + 1] = nouveaux
+
+        ajouter(Qi)
 
-    return cycle  
\ No newline at end of file
+    return cycles
@@ -0,0 +1,236 @@
+import os
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from structures.stats_recherche import StatsRecherche
+from algos.algo_hilbert import calculer_indices_hilbert
+from algos.opt_ppp import deux_opt_fenetre
+
+# --- Résolution par décomposition (très grandes instances) ---
+# Un seul opt_ppp sur n villes coûte O(n^2) par passe (et la matrice D, O(n^2) en mémoire).
+# On découpe l'instance en zones d'environ taille_cluster villes, résolues indépendamment
+# (et en parallèle) avec une méthode du solveur, puis les cycles des zones sont reliés :
+#   1. Partition des villes (grille ou k-means), zones trop grosses redécoupées
+#   2. Résolution de chaque zone dans un pool de processus (matrice D locale seulement)
+#   3. Ordre de visite des zones selon la courbe de Hilbert de leurs centres
+#   4. Ouverture de chaque cycle en chemin, au meilleur endroit pour rejoindre les zones voisines
+#   5. 2-opt local autour de chaque jonction entre deux zones
+# Seules les coordonnées sont lues : l'instance peut être un GrapheMD sans matrice.
+
+
+def _distances(P, a, b):
+    """ Distances euclidiennes entre les villes a[i] et b[i] (vectorisé). """
+    return np.sqrt(((P[a] - P[b]) ** 2).sum(axis=-1))
+
+
+def _partition_grille(P, indices, taille_cluster):
+    """
+    Découpe les villes `indices` selon une grille régulière d'environ
+    len(indices) / taille_cluster cases ; les cases vides sont ignorées.
+    """
+    nb_cases = max(1, int(np.ceil(len(indices) / taille_cluster)))
+    cote = max(1, int(np.ceil(np.sqrt(nb_cases))))
+    Q = P[indices]
+    mini = Q.min(axis=0)
+    etendue = np.maximum(Q.max(axis=0) - mini, 1e-12)
+    cases = np.minimum((Q - mini) / etendue * cote, cote - 1).astype(np.int64)
+    numero = cases[:, 0] * cote + cases[:, 1]
+    ordre = np.argsort(numero, kind='stable')
+    _, debuts = np.unique(numero[ordre], return_index=True)
+    return [indices[bloc] for bloc in np.split(ordre, debuts[1:])]
+
+
+def _partition_kmeans(P, indices, taille_cluster, graine=None, nb_iterations=10):
+    """
+    Découpe les villes `indices` en k = len(indices) / taille_cluster zones par k-means
+    (algorithme de Lloyd). Les distances villes-centres sont calculées par blocs pour
+    borner la mémoire temporaire.
+    """
+    k = max(1, int(np.ceil(len(indices) / taille_cluster)))
+    Q = P[indices]
+    rng = np.random.default_rng(graine)
+    centres = Q[rng.choice(len(Q), size=k, replace=False)]
+    taille_bloc = max(1, 2**22 // k)
+    etiquettes = np.zeros(len(Q), dtype=np.int64)
+    for _ in range(nb_iterations):
+        for debut in range(0, len(Q), taille_bloc):
+            bloc = Q[debut:debut + taille_bloc]
+            d2 = ((bloc[:, None, :] - centres[None, :, :]) ** 2).sum(axis=2)
+            etiquettes[debut:debut + taille_bloc] = d2.argmin(axis=1)
+        effectifs = np.bincount(etiquettes, minlength=k)
+        sommes = np.stack([np.bincount(etiquettes, weights=Q[:, 0], minlength=k),
+                           np.bincount(etiquettes, weights=Q[:, 1], minlength=k)], axis=1)
+        # Un centre sans ville garde sa position
+        non_vides = effectifs > 0
+        centres[non_vides] = sommes[non_vides] / effectifs[non_vides, None]
+    ordre = np.argsort(etiquettes, kind='stable')
+    _, debuts = np.unique(etiquettes[ordre], return_index=True)
+    return [indices[bloc] for bloc in np.split(ordre, debuts[1:])]
+
+
+def partitionner(points, taille_cluster=1000, partition="grille", graine=None):
+    """
+    Partitionne les villes en zones spatiales d'au plus 2 * taille_cluster villes
+    (une zone plus grosse est redécoupée par une grille).
+
+    Args:
+        points (list | numpy.ndarray): Les coordonnées (x, y) des villes
+        taille_cluster (int): Le nombre de villes visé par zone
+        partition (str): "grille" (rapide, adaptée aux villes uniformes) ou
+            "kmeans" (zones plus équilibrées sur des villes regroupées)
+        graine: La graine de l'initialisation de k-means
+
+    Returns:
+        list: Les zones (tableaux d'indices de villes)
+    """
+    P = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    tous = np.arange(len(P))
+    if partition == "grille":
+        zones = _partition_grille(P, tous, taille_cluster)
+    elif partition == "kmeans":
+        zones = _partition_kmeans(P, tous, taille_cluster, graine)
+    else:
+        raise ValueError(f"Partition inconnue : {partition} (grille ou kmeans)")
+
+    resultat = []
+    while zones:
+        zone = zones.pop()
+        if len(zone) <= 2 * taille_cluster:
+            resultat.append(zone)
+            continue
+        sous_zones = _partition_grille(P, zone, taille_cluster)
+        if len(sous_zones) == 1:
+            # Villes confondues : aucun découpage spatial possible
+            sous_zones = np.array_split(zone, int(np.ceil(len(zone) / taille_cluster)))
+        zones.extend(sous_zones)
+    return resultat
+
+
+def _resoudre_zone(points_zone, methode, limite_temps, graine):
+    """ Résout une zone (exécuté dans un processus du pool) ; retourne son cycle en indices locaux. """
+    from solveur import resoudre
+    if len(points_zone) <= 3:
+        return list(range(len(points_zone)))
+    return resoudre(points_zone, methode, limite_temps=limite_temps, graine=graine).cycle
+
+
+def _ouvrir_cycle(P, cycle, precedent, suivant):
+    """
+    Ouvre le cycle d'une zone en un chemin. On coupe l'arête (u, v) du cycle, et on choisit
+    le sens de parcours, qui minimisent : d(precedent, entrée) - d(u, v) + d(sortie, suivant),
+    où precedent est la dernière ville du chemin précédent et suivant le centre de la zone suivante.
+    """
+    C = np.asarray(cycle)
+    if len(C) == 1:
+        return C
+    arete = _distances(P, C, np.roll(C, -1))
+    entree_c = np.sqrt(((P[C] - precedent) ** 2).sum(axis=1))
+    sortie_c = np.sqrt(((P[C] - suivant) ** 2).sum(axis=1))
+    entree_s, sortie_s = np.roll(entree_c, -1), np.roll(sortie_c, -1)
+    # Sens direct : entrée C[i+1], ..., sortie C[i] ; sens inverse : entrée C[i], ..., sortie C[i+1]
+    direct = entree_s - arete + sortie_c
+    inverse = entree_c - arete + sortie_s
+    i_d, i_i = int(direct.argmin()), int(inverse.argmin())
+    if direct[i_d] <= inverse[i_i]:
+        return np.roll(C, -(i_d + 1))
+    return np.roll(C, -(i_i + 1))[::-1]
+
+
+def _reparer_jonction(P, cycle, position, largeur):
+    """ 2-opt restreint aux positions [position - largeur, position + largeur] du cycle. """
+    n = len(cycle)
+    indices = (position + np.arange(-largeur, largeur + 1)) % n
+    sommets = cycle[indices]
+    Q = P[sommets]
+    D = np.sqrt(((Q[:, None, :] - Q[None, :, :]) ** 2).sum(axis=2)).tolist()
+    chemin = list(range(len(sommets)))
+    gain = deux_opt_fenetre(chemin, D, 0, len(chemin) - 1)
+    if gain > 0.0:
+        cycle[indices] = sommets[chemin]
+    return gain
+
+
+def decomposition(G, methode="OptPPP", taille_cluster=1000, nb_workers=None, partition="grille",
+                  largeur_jonction=50, limite_temps=None, graine=None, avec_stats=False):
+    """
+    Construit un cycle hamiltonien en résolvant séparément des zones de l'instance.
+
+    Args:
+        G (GrapheMD): Le graphe (seuls G.points sont utilisés, D peut valoir None)
+        methode (str): La méthode du solveur appliquée à chaque zone (ex: "OptPPP", "OptPrim+2opt")
+        taille_cluster (int): Le nombre de villes visé par zone
+        nb_workers (int): Le nombre de processus (défaut : nombre de coeurs ; 1 = sans pool)
+        partition (str): "grille" ou "kmeans"
+        largeur_jonction (int): Le nombre de positions réparées de chaque côté d'une jonction
+        limite_temps (float): Durée maximale (secondes), répartie entre les zones
+        graine: La graine (k-means et méthodes aléatoires des zones)
+        avec_stats (bool): Retourner aussi les statistiques
+
+    Returns:
+        list: Une liste représentant le cycle hamiltonien trouvé
+        Si avec_stats : tuple (cycle, stats) avec stats (StatsRecherche) contenant
+            zones, taille_max_zone, gain_jonctions et les temps (ms) de chaque phase
+    """
+    if G.n == 0:
+        return ([], StatsRecherche("Decomposition")) if avec_stats else []
+
+    G.exiger_euclidien("Decomposition")
+    debut = time.perf_counter()
+    P = np.asarray(G.points, dtype=np.float64).reshape(-1, 2)
+    n = len(P)
+    nb_workers = nb_workers or os.cpu_count() or 1
+    graine_partition = graine_zones = None
+    if graine is not None:
+        sequence = graine if isinstance(graine, np.random.SeedSequence) else np.random.SeedSequence(graine)
+        graine_partition, graine_zones = sequence.spawn(2)
+
+    # 1. Partition, et ordre des zones le long de la courbe de Hilbert de leurs centres
+    zones = partitionner(P, taille_cluster, partition, graine_partition)
+    centres = np.array([P[z].mean(axis=0) for z in zones])
+    ordre = np.argsort(calculer_indices_hilbert(centres), kind='stable') if len(zones) > 1 else [0]
+    zones = [zones[i] for i in ordre]
+    centres = centres[ordre]
+    t_partition = time.perf_counter()
+
+    # 2. Résolution des zones (un processus traite environ len(zones) / nb_workers zones)
+    limite_zone = None
+    if limite_temps is not None:
+        restant = max(0.0, limite_temps - (t_partition - debut))
+        limite_zone = restant * min(nb_workers, len(zones)) / len(zones)
+    graines = [None] * len(zones) if graine_zones is None else graine_zones.spawn(len(zones))
+    arguments = ([P[z] for z in zones], [methode] * len(zones), [limite_zone] * len(zones), graines)
+    if nb_workers > 1 and len(zones) > 1:
+        with ProcessPoolExecutor(max_workers=min(nb_workers, len(zones))) as pool:
+            cycles_locaux = list(pool.map(_resoudre_zone, *arguments))
+    else:
+        cycles_locaux = list(map(_resoudre_zone, *arguments))
+    t_zones = time.perf_counter()
+
+    # 3. Raccordement : chaque cycle est ouvert en chemin, dans l'ordre des zones
+    morceaux, jonctions = [], []
+    precedent = centres[-1]
+    for z, (zone, local) in enumerate(zip(zones, cycles_locaux)):
+        suivant = centres[(z + 1) % len(zones)]
+        chemin = _ouvrir_cycle(P, zone[np.asarray(local, dtype=np.intp)], precedent, suivant)
+        jonctions.append(sum(len(m) for m in morceaux))
+        morceaux.append(chemin)
+        precedent = P[chemin[-1]]
+    cycle = np.concatenate(morceaux).astype(np.intp) if morceaux else np.zeros(0, dtype=np.intp)
+
+    # 4. 2-opt local autour de chaque jonction (dont la fermeture du cycle, en position 0)
+    gain_jonctions = 0.0
+    largeur = min(largeur_jonction, (n - 1) // 2)
+    if len(zones) > 1 and largeur >= 2:
+        for position in jonctions:
+            gain_jonctions += _reparer_jonction(P, cycle, position, largeur)
+    fin = time.perf_counter()
+
+    cycle = cycle.tolist()
+    if avec_stats:
+        stats = StatsRecherche("Decomposition")
+        stats.compteurs.update(zones=len(zones), taille_max_zone=max((len(z) for z in zones), default=0),
+                               gain_jonctions=gain_jonctions,
+                               partition_ms=(t_partition - debut) * 1e3, zones_ms=(t_zones - t_partition) * 1e3,
+                               raccordement_ms=(fin - t_zones) * 1e3)
+        return cycle, stats
+    return cycle
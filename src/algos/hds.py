@@ -1,12 +1,13 @@
-from structures import NoeudExploration
-import numpy as np
+from structures import NoeudExploration, TasIndexe, StatsRecherche
 import heapq
+import time
+import numpy as np
 
 # --- ALGO 4 :  Heuristique de la Demi-Somme  --- 
 # Implémente l'algorithme HDS pour le problème du TSP en utilisant Branch and Bound.
 
 # Fonction de calcule de la borne inférieure h(x)
-def calculer_borne_hds(graphe_md, chemin , cout_actuel , visited_mask):
+def calculer_borne_hds(graphe_md, chemin , cout_actuel , visited_mask, D=None):
     """
     Calcule la borne inférieure h(x) pour un chemin partiel donné 
     Principe :
@@ -18,12 +19,15 @@ def calculer_borne_hds(graphe_md, chemin , cout_actuel , visited_mask):
         chemin (list): Le chemin partiel actuel
         cout_actuel (float): Le coût actuel du chemin partiel
         visited_mask (int): Un masque binaire représentant les villes visitées
+        D (numpy.ndarray): La matrice des arêtes les moins chères (défaut : graphe_md.D) ;
+            min(D, D.T) pour une matrice asymétrique
 
     Returns:
         float: La borne inférieure h(x) pour le chemin partiel
     """
     n = graphe_md.n  
-    D = graphe_md.D 
+    if D is None:
+        D = graphe_md.D 
 
     start_noued = chemin[0]
     end_noued = chemin[-1]
@@ -87,39 +91,94 @@ def calculer_borne_hds(graphe_md, chemin , cout_actuel , visited_mask):
 
 
 
-def hds(graphe_md):
+def hds(graphe_md, frontiere_indexee=False, avec_stats=False, limite_temps=None, cycle_initial=None):
     """
 
     Algorithme HDS (Heuristique de la Demi-Somme) pour résoudre le problème du TSP
     
     Args:
         graphe_md (GrapheMD): Le graphe du TSP avec les distances
+        frontiere_indexee (bool): Utiliser un TasIndexe (noeuds numérotés) comme frontière
+            au lieu de heapq ; le coût optimal trouvé est le même
+        avec_stats (bool): Retourner aussi les statistiques de la recherche
+        limite_temps (float): Durée maximale de la recherche (secondes) ; une fois dépassée,
+            on retourne la meilleure solution trouvée (qui n'est alors plus garantie optimale)
+        cycle_initial (list): Une solution connue (ex: PPP), utilisée comme première borne
+            supérieure : elle élague l'arbre dès le départ et garantit un résultat si la
+            recherche est interrompue
+
+    Matrice asymétrique : les coûts des chemins sont orientés (D[i][j] de i vers j), la borne
+    utilise min(D[i][j], D[j][i]) pour chaque arête restante, ce qui reste un minorant.
     
     Returns:
-        tuple: (meilleur_chemin, cout_minimal)
-            meilleur_chemin (list): Le chemin optimal trouvé
+        list: meilleur_chemin, le chemin optimal trouvé
+        Si avec_stats : tuple (meilleur_chemin, stats) avec stats (StatsRecherche) contenant
+            noeuds_developpes, noeuds_empiles, elagues_borne, elagues_cout,
+            evaluations_borne, taille_max_tas et la chronologie des améliorations
     """ 
 
     n = graphe_md.n
     D = graphe_md.D 
+    D_borne = D if graphe_md.symetrique else np.minimum(D, D.T)
+
+    echeance = None if limite_temps is None else time.perf_counter() + limite_temps
+
+    # Instrumentation : compteurs locaux, recopiés dans stats à la fin
+    stats = StatsRecherche("HDS") if avec_stats else None
+    nb_developpes = nb_empiles = nb_elagues_borne = nb_elagues_cout = 0
+    nb_evaluations_borne = 1  # Borne de la racine
+    taille_max_tas = 1
 
     # 1. Initialisations
     start_noued = 0
     mask_initial = 1 << start_noued  # Masque binaire pour le noeud de départ
     cout_initial = 0 
     chemin_initial = [start_noued]
-    borne_initiale = calculer_borne_hds(graphe_md, chemin_initial, cout_initial, mask_initial)
+    borne_initiale = calculer_borne_hds(graphe_md, chemin_initial, cout_initial, mask_initial, D_borne)
     racine = NoeudExploration(current_city=start_noued,
                               visited_mask=mask_initial,
                               cost=cout_initial,
                               bound=borne_initiale,
                               path=chemin_initial)
     
-    tas_priorite = []
-    heapq.heappush(tas_priorite, racine)
+    # Frontière du Branch & Bound
+    # - heapq : les noeuds sont comparés directement (NoeudExploration.__lt__)
+    # - TasIndexe : chaque noeud reçoit un numéro, le tas est indexé par ce numéro
+    if frontiere_indexee:
+        tas_priorite = TasIndexe()
+        noeuds = []
+
+        def empiler(noeud):
+            noeuds.append(noeud)
+            tas_priorite.inserer(len(noeuds) - 1, noeud.bound)
+
+        def depiler():
+            _, indice = tas_priorite.extraire_min()
+            noeud = noeuds[indice]
+            noeuds[indice] = None  # Libérer la mémoire du noeud exploré
+            return noeud
+    else:
+        tas_priorite = []
+
+        def empiler(noeud):
+            heapq.heappush(tas_priorite, noeud)
+
+        def depiler():
+            return heapq.heappop(tas_priorite)
+
+    empiler(racine)
 
     cout_minimal = float('inf')
     meilleur_chemin = []
+    interrompu = False
+
+    # Solution initiale : ramenée à un chemin partant de start_noued
+    if cycle_initial is not None and len(cycle_initial) == n:
+        debut = list(cycle_initial).index(start_noued)
+        meilleur_chemin = list(cycle_initial[debut:]) + list(cycle_initial[:debut])
+        cout_minimal = sum(D[meilleur_chemin[i - 1]][meilleur_chemin[i]] for i in range(n))
+        if stats is not None:
+            stats.noter_solution(cout_minimal)
 
     # Variables de securité pour éviter les boucles infinies
     MAX_ITR = 1000000
@@ -132,15 +191,21 @@ def hds(graphe_md):
         if nb_itr > MAX_ITR :
             print("Alerte : Nombre maximum d'itérations atteint. Arrêt de l'algorithme HDS.")
             break
+
+        # Limite de temps (vérifiée toutes les 256 itérations pour rester peu coûteuse)
+        if echeance is not None and nb_itr & 255 == 0 and time.perf_counter() > echeance:
+            interrompu = True
+            break
             
         # Selectionner le noeud avec la plus petite borne
-        noeud = heapq.heappop(tas_priorite)
+        noeud = depiler()
 
         # Vérifier si le noeud courant peut mener à une meilleure solution
         # Si la borne est déjà supérieure au coût minimal trouvé, on ignore ce noeud
         # car il ne peut pas conduire à une solution optimale
 
         if noeud.bound >= cout_minimal:
+            nb_elagues_borne += 1
             continue
 
         # Vérifier si le chemin est complet
@@ -154,11 +219,14 @@ def hds(graphe_md):
             if cout_total < cout_minimal:
                 cout_minimal = cout_total
                 meilleur_chemin = noeud.path
+                if stats is not None:
+                    stats.noter_solution(cout_minimal)
             continue
         
         # Si le chemin n'est pas complet , on génère les noeuds enfants
         # Brancheemnt ( Separation / Branching )
         # Explorer les villes non visitées
+        nb_developpes += 1
         for ville in range(n) : 
             # Vérifier si la ville a déjà été visitée
             if (noeud.visited_mask >> ville) & 1:
@@ -167,10 +235,12 @@ def hds(graphe_md):
             # Calcul des nouvelles valeurs pour le noeud enfant
             new_cost = noeud.cost + D[noeud.current_city][ville]
             if new_cost >= cout_minimal:
+                nb_elagues_cout += 1
                 continue
             new_path = noeud.path + [ville]
             new_visited_mask = noeud.visited_mask | (1 << ville)
-            new_bound = calculer_borne_hds(graphe_md, new_path, new_cost, new_visited_mask)
+            new_bound = calculer_borne_hds(graphe_md, new_path, new_cost, new_visited_mask, D_borne)
+            nb_evaluations_borne += 1
 
             # Si la nouvelle borne est prometteuse , on ajoute le noeud enfant au tas
             if new_bound < cout_minimal:
@@ -179,6 +249,17 @@ def hds(graphe_md):
                                           cost=new_cost,
                                           bound=new_bound,
                                           path=new_path)
-                heapq.heappush(tas_priorite, enfant)
-
-    return meilleur_chemin
\ No newline at end of file
+                empiler(enfant)
+                nb_empiles += 1
+                if len(tas_priorite) > taille_max_tas:
+                    taille_max_tas = len(tas_priorite)
+            else:
+                nb_elagues_borne += 1
+
+    if stats is not None:
+        stats.compteurs.update(noeuds_developpes=nb_developpes, noeuds_empiles=nb_empiles,
+                               elagues_borne=nb_elagues_borne, elagues_cout=nb_elagues_cout,
+                               evaluations_borne=nb_evaluations_borne, taille_max_tas=taille_max_tas,
+                               interrompu=int(interrompu))
+        return meilleur_chemin, stats
+    return meilleur_chemin
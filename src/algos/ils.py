@@ -0,0 +1,351 @@
+import os
+import time
+import contextlib
+from collections import deque
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from structures.graphe_partage import PoigneeGraphe
+from structures.stats_recherche import StatsRecherche
+import utils
+
+# --- Recherche locale itérée (ILS) ---
+# opt_ppp s'arrête au premier optimum local. L'ILS repart de cet optimum :
+#   1. Perturbation "double pont" : deux segments consécutifs du cycle sont échangés
+#      (A B C D -> A C B D), un mouvement que le 2-opt ne sait pas défaire
+#   2. Recherche locale 2-opt limitée aux villes touchées (listes de voisins + bits "don't look")
+#   3. Le nouveau cycle est gardé s'il n'est pas plus long, sinon on revient au précédent
+# Plusieurs départs indépendants (PPP, OptPrim, aléatoires) sont exécutés en parallèle,
+# chacun jusqu'à l'échéance ; on garde le meilleur cycle.
+
+DEPARTS = ("PPP", "OptPrim", "Aleatoire", "Aleatoire")
+LIMITE_TEMPS_DEFAUT = 1.0
+EPSILON = 1e-10
+
+
+def _inverser(tour, pos, i, j):
+    """
+    Inverse le segment tour[i..j] (positions cycliques, i vers j). Le segment complémentaire
+    est inversé à la place s'il est plus court : le cycle obtenu est le même.
+    """
+    n = len(tour)
+    longueur = (j - i) % n + 1
+    if 2 * longueur > n:
+        i, j = (j + 1) % n, (i - 1) % n
+        longueur = n - longueur
+    for _ in range(longueur // 2):
+        a, b = tour[i], tour[j]
+        tour[i], tour[j] = b, a
+        pos[b], pos[a] = i, j
+        i = (i + 1) % n
+        j = (j - 1) % n
+
+
+def _deux_opt_voisins(tour, pos, D, voisins, file, en_file, echeance=None):
+    """
+    2-opt par listes de voisins : pour chaque ville a de la file, on essaie de remplacer
+    une arête (a, b) du cycle par (a, c) avec c parmi les plus proches voisins de a
+    (seulement si d(a, c) < d(a, b)). Une ville sort de la file (bit "don't look")
+    quand aucun mouvement ne l'améliore ; les extrémités d'un mouvement y reviennent.
+    Avec echeance (instant time.perf_counter), l'échéance est vérifiée toutes les 16 villes
+    retirées de la file : une fois dépassée, on s'arrête sur le cycle courant (chaque
+    mouvement appliqué est complet, le cycle et le gain restent cohérents).
+
+    Returns:
+        tuple: (gain, nb_mouvements)
+    """
+    n = len(tour)
+    gain_total = 0.0
+    nb_mouvements = 0
+    nb_retraits = 0
+    while file:
+        nb_retraits += 1
+        if echeance is not None and nb_retraits & 15 == 0 and time.perf_counter() > echeance:
+            break
+        a = file.popleft()
+        en_file[a] = 0
+        ameliore = True
+        while ameliore:
+            ameliore = False
+            for suivant in (True, False):
+                i = pos[a]
+                b = tour[(i + 1) % n] if suivant else tour[i - 1]
+                d_ab = D[a][b]
+                for c in voisins[a]:
+                    d_ac = D[a][c]
+                    if d_ac >= d_ab:
+                        break
+                    j = pos[c]
+                    d = tour[(j + 1) % n] if suivant else tour[j - 1]
+                    if d == a:
+                        continue
+                    gain = d_ab + D[c][d] - d_ac - D[b][d]
+                    if gain > EPSILON:
+                        # (a, b), (c, d) -> (a, c), (b, d)
+                        if suivant:
+                            _inverser(tour, pos, (i + 1) % n, j)
+                        else:
+                            _inverser(tour, pos, i, (j - 1) % n)
+                        gain_total += gain
+                        nb_mouvements += 1
+                        for v in (b, c, d):
+                            if not en_file[v]:
+                                en_file[v] = 1
+                                file.append(v)
+                        ameliore = True
+                        break
+                if ameliore:
+                    break
+    return gain_total, nb_mouvements
+
+
+def _double_pont(tour, pos, D, rng, longueur_max):
+    """
+    Perturbation locale : à partir d'une position p, les segments B = [p, p+c1[ et
+    C = [p+c1, p+c2[ (c2 <= longueur_max) sont échangés.
+
+    Returns:
+        tuple: (variation de longueur, villes aux extrémités des arêtes modifiées)
+    """
+    n = len(tour)
+    p = int(rng.integers(n))
+    c1 = int(rng.integers(1, longueur_max))
+    c2 = int(rng.integers(c1 + 1, longueur_max + 1))
+    a, b1 = tour[p - 1], tour[p]
+    b2, c_1 = tour[(p + c1 - 1) % n], tour[(p + c1) % n]
+    c_2, d = tour[(p + c2 - 1) % n], tour[(p + c2) % n]
+    delta = (D[a][c_1] + D[c_2][b1] + D[b2][d]) - (D[a][b1] + D[b2][c_1] + D[c_2][d])
+
+    positions = [(p + k) % n for k in range(c2)]
+    segment = [tour[q] for q in positions]
+    segment = segment[c1:] + segment[:c1]
+    for q, v in zip(positions, segment):
+        tour[q] = v
+        pos[v] = q
+    return delta, (a, b1, b2, c_1, c_2, d)
+
+
+def _cycle_depart(depart, G, rng):
+    """ Construit le cycle de départ : "PPP", "OptPrim" ou "Aleatoire". """
+    if depart == "PPP":
+        from algos.algo_ppp import algo_ppp
+        return list(algo_ppp(G))
+    if depart == "OptPrim":
+        from algos.opt_prim import opt_prim
+        return list(opt_prim(G))
+    if depart == "Aleatoire":
+        return rng.permutation(G.n).tolist()
+    raise ValueError(f"Départ inconnu : {depart} (PPP, OptPrim ou Aleatoire)")
+
+
+class _LignesListes(dict):
+    """
+    Lignes de D converties en listes Python à la première lecture (D[a][b] bien plus rapide que
+    sur numpy) : la conversion est répartie sur la recherche, donc comptée dans son échéance,
+    et les lignes jamais lues ne sont pas converties.
+    """
+
+    def __init__(self, D):
+        super().__init__()
+        self.D = D
+
+    def __missing__(self, a):
+        ligne = self[a] = self.D[a].tolist()
+        return ligne
+
+
+def _longueur(G, cycle):
+    tour = np.asarray(cycle, dtype=np.intp)
+    return float(G.D[tour, np.roll(tour, -1)].sum())
+
+
+def _compteurs_vides(nb_mouvements=0):
+    return {"iterations": 0, "perturbations_acceptees": 0, "mouvements_2opt": nb_mouvements}
+
+
+def recherche_locale_iteree(G, cycle, echeance, voisins, rng, longueur_max=50):
+    """
+    ILS à partir d'un cycle, jusqu'à l'échéance. Si l'échéance interrompt le premier 2-opt,
+    le cycle retourné est celui atteint (complet, jamais plus long que le départ).
+
+    Args:
+        G (GrapheMD): Le graphe (avec sa matrice D)
+        cycle (list): Le cycle de départ
+        echeance (float): L'instant (time.perf_counter) auquel s'arrêter
+        voisins (numpy.ndarray): Les listes de voisins candidats (n, k)
+        rng (numpy.random.Generator): Le générateur des perturbations
+        longueur_max (int): La longueur maximale des segments échangés par le double pont
+
+    Returns:
+        tuple: (meilleur_cycle, longueur, chronologie, compteurs) ; la chronologie contient
+            les améliorations en tuples (instant time.perf_counter, longueur)
+    """
+    n = G.n
+    # Accès D[a][b] bien plus rapides sur des listes Python, tant que la matrice reste raisonnable ;
+    # les lignes sont converties à la demande (G.D.tolist() coûte ~0,3 s à n = 2000, hors échéance)
+    D = _LignesListes(G.D) if n <= 2000 else G.D
+    voisins = voisins.tolist()
+    tour = list(cycle)
+    pos = [0] * n
+    for q, v in enumerate(tour):
+        pos[v] = q
+    longueur = _longueur(G, tour)
+
+    # 1. Premier optimum local : toutes les villes sont dans la file (interrompu à l'échéance)
+    en_file = bytearray(b"\x01" * n)
+    gain, nb_mouvements = _deux_opt_voisins(tour, pos, D, voisins, deque(tour), en_file, echeance)
+    longueur -= gain
+    chronologie = [(time.perf_counter(), longueur)]
+    compteurs = _compteurs_vides(nb_mouvements)
+
+    # 2. Perturbations + recherche locale, jusqu'à l'échéance
+    longueur_max = min(longueur_max, n - 2)
+    if longueur_max < 2:
+        return tour, longueur, chronologie, compteurs
+    meilleur, meilleure_longueur = tour[:], longueur
+    while time.perf_counter() < echeance:
+        compteurs["iterations"] += 1
+        sauvegarde_tour, sauvegarde_pos = tour[:], pos[:]
+        delta, touchees = _double_pont(tour, pos, D, rng, longueur_max)
+        file = deque()
+        for v in touchees:
+            if not en_file[v]:
+                en_file[v] = 1
+                file.append(v)
+        gain, nb_mouvements = _deux_opt_voisins(tour, pos, D, voisins, file, en_file, echeance)
+        compteurs["mouvements_2opt"] += nb_mouvements
+        nouvelle_longueur = longueur + delta - gain
+        if nouvelle_longueur <= longueur + EPSILON:
+            longueur = nouvelle_longueur
+            compteurs["perturbations_acceptees"] += 1
+            if longueur < meilleure_longueur - EPSILON:
+                meilleur, meilleure_longueur = tour[:], longueur
+                chronologie.append((time.perf_counter(), longueur))
+        else:
+            tour, pos = sauvegarde_tour, sauvegarde_pos
+    return meilleur, meilleure_longueur, chronologie, compteurs
+
+
+def ameliorer_ils(cycle, G, limite_temps=LIMITE_TEMPS_DEFAUT, voisins=None, k_voisins=10, graine=None,
+                  avec_stats=False):
+    """
+    ILS à un seul départ, dans le processus courant : améliore un cycle déjà construit.
+
+    Args:
+        cycle (list): Le cycle de départ
+        G (GrapheMD): Le graphe (avec sa matrice D)
+        limite_temps (float): Durée maximale (secondes)
+        voisins (numpy.ndarray): Les listes de voisins candidats, calculées si absentes
+        k_voisins (int): Le nombre de voisins candidats par ville (si voisins est absent)
+        graine: La graine des perturbations
+        avec_stats (bool): Retourner aussi les statistiques
+
+    Returns:
+        list: Le meilleur cycle trouvé
+        Si avec_stats : tuple (cycle, stats)
+    """
+    G.exiger_symetrique("ILS")
+    debut = time.perf_counter()
+    stats = StatsRecherche("ILS") if avec_stats else None
+    if G.n <= 3:
+        cycle = list(cycle)
+        return (cycle, stats) if avec_stats else cycle
+    if voisins is None:
+        voisins = utils.calculer_voisins_candidats(G, k_voisins)
+    meilleur, _, chronologie, compteurs = recherche_locale_iteree(G, cycle, debut + limite_temps, voisins,
+                                                                  np.random.default_rng(graine))
+    if avec_stats:
+        stats.chronologie.extend((instant - debut, longueur) for instant, longueur in chronologie)
+        stats.compteurs.update(compteurs)
+        return meilleur, stats
+    return meilleur
+
+
+def _executer_depart(graphe, depart, echeance, voisins, graine, longueur_max, obligatoire=True):
+    """
+    Un départ de l'ILS (exécuté dans un processus du pool, qui reçoit la poignée du graphe partagé).
+    La construction du départ est comptée dans l'échéance : si elle l'a dépassée, le cycle
+    de départ est retourné tel quel. Un départ non obligatoire dont l'échéance est déjà passée
+    n'est pas construit (retourne None).
+    """
+    if not obligatoire and time.perf_counter() >= echeance:
+        return None
+    G = graphe.ouvrir() if isinstance(graphe, PoigneeGraphe) else graphe
+    rng = np.random.default_rng(graine)
+    cycle = _cycle_depart(depart, G, rng)
+    if time.perf_counter() >= echeance:
+        longueur = _longueur(G, cycle)
+        return cycle, longueur, [(time.perf_counter(), longueur)], _compteurs_vides()
+    return recherche_locale_iteree(G, cycle, echeance, voisins, rng, longueur_max)
+
+
+def ils(G, limite_temps=LIMITE_TEMPS_DEFAUT, departs=DEPARTS, nb_workers=None, k_voisins=10, longueur_max=50,
+        graine=None, avec_stats=False):
+    """
+    Recherche locale itérée à départs multiples.
+
+    Args:
+        G (GrapheMD): Le graphe (avec sa matrice D). Un graphe déjà en mémoire partagée
+            (partage.graphe de G.partager()) est envoyé aux processus sans nouvelle copie : sur
+            de grandes instances, le partager soi-même et libérer l'original évite d'avoir
+            deux matrices n x n dans le processus principal
+        limite_temps (float): Durée totale (secondes, temps réel). Elle couvre les listes de voisins,
+            la construction des départs et leur recherche locale, mais reste approximative au
+            démarrage du pool (lancement des processus) et pendant une construction, qui n'est
+            pas interrompue : un départ qui la dépasse est retourné sans recherche locale
+        departs (tuple): Les cycles de départ ("PPP", "OptPrim", "Aleatoire"), un par recherche
+        nb_workers (int): Le nombre de processus (défaut : nombre de coeurs ; 1 = sans pool)
+        k_voisins (int): Le nombre de voisins candidats par ville
+        longueur_max (int): La longueur maximale des segments échangés par le double pont
+        graine: La graine des départs aléatoires et des perturbations
+        avec_stats (bool): Retourner aussi les statistiques
+
+    Returns:
+        list: Le meilleur cycle hamiltonien trouvé
+        Si avec_stats : tuple (cycle, stats) avec stats (StatsRecherche) contenant
+            iterations, perturbations_acceptees, mouvements_2opt (sommés sur les départs),
+            departs et departs_ignores (échéance passée avant leur construction)
+            et, dans la chronologie, la convergence de la meilleure longueur tous départs confondus
+    """
+    G.exiger_symetrique("ILS")
+    debut = time.perf_counter()
+    stats = StatsRecherche("ILS") if avec_stats else None
+    n = G.n
+    if n <= 3:
+        cycle = list(range(n))
+        return (cycle, stats) if avec_stats else cycle
+
+    # Listes de voisins calculées une seule fois (O(n^2)) pour tous les départs, dans le budget de temps
+    voisins = utils.calculer_voisins_candidats(G, k_voisins)
+    nb_workers = min(nb_workers or os.cpu_count() or 1, len(departs))
+    # Les départs en surnombre s'exécutent par vagues : le temps est partagé entre les vagues
+    nb_vagues = -(-len(departs) // nb_workers)
+    echeances = [debut + limite_temps * (i // nb_workers + 1) / nb_vagues for i in range(len(departs))]
+    sequence = graine if isinstance(graine, np.random.SeedSequence) else np.random.SeedSequence(graine)
+    arguments = (list(departs), echeances, [voisins] * len(departs), sequence.spawn(len(departs)),
+                 [longueur_max] * len(departs), [i == 0 for i in range(len(departs))])
+    if nb_workers > 1:
+        # Les processus reçoivent la poignée du graphe en mémoire partagée, et non une copie de D.
+        # Un graphe déjà partagé est réutilisé ; sinon la copie n'existe que le temps du pool.
+        with contextlib.ExitStack() as pile:
+            poignee = getattr(G, "_poignee", None)
+            if poignee is None:
+                poignee = pile.enter_context(G.partager()).poignee
+            pool = pile.enter_context(ProcessPoolExecutor(max_workers=nb_workers))
+            resultats = list(pool.map(_executer_depart, [poignee] * len(departs), *arguments))
+    else:
+        resultats = list(map(_executer_depart, [G] * len(departs), *arguments))
+    # Départs non construits : leur échéance était passée (seul le premier est toujours exécuté)
+    resultats = [r for r in resultats if r is not None]
+
+    meilleur, _, _, _ = min(resultats, key=lambda r: r[1])
+    if avec_stats:
+        # Chronologie commune : time.perf_counter est une horloge monotone partagée par les processus
+        meilleure_longueur = float('inf')
+        for instant, longueur in sorted(p for r in resultats for p in r[2]):
+            if longueur < meilleure_longueur:
+                meilleure_longueur = longueur
+                stats.chronologie.append((max(0.0, instant - debut), longueur))
+        stats.compteurs.update(departs=len(resultats), departs_ignores=len(departs) - len(resultats),
+                               **{c: sum(r[3][c] for r in resultats) for c in resultats[0][3]})
+        return meilleur, stats
+    return meilleur
@@ -1,8 +1,11 @@
+import time
+import numpy as np
 from structures.graphe_md import GrapheMD
+from structures.stats_recherche import StatsRecherche
 
 # Version optimisée de l'algorithme du Point Plus Proche (OptPPP)
 
-def opt_ppp(cycle_init, G):
+def opt_ppp(cycle_init, G, avec_stats=False, limite_temps=None, max_passes=None):
     """
     Implémente une version optimisée de l'algorithme du Point Plus Proche (OptPPP)
     Principe :
@@ -12,10 +15,21 @@ def opt_ppp(cycle_init, G):
     Args:
         cycle_init (list): Une liste représentant le cycle hamiltonien initial
         G (GrapheMD): Le graphe des distances entre les points
+        avec_stats (bool): Retourner aussi les statistiques de la recherche
+        limite_temps (float): Durée maximale (secondes) ; une fois dépassée, on retourne
+            le cycle courant (déjà amélioré, mais pas forcément sans croisement)
+        max_passes (int): Nombre maximal de passes sur toutes les paires d'arêtes
+            (ex: 1 pour chronométrer une seule passe)
     
     Returns:
         list: Une liste représentant le cycle hamiltonien optimisé
+        Si avec_stats : tuple (cycle, stats) avec stats (StatsRecherche) contenant
+            passes, mouvements_evalues et mouvements_appliques
+
+    Raises:
+        ValueError: Si la matrice est asymétrique (l'inversion d'un segment change son coût)
     """
+    G.exiger_symetrique("OptPPP")
     D = G.D 
 
     # Copie du cycle initial , pour ne pas le modifier directement
@@ -24,11 +38,24 @@ def opt_ppp(cycle_init, G):
 
     amelioration = True
 
+    # Instrumentation : compteurs locaux
+    nb_passes = nb_evalues = nb_appliques = 0
+    echeance = None if limite_temps is None else time.perf_counter() + limite_temps
+    interrompu = False
+
     # Boucle principale de l'optimisation
-    while amelioration:
+    while amelioration and (max_passes is None or nb_passes < max_passes):
         amelioration = False
+        nb_passes += 1
         # Parcourir toutes les paires d'arêtes (i, i+1)
         for i in range(n):
+            # Limite de temps, vérifiée une fois par arête (i, i+1)
+            if echeance is not None and time.perf_counter() > echeance:
+                interrompu = True
+                amelioration = False
+                break
+            # Mouvements évalués comptés par ligne i, hors de la boucle interne (j = n-1 sauté pour i = 0)
+            nb_evalues += max(0, n - i - 2) - (i == 0 and n > 2)
             # on la compare avec toutes les arêtes (j, j+1) suivantes
             # j commence a i+2 pour eviter les arêtes adjacentes
             for j in range(i + 2, n):
@@ -58,5 +85,100 @@ def opt_ppp(cycle_init, G):
                     # Pour cela, on inverse la section du cycle entre B et C
                     cycle[i + 1:j + 1] = reversed(cycle[i + 1:j + 1])
                     amelioration = True
+                    nb_appliques += 1
+
+    if avec_stats:
+        stats = StatsRecherche("OptPPP")
+        stats.compteurs.update(passes=nb_passes, mouvements_evalues=nb_evalues, mouvements_appliques=nb_appliques,
+                               interrompu=int(interrompu))
+        return cycle, stats
+    return cycle
+
+def deux_opt_fenetre(chemin, D, debut, fin):
+    """
+    2-opt restreint à une fenêtre : seules les arêtes (chemin[i], chemin[i+1]) avec
+    debut <= i < fin sont considérées, et chemin[debut], chemin[fin] ne bougent pas.
+    Utilisé pour réparer localement un cycle après une petite modification
+    (coût O(largeur^2) par passe au lieu de O(n^2)).
+
+    Args:
+        chemin (list): Le cycle (ou un extrait du cycle), modifié sur place
+        D (numpy.ndarray): La matrice des distances
+        debut (int): La première position de la fenêtre
+        fin (int): La dernière position de la fenêtre
+
+    Returns:
+        float: Le gain total (diminution de la longueur)
+    """
+    gain_total = 0.0
+    amelioration = True
+    while amelioration:
+        amelioration = False
+        for i in range(debut, fin - 2):
+            A, B = chemin[i], chemin[i + 1]
+            for j in range(i + 2, fin):
+                C, E = chemin[j], chemin[j + 1]
+                gain = D[A][B] + D[C][E] - D[A][C] - D[B][E]
+                if gain > 1e-12:
+                    chemin[i + 1:j + 1] = reversed(chemin[i + 1:j + 1])
+                    gain_total += gain
+                    amelioration = True
+                    B = chemin[i + 1]
+    return gain_total
+
+
+def opt_ppp_lot(cycles, D):
+    """
+    OptPPP sur B instances de même taille à la fois. Pour une arête (i, i+1), les arêtes (j, j+1)
+    suivantes sont évaluées d'un coup (tableau (B, n)) ; dans chaque instance, le premier j
+    améliorant est appliqué, puis le parcours des j reprend après lui, comme dans opt_ppp :
+    les cycles obtenus sont exactement ceux de opt_ppp sur chaque instance.
+
+    Args:
+        cycles (numpy.ndarray): Les cycles initiaux (B, n), ex: algo_ppp_lot
+        D (numpy.ndarray): La pile (B, n, n) des matrices de distances (symétriques)
+
+    Returns:
+        numpy.ndarray: Le tableau (B, n) des cycles optimisés
+    """
+    D = np.asarray(D)
+    if not np.array_equal(D, D.swapaxes(1, 2)):
+        raise ValueError("OptPPP suppose des distances symétriques (D[i][j] == D[j][i])")
+    cycles = np.array(cycles, dtype=np.intp)
+    B, n = cycles.shape
+    colonnes = np.arange(n)
+
+    # Une instance reste active tant que sa dernière passe a trouvé une amélioration
+    actives = np.ones(B, dtype=bool)
+    while actives.any():
+        ameliorees = np.zeros(B, dtype=bool)
+        for i in range(n - 2):
+            # prochain[b] : premier j encore à examiner pour l'instance b
+            prochain = np.where(actives, i + 2, n)
+            while True:
+                b = np.flatnonzero(prochain < n)
+                if len(b) == 0:
+                    break
+                C = cycles[b]
+                suivants = np.roll(C, -1, axis=1)
+                A, Bv = C[:, i], C[:, i + 1]
+                rangs = b[:, None]
+                dist_actuelle = D[b, A, Bv][:, None] + D[rangs, C, suivants]
+                dist_nouvelle = D[rangs, A[:, None], C] + D[rangs, Bv[:, None], suivants]
+                candidats = (dist_nouvelle < dist_actuelle) & (colonnes >= prochain[b][:, None])
+                if i == 0:
+                    candidats[:, n - 1] = False  # Arête adjacente à (0, 1) dans le cycle
+                trouves = candidats.any(axis=1)
+                prochain[b[~trouves]] = n
+                if not trouves.any():
+                    break
 
-    return cycle
\ No newline at end of file
+                # Inversion de cycle[i+1..j] dans chaque instance améliorée
+                b, j = b[trouves], np.argmax(candidats[trouves], axis=1)
+                dans_segment = (colonnes > i) & (colonnes <= j[:, None])
+                source = np.where(dans_segment, i + 1 + j[:, None] - colonnes, colonnes)
+                cycles[b] = np.take_along_axis(cycles[b], source, axis=1)
+                ameliorees[b] = True
+                prochain[b] = j + 1
+        actives = ameliorees
+    return cycles
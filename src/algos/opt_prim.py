@@ -5,7 +5,7 @@ from utils import dfs , pi_vers_graphe_tl , prim
 
 
 # Algorithme d'approximation par Prim pour le problème du voyageur de commerce (TSP)
-def opt_prim(G):
+def opt_prim(G, avec_stats=False):
     """
     Implémente l'algorithme d'approximation par Prim pour le TSP
     Principe : 
@@ -16,13 +16,19 @@ def opt_prim(G):
 
     Args:
         G (GrapheMD): Le graphe des distances entre les points
+        avec_stats (bool): Retourner aussi les statistiques du tas de Prim
     
     Returns:
         list: Une liste représentant le cycle hamiltonien trouvé
+        Si avec_stats : tuple (cycle, stats) avec stats (StatsRecherche) les compteurs de prim
     """
   
     # 1. Construire l'arbre couvrant de poids minimal (MST) 
-    pi = prim(G) 
+    if avec_stats:
+        pi, stats = prim(G, avec_stats=True)
+        stats.algo = "OptPrim"
+    else:
+        pi = prim(G) 
 
     # 2. Convertir pi en GrapheTL
     arbre_mst = pi_vers_graphe_tl(pi)
@@ -31,6 +37,8 @@ def opt_prim(G):
     P , S , P_star , S_star , pi_dfs = dfs(arbre_mst)
 
     # P_star contient le cycle hamiltonien approximatif
+    if avec_stats:
+        return P_star, stats
     return P_star
 
     
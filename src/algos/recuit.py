@@ -0,0 +1,185 @@
+import time
+import numpy as np
+from structures.stats_recherche import StatsRecherche
+import utils
+
+# --- Recuit simulé vectorisé ---
+# Au lieu d'un mouvement 2-opt par itération Python, chaque lot propose d'un coup
+# taille_lot mouvements 2-opt, évalués et acceptés par NumPy :
+#   - proposition : une ville a au hasard et un de ses k plus proches voisins c ; le mouvement
+#     remplace les arêtes (a, suivant(a)) et (c, suivant(c)) par (a, c) et (suivant(a), suivant(c))
+#   - critère de Metropolis : un mouvement de variation delta est accepté si delta < 0,
+#     ou avec la probabilité exp(-delta / T)
+#   - parmi les mouvements acceptés (doublons retirés), un sous-ensemble sans chevauchement
+#     est retenu par un parcours glouton : ces mouvements sont indépendants, leurs variations
+#     s'additionnent exactement et ils sont appliqués en une seule opération
+# La température suit un schéma de refroidissement indexé par le numéro de lot
+# (et non par le temps) : avec la même graine, deux exécutions sont identiques.
+
+# Schémas de refroidissement : (avancement f dans [0, 1], T0, T_fin) -> T
+REFROIDISSEMENTS = {
+    "geometrique": lambda f, T0, T_fin: T0 * (T_fin / T0) ** f,
+    "lineaire": lambda f, T0, T_fin: T0 + (T_fin - T0) * f,
+    "cosinus": lambda f, T0, T_fin: T_fin + (T0 - T_fin) * (1 + np.cos(np.pi * f)) / 2,
+}
+
+
+def _proposer(tour, pos, voisins, rng, taille_lot):
+    """
+    Tire taille_lot mouvements 2-opt (a, voisin de a) et les ramène à des positions i < j :
+    le segment inversé est tour[i+1..j].
+    """
+    n = len(tour)
+    p_a = rng.integers(n, size=taille_lot)
+    c = voisins[tour[p_a], rng.integers(voisins.shape[1], size=taille_lot)]
+    p_c = pos[c]
+    i, j = np.minimum(p_a, p_c), np.maximum(p_a, p_c)
+    garder = (j - i >= 2) & ~((i == 0) & (j == n - 1))
+    return i[garder], j[garder]
+
+
+def _variations(tour, D, i, j):
+    """ Variations de longueur des mouvements (a, b), (c, d) -> (a, c), (b, d). """
+    n = len(tour)
+    a, b, c, d = tour[i], tour[i + 1], tour[j], tour[(j + 1) % n]
+    return D[a, c] + D[b, d] - D[a, b] - D[c, d]
+
+
+def _temperature_initiale(tour, pos, D, voisins, rng, acceptation, nb_echantillons=1000):
+    """
+    Choisit T0 pour qu'un mouvement défavorable moyen (proposé sur le cycle de départ)
+    soit accepté avec la probabilité `acceptation`.
+    """
+    i, j = _proposer(tour, pos, voisins, rng, nb_echantillons)
+    delta = _variations(tour, D, i, j)
+    positifs = delta[delta > 0]
+    if len(positifs) == 0:
+        return 1e-9
+    return float(-positifs.mean() / np.log(acceptation))
+
+
+def _sans_chevauchement(i, j):
+    """
+    Indices d'un sous-ensemble de mouvements deux à deux indépendants : les doublons (i, j)
+    sont retirés, puis les mouvements sont parcourus par j croissant et un mouvement est gardé
+    si i > max(j des mouvements gardés). Deux mouvements gardés ne partagent aucune arête,
+    et le glouton garde le plus grand nombre possible de mouvements.
+    """
+    _, uniques = np.unique(np.stack((j, i)), axis=1, return_index=True)  # triés par j, puis i
+    gardes = []
+    j_max = -1
+    for k, i_k, j_k in zip(uniques.tolist(), i[uniques].tolist(), j[uniques].tolist()):
+        if i_k > j_max:
+            gardes.append(k)
+            j_max = j_k
+    return np.array(gardes, dtype=np.intp)
+
+
+def _inverser_segments(tour, debuts, fins):
+    """ Inverse en une seule opération les segments disjoints tour[debuts[k]..fins[k]] ; retourne les positions modifiées. """
+    longueurs = fins - debuts + 1
+    decalages = np.arange(longueurs.sum()) - np.repeat(np.cumsum(longueurs) - longueurs, longueurs)
+    positions = np.repeat(debuts, longueurs) + decalages
+    tour[positions] = tour[np.repeat(fins, longueurs) - decalages]
+    return positions
+
+
+def recuit_simule(cycle_init, G, limite_temps=None, nb_lots=5000, refroidissement="geometrique",
+                  T0=None, T_fin=None, acceptation_initiale=0.05, taille_lot=None, voisins=None, k_voisins=8,
+                  graine=None, avec_stats=False):
+    """
+    Améliore un cycle hamiltonien par recuit simulé, avec des lots de mouvements 2-opt
+    proposés et évalués par NumPy.
+
+    Args:
+        cycle_init (list): Le cycle de départ
+        G (GrapheMD): Le graphe (avec sa matrice D)
+        limite_temps (float): Durée maximale (secondes) ; le recuit s'arrête alors avant la fin
+            du refroidissement (et n'est plus reproductible d'une machine à l'autre)
+        nb_lots (int): Le nombre de lots de mouvements (durée du refroidissement)
+        refroidissement (str | callable): Un nom de REFROIDISSEMENTS, ou une fonction
+            (avancement, T0, T_fin) -> T
+        T0 (float): La température initiale (défaut : calculée avec acceptation_initiale)
+        T_fin (float): La température finale (défaut : T0 / 1e3)
+        acceptation_initiale (float): La probabilité initiale d'accepter un mouvement défavorable moyen
+        taille_lot (int): Le nombre de mouvements proposés par lot (défaut : max(1, n / 4) ; un lot
+            plus grand que n / 4 propose surtout des mouvements qui se chevauchent)
+        voisins (numpy.ndarray): Les listes de voisins candidats (n, k), calculées si absentes
+        k_voisins (int): Le nombre de voisins candidats par ville (si voisins est absent)
+        graine: La graine du générateur (int, SeedSequence ou None)
+        avec_stats (bool): Retourner aussi les statistiques
+
+    Returns:
+        list: Le meilleur cycle rencontré
+        Si avec_stats : tuple (cycle, stats) avec stats (StatsRecherche) contenant
+            lots, mouvements_proposes, mouvements_acceptes, mouvements_appliques (acceptés sans
+            chevauchement), T0 et la chronologie des améliorations
+    """
+    if callable(refroidissement):
+        temperature = refroidissement
+    elif refroidissement in REFROIDISSEMENTS:
+        temperature = REFROIDISSEMENTS[refroidissement]
+    else:
+        raise ValueError(f"Refroidissement inconnu : {refroidissement} ({', '.join(REFROIDISSEMENTS)})")
+
+    G.exiger_symetrique("Recuit")
+    stats = StatsRecherche("Recuit") if avec_stats else None
+    tour = np.asarray(cycle_init, dtype=np.intp).copy()
+    n = len(tour)
+    if n < 5:
+        return (tour.tolist(), stats) if avec_stats else tour.tolist()
+
+    D = np.asarray(G.D)
+    if voisins is None:
+        voisins = utils.calculer_voisins_candidats(G, k_voisins)
+    voisins = np.asarray(voisins, dtype=np.intp)
+    taille_lot = taille_lot or max(1, n // 4)
+    rng = np.random.default_rng(graine)
+    echeance = None if limite_temps is None else time.perf_counter() + limite_temps
+    pos = np.empty(n, dtype=np.intp)
+    pos[tour] = np.arange(n)
+    if T0 is None:
+        T0 = _temperature_initiale(tour, pos, D, voisins, rng, acceptation_initiale)
+    if T_fin is None:
+        T_fin = T0 / 1e3
+
+    longueur = float(D[tour, np.roll(tour, -1)].sum())
+    meilleur, meilleure_longueur = tour.copy(), longueur
+    nb_proposes = nb_acceptes = nb_appliques = 0
+    lot = 0
+    for lot in range(nb_lots):
+        if echeance is not None and lot & 15 == 0 and time.perf_counter() > echeance:
+            break
+        T = temperature(lot / max(1, nb_lots - 1), T0, T_fin)
+
+        # 1. Propositions et variations de longueur
+        i, j = _proposer(tour, pos, voisins, rng, taille_lot)
+        delta = _variations(tour, D, i, j)
+        nb_proposes += len(i)
+
+        # 2. Critère de Metropolis, puis application des mouvements acceptés sans chevauchement
+        acceptes = delta < 0
+        defavorables = ~acceptes
+        if T > 0:
+            acceptes[defavorables] = rng.random(int(defavorables.sum())) < np.exp(-delta[defavorables] / T)
+        if not acceptes.any():
+            continue
+        nb_acceptes += int(acceptes.sum())
+        retenus = np.flatnonzero(acceptes)
+        retenus = retenus[_sans_chevauchement(i[retenus], j[retenus])]
+        nb_appliques += len(retenus)
+        positions = _inverser_segments(tour, i[retenus] + 1, j[retenus])
+        pos[tour[positions]] = positions
+        longueur += float(delta[retenus].sum())
+
+        if longueur < meilleure_longueur - 1e-9:
+            meilleur[:] = tour
+            meilleure_longueur = longueur
+            if stats is not None:
+                stats.noter_solution(longueur)
+
+    if avec_stats:
+        stats.compteurs.update(lots=lot + 1, mouvements_proposes=nb_proposes, mouvements_acceptes=nb_acceptes,
+                               mouvements_appliques=nb_appliques, T0=T0)
+        return meilleur.tolist(), stats
+    return meilleur.tolist()
@@ -0,0 +1,206 @@
+import numpy as np
+from structures.graphe_md import GrapheMD
+from algos.opt_ppp import deux_opt_fenetre
+
+
+# Tour dynamique : ajout et retrait de villes dans un cycle déjà optimisé
+# Au lieu de relancer PPP + OptPPP sur toute l'instance, chaque modification est traitée par :
+#   1. une insertion au moindre coût (ou le retrait de la ville, en reliant ses deux voisins)
+#   2. une réparation locale (2-opt et Or-opt) dans une fenêtre autour de la modification
+
+
+class TourDynamique:
+    """
+    Cycle hamiltonien modifiable ville par ville.
+
+    Les villes sont identifiées par un numéro stable : un retrait ne renumérote pas les autres
+    villes, et les numéros retirés ne sont pas réutilisés. Seules les coordonnées sont stockées
+    (tableau à capacité doublée, O(n) en mémoire) : un ajout calcule les distances de la nouvelle
+    ville au cycle (O(n)), la réparation celles de sa fenêtre (O(w^2)), sans matrice n x n.
+
+    Attributes:
+        cycle (numpy.ndarray): L'ordre de visite des villes actives
+        longueur (float): La longueur du cycle, mise à jour à chaque modification
+        largeur_fenetre (int): Le nombre de positions réparées de chaque côté d'une modification
+
+    Methods:
+        depuis_graphe: Crée le tour à partir d'un graphe et d'un cycle déjà calculés.
+        ajouter_ville: Insère une nouvelle ville et répare le cycle localement.
+        retirer_ville: Retire une ville et répare le cycle localement.
+        vers_graphe: Retourne un GrapheMD des villes (numéros conservés).
+    """
+
+    def __init__(self, points, cycle, largeur_fenetre=25):
+        n = len(points)
+        self._P = np.zeros((max(16, n), 2))
+        self._P[:n] = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        self._nb_villes = n  # Numéros attribués (villes retirées comprises)
+        self.cycle = np.asarray(cycle, dtype=np.intp).copy()
+        self.largeur_fenetre = largeur_fenetre
+        suivants = np.roll(self.cycle, -1)
+        self.longueur = float(self._distances(self.cycle, suivants).sum()) if len(self.cycle) > 1 else 0.0
+
+    @classmethod
+    def depuis_graphe(cls, G, cycle, largeur_fenetre=25):
+        """
+        Crée le tour à partir d'un graphe et d'un cycle (ex: résultat de OptPPP).
+
+        Args:
+            G (GrapheMD): Le graphe (seuls ses points sont utilisés : distances euclidiennes)
+            cycle (list): Le cycle hamiltonien de départ
+            largeur_fenetre (int): Le nombre de positions réparées de chaque côté d'une modification
+        """
+        G.exiger_euclidien("TourDynamique")
+        return cls(G.points, cycle, largeur_fenetre)
+
+    def __len__(self):
+        return len(self.cycle)
+
+    def vers_graphe(self):
+        """ Retourne un GrapheMD de toutes les villes numérotées (sa matrice est calculée : O(n^2)). """
+        m = self._nb_villes
+        return GrapheMD(m, self._P[:m].copy())
+
+    def _distances(self, a, b):
+        """ Distances euclidiennes entre les villes a et b (tableaux d'indices, diffusés). """
+        dx = self._P[a, 0] - self._P[b, 0]
+        dy = self._P[a, 1] - self._P[b, 1]
+        return np.sqrt(dx**2 + dy**2)
+
+    def _agrandir(self):
+        """ Double la capacité du tableau des coordonnées (coût amorti O(1) par ajout). """
+        P = np.zeros((2 * len(self._P), 2))
+        P[:len(self._P)] = self._P
+        self._P = P
+
+    def ajouter_ville(self, x, y):
+        """
+        Ajoute une ville au cycle.
+        Principe :
+            1. Calculer ses distances aux villes du cycle
+            2. L'insérer entre les deux villes consécutives (a, b) qui minimisent
+               D[a][v] + D[v][b] - D[a][b] (calcul vectorisé sur tout le cycle)
+            3. Réparer le cycle autour de la position d'insertion
+
+        Args:
+            x (float), y (float): Les coordonnées de la ville
+
+        Returns:
+            int: Le numéro attribué à la ville
+        """
+        if self._nb_villes == len(self._P):
+            self._agrandir()
+        v = self._nb_villes
+        self._nb_villes += 1
+        self._P[v] = (x, y)
+
+        C = self.cycle
+        if len(C) < 2:
+            self.cycle = np.append(C, v)
+            self.longueur = 2 * float(self._distances(C[0], v)) if len(C) == 1 else 0.0
+            return v
+
+        # Insertion au moindre coût
+        vers_v = self._distances(C, v)
+        couts = vers_v + np.roll(vers_v, -1) - self._distances(C, np.roll(C, -1))
+        i = int(np.argmin(couts))
+        self.cycle = np.insert(C, i + 1, v)
+        self.longueur += float(couts[i])
+
+        self._reparer(i + 1)
+        return v
+
+    def retirer_ville(self, v):
+        """
+        Retire une ville du cycle : ses deux voisins sont reliés, puis le cycle est réparé
+        autour de cette nouvelle arête.
+
+        Args:
+            v (int): Le numéro de la ville
+        """
+        positions = np.flatnonzero(self.cycle == v)
+        if len(positions) == 0:
+            raise KeyError(f"La ville {v} n'est pas dans le tour.")
+        i = int(positions[0])
+        n = len(self.cycle)
+        a, b = self.cycle[(i - 1) % n], self.cycle[(i + 1) % n]
+        self.longueur -= float(self._distances(a, v) + self._distances(v, b) - self._distances(a, b))
+        self.cycle = np.delete(self.cycle, i)
+        if len(self.cycle) < 2:
+            self.longueur = 0.0
+            return
+        self._reparer(i % len(self.cycle))
+
+    def _reparer(self, position):
+        """
+        Réparation locale : la fenêtre de positions [position - w, position + w] est extraite
+        comme un chemin dont les extrémités restent fixes, améliorée par 2-opt et Or-opt
+        jusqu'à stabilité, puis réécrite dans le cycle.
+        """
+        n = len(self.cycle)
+        w = self.largeur_fenetre
+        if n < 5:
+            return
+        if n <= 2 * w + 1:
+            # Petit cycle : la fenêtre couvre tout le cycle (sauf l'arête de fermeture)
+            indices = (position + np.arange(n)) % n
+        else:
+            indices = (position + np.arange(-w, w + 1)) % n
+        # Distances de la fenêtre (O(w^2)) en listes Python (accès bien plus rapide que D[a][b] sur numpy)
+        sommets = self.cycle[indices]
+        D = self._distances(sommets[:, None], sommets[None, :]).tolist()
+        chemin = list(range(len(sommets)))
+
+        gain_total = 0.0
+        while True:
+            gain = deux_opt_fenetre(chemin, D, 0, len(chemin) - 1)
+            gain += _or_opt_fenetre(chemin, D, 0, len(chemin) - 1)
+            if gain <= 0.0:
+                break
+            gain_total += gain
+        if gain_total > 0.0:
+            self.cycle[indices] = sommets[chemin]
+            self.longueur -= gain_total
+
+
+def _or_opt_fenetre(chemin, D, debut, fin, longueur_max=3):
+    """
+    Or-opt restreint à une fenêtre : déplace un segment de 1 à longueur_max villes
+    (éventuellement retourné) entre deux autres villes consécutives de la fenêtre.
+    chemin[debut] et chemin[fin] ne bougent pas.
+
+    Returns:
+        float: Le gain total (diminution de la longueur)
+    """
+    gain_total = 0.0
+    amelioration = True
+    while amelioration:
+        amelioration = False
+        for L in range(1, longueur_max + 1):
+            s = debut + 1
+            while s + L <= fin:
+                p, a, b, q = chemin[s - 1], chemin[s], chemin[s + L - 1], chemin[s + L]
+                gain_retrait = D[p][a] + D[b][q] - D[p][q]
+                meilleur, t_meilleur, retourne = 1e-12, -1, False
+                # Arêtes (chemin[t], chemin[t+1]) hors du segment et de ses deux arêtes
+                for t in range(debut, fin):
+                    if s - 1 <= t <= s + L - 1:
+                        continue
+                    c, d = chemin[t], chemin[t + 1]
+                    direct = gain_retrait - (D[c][a] + D[b][d] - D[c][d])
+                    inverse = gain_retrait - (D[c][b] + D[a][d] - D[c][d])
+                    if direct > meilleur:
+                        meilleur, t_meilleur, retourne = direct, t, False
+                    if inverse > meilleur:
+                        meilleur, t_meilleur, retourne = inverse, t, True
+                if t_meilleur >= 0:
+                    segment = chemin[s:s + L]
+                    if retourne:
+                        segment.reverse()
+                    del chemin[s:s + L]
+                    t = t_meilleur if t_meilleur < s else t_meilleur - L
+                    chemin[t + 1:t + 1] = segment
+                    gain_total += meilleur
+                    amelioration = True
+                s += 1
+    return gain_total
@@ -0,0 +1,62 @@
+import numpy as np
+from structures.graphe_md import GrapheMD
+from algos.algo_ppp import algo_ppp
+from algos.opt_ppp import opt_ppp
+from algos.hds import hds
+from mesure import mesurer
+import utils
+
+# --- BENCHMARK : Matrices float64, float32 et entières (EUC_2D de TSPLIB) ---
+# Lancer depuis src/ :  python -m benchmarks.bench_distances
+
+MODES = ("float64", "float32", "int32")
+
+
+def construire(points, mode):
+    """ Le graphe des points avec des distances du type demandé (int32 : arrondi de TSPLIB). """
+    if mode == "int32":
+        return GrapheMD(len(points), points, entier=True)
+    graphe = GrapheMD(len(points), points)
+    if mode == "float32":
+        graphe = GrapheMD.depuis_matrice(graphe.D, points, dtype=np.float32, symetrique=True)
+    return graphe
+
+
+def bench_algos(tailles=(200, 500), echelle=1000.0):
+    """ Temps de construction, de PPP, de OptPPP et du calcul de longueur pour chaque type. """
+    print(f"\n{'N':<6} | {'TYPE':<8} | {'MATRICE (Mo)':<12} | {'GRAPHE (ms)':<11} | {'PPP (ms)':<9} | "
+          f"{'OptPPP (ms)':<11} | {'LONGUEUR (ms)':<13} | {'LONGUEUR':<10}")
+    print("-" * 104)
+    for n in tailles:
+        # Coordonnées dans [0, echelle] : l'arrondi entier reste fin devant les distances
+        points = utils.generer_instances(1, n, graine=n)[0] * echelle
+        for mode in MODES:
+            m_graphe = mesurer(construire, points, mode, memoire=False)
+            graphe = m_graphe.resultat
+            m_ppp = mesurer(algo_ppp, graphe, memoire=False)
+            m_opt = mesurer(opt_ppp, m_ppp.resultat, graphe, memoire=False)
+            m_longueur = mesurer(utils.calculer_longueur_cycle, m_opt.resultat, graphe, memoire=False)
+            print(f"{n:<6} | {mode:<8} | {graphe.D.nbytes / 2**20:<12.2f} | {m_graphe.temps_ms:<11.2f} | "
+                  f"{m_ppp.temps_ms:<9.2f} | {m_opt.temps_ms:<11.1f} | {m_longueur.temps_ms:<13.4f} | "
+                  f"{m_longueur.resultat:<10.1f}")
+
+
+def bench_hds_asymetrique(N=9, nb_instances=3, graine=0):
+    """ HDS sur des matrices asymétriques entières : temps et optimalité (énumération exhaustive). """
+    from itertools import permutations
+    rng = np.random.default_rng(graine)
+    print(f"\nHDS ASYMÉTRIQUE (N={N}, int32)")
+    for k in range(nb_instances):
+        D = rng.integers(1, 100, size=(N, N)).astype(np.int32)
+        np.fill_diagonal(D, 0)
+        graphe = GrapheMD.depuis_matrice(D)
+        m = mesurer(hds, graphe, memoire=False)
+        cout = utils.calculer_longueur_cycle(m.resultat, graphe)
+        optimum = min(D[0, p[0]] + sum(D[p[i], p[i + 1]] for i in range(N - 2)) + D[p[-1], 0]
+                      for p in permutations(range(1, N)))
+        print(f"  instance {k} : {m.temps_ms:.1f} ms, coût {cout:.0f}, optimum {optimum}")
+
+
+if __name__ == "__main__":
+    bench_algos()
+    bench_hds_asymetrique()
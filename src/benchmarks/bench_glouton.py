@@ -0,0 +1,35 @@
+from structures.graphe_md import GrapheMD
+from algos.algo_ppp import algo_ppp
+from algos.opt_prim import opt_prim
+from algos.algo_glouton import algo_glouton
+from algos.opt_ppp import opt_ppp
+from mesure import mesurer
+import utils
+
+# --- BENCHMARK : Constructions de départ pour le 2-opt (PPP, OptPrim, Glouton) ---
+# Pour chaque construction : son temps, la longueur du cycle de départ, puis le temps du 2-opt
+# (opt_ppp) qui l'améliore et la longueur finale. Un meilleur départ laisse moins de travail au 2-opt.
+# Lancer depuis src/ :  python -m benchmarks.bench_glouton
+
+CONSTRUCTIONS = {"PPP": algo_ppp, "OptPrim": opt_prim, "Glouton": algo_glouton}
+
+
+def bench_departs(tailles=(200, 500, 1000), distributions=("uniforme", "clusters")):
+    print(f"\n{'N':<6} | {'DISTRIBUTION':<12} | {'DÉPART':<8} | {'CONSTR. (ms)':<12} | {'LONG. DÉPART':<12} | "
+          f"{'2-OPT (ms)':<10} | {'MOUVEMENTS':<10} | {'TOTAL (ms)':<10} | {'LONG. FINALE':<12}")
+    print("-" * 116)
+    for n in tailles:
+        for distribution in distributions:
+            graphe = GrapheMD(n, utils.generer_instances(1, n, graine=n, distribution=distribution)[0])
+            for nom, construire in CONSTRUCTIONS.items():
+                m_depart = mesurer(construire, graphe, memoire=False)
+                m_opt = mesurer(opt_ppp, m_depart.resultat, graphe, True, memoire=False)
+                cycle, stats = m_opt.resultat
+                print(f"{n:<6} | {distribution:<12} | {nom:<8} | {m_depart.temps_ms:<12.1f} | "
+                      f"{utils.calculer_longueur_cycle(m_depart.resultat, graphe):<12.3f} | "
+                      f"{m_opt.temps_ms:<10.1f} | {stats.compteurs['mouvements_appliques']:<10} | "
+                      f"{m_depart.temps_ms + m_opt.temps_ms:<10.1f} | {utils.calculer_longueur_cycle(cycle, graphe):<12.3f}")
+
+
+if __name__ == "__main__":
+    bench_departs()
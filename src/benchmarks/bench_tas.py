@@ -0,0 +1,122 @@
+import time
+import heapq
+import random
+from structures.graphe_md import GrapheMD
+from structures.tas import Tas
+from structures.tas_indexe import TasIndexe
+from algos.hds import hds
+import utils
+
+# --- BENCHMARK : Tas indexé (diminuer_cle) vs Tas avec suppression paresseuse ---
+# Lancer depuis src/ :  python -m benchmarks.bench_tas
+
+
+def prim_paresseux(graphe_md):
+    """ Ancienne version de prim : doublons dans le Tas et extractions obsolètes ignorées. """
+    n = graphe_md.n
+    D = graphe_md.D
+    cle = [float('inf')] * n
+    pi = [-1] * n
+    visite = [False] * n
+
+    F = Tas()
+    cle[0] = 0
+    F.inserer(0, cle[0])
+    while not F.est_vide():
+        _, s = F.extraire_min()
+        if visite[s]:
+            continue
+        visite[s] = True
+        for t in range(n):
+            if s == t:
+                continue
+            if not visite[t] and D[s][t] < cle[t]:
+                cle[t] = D[s][t]
+                pi[t] = s
+                F.inserer(t, cle[t])
+    return pi
+
+
+def chronometrer(fonction, *args, repetitions=5):
+    """ Retourne le meilleur temps (en ms) sur plusieurs répétitions. """
+    meilleur = float('inf')
+    for _ in range(repetitions):
+        t0 = time.perf_counter()
+        fonction(*args)
+        meilleur = min(meilleur, time.perf_counter() - t0)
+    return meilleur * 1000
+
+
+def poids_mst(pi, D):
+    return sum(D[pi[v]][v] for v in range(len(pi)) if pi[v] != -1)
+
+
+def bench_prim(tailles=(100, 300, 1000)):
+    print(f"\n{'PRIM':<10} | {'PARESSEUX (ms)':<15} | {'INDEXÉ (ms)':<15} | {'ACCÉLÉRATION':<12}")
+    print("-" * 62)
+    for n in tailles:
+        graphe = GrapheMD(n, utils.generer_instances(1, n, graine=n)[0])
+        # Vérification : les deux versions donnent un MST de même poids
+        assert abs(poids_mst(prim_paresseux(graphe), graphe.D) - poids_mst(utils.prim(graphe), graphe.D)) < 1e-9
+        t_paresseux = chronometrer(prim_paresseux, graphe)
+        t_indexe = chronometrer(utils.prim, graphe)
+        print(f"n={n:<8} | {t_paresseux:<15.3f} | {t_indexe:<15.3f} | x{t_paresseux / t_indexe:<11.2f}")
+
+
+def bench_operations(n=20000, nb_diminutions=100000, graine=0):
+    """ Charge synthétique : n éléments puis de nombreuses diminutions de clé et l'extraction complète. """
+    rng = random.Random(graine)
+    cles = [rng.random() for _ in range(n)]
+    diminutions = [(rng.randrange(n), rng.random()) for _ in range(nb_diminutions)]
+
+    def paresseux():
+        courant = list(cles)
+        tas = [(c, e) for e, c in enumerate(cles)]
+        heapq.heapify(tas)
+        for e, c in diminutions:
+            if c < courant[e]:
+                courant[e] = c
+                heapq.heappush(tas, (c, e))
+        vus = set()
+        while tas:
+            c, e = heapq.heappop(tas)
+            if e in vus or c != courant[e]:
+                continue  # Extraction obsolète
+            vus.add(e)
+
+    def indexe():
+        F = TasIndexe(n)
+        F.entasser(range(n), cles)
+        for e, c in diminutions:
+            if c < F.cles[e]:
+                F.diminuer_cle(e, c)
+        while not F.est_vide():
+            F.extraire_min()
+
+    t_paresseux = chronometrer(paresseux, repetitions=3)
+    t_indexe = chronometrer(indexe, repetitions=3)
+    print(f"\nOPÉRATIONS (n={n}, {nb_diminutions} diminutions)")
+    print(f"  heapq paresseux : {t_paresseux:.2f} ms")
+    print(f"  TasIndexe       : {t_indexe:.2f} ms")
+
+
+def bench_frontiere_hds(N=10, nb_instances=5):
+    """ Frontière du Branch & Bound : heapq sur les noeuds vs TasIndexe sur leurs numéros. """
+    instances = utils.generer_instances(nb_instances, N, graine=N)
+    graphes = [GrapheMD(N, p) for p in instances]
+
+    def lancer(indexee):
+        for g in graphes:
+            hds(g, frontiere_indexee=indexee)
+
+    t_heapq = chronometrer(lancer, False, repetitions=1)
+    t_indexe = chronometrer(lancer, True, repetitions=1)
+    print(f"\nFRONTIÈRE HDS (N={N}, {nb_instances} instances)")
+    print(f"  heapq     : {t_heapq:.2f} ms")
+    print(f"  TasIndexe : {t_indexe:.2f} ms")
+
+
+if __name__ == "__main__":
+    bench_prim()
+    bench_operations()
+    bench_frontiere_hds()
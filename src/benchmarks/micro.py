@@ -0,0 +1,235 @@
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import subprocess
+import numpy as np
+from structures.graphe_md import GrapheMD
+from algos.algo_ppp import algo_ppp
+from algos.opt_ppp import opt_ppp
+from algos.hds import calculer_borne_hds
+from mesure import mesurer
+import utils
+
+# --- MICRO-BENCHMARKS : noyaux des solveurs, chronométrés isolément ---
+# Chaque noyau est mesuré sur des instances fixes (graine par taille), sans le reste du pipeline.
+# Les résultats sont enregistrés par commit (.micro_tsp/<commit>.json) et comparés à ceux
+# d'un commit précédent : un ralentissement au-delà de la tolérance est signalé (code de sortie 1).
+#
+# Lancer depuis src/ :
+#   python -m benchmarks.micro                       # mesure, enregistre, compare au dernier commit mesuré
+#   python -m benchmarks.micro --reference a1b2c3d   # compare à un commit donné
+#   python -m benchmarks.micro --noyaux prim dfs --tolerance 0.1
+
+
+# --- 1. Noyaux : (taille) -> fonction sans argument à chronométrer (préparation non chronométrée)
+def _instance(n):
+    return utils.generer_instances(1, n, graine=n)[0]
+
+
+def _noyau_graphe(n):
+    points = _instance(n)
+    return lambda: GrapheMD(n, points)
+
+
+def _noyau_borne_hds(n):
+    # Borne d'un noeud à mi-profondeur : la moitié des villes est déjà visitée
+    graphe = GrapheMD(n, _instance(n))
+    chemin = list(range(n // 2))
+    cout = sum(graphe.D[chemin[i]][chemin[i + 1]] for i in range(len(chemin) - 1))
+    masque = (1 << len(chemin)) - 1
+    return lambda: calculer_borne_hds(graphe, chemin, cout, masque)
+
+
+def _noyau_passe_opt_ppp(n):
+    graphe = GrapheMD(n, _instance(n))
+    cycle = algo_ppp(graphe)
+    return lambda: opt_ppp(cycle, graphe, max_passes=1)
+
+
+def _noyau_prim(n):
+    graphe = GrapheMD(n, _instance(n))
+    return lambda: utils.prim(graphe)
+
+
+def _noyau_dfs(n):
+    arbre = utils.pi_vers_graphe_tl(utils.prim(GrapheMD(n, _instance(n))))
+    return lambda: utils.dfs(arbre)
+
+
+def _noyau_longueur_cycle(n):
+    graphe = GrapheMD(n, _instance(n))
+    cycle = algo_ppp(graphe)
+    return lambda: utils.calculer_longueur_cycle(cycle, graphe)
+
+
+def _noyau_lire_fichier(n):
+    # Fichier écrit à la préparation (répertoire temporaire), relu à chaque appel
+    chemin = os.path.join(tempfile.gettempdir(), f"micro_tsp_{n}.txt")
+    np.savetxt(chemin, _instance(n), fmt="%.6f")
+    return lambda: utils.lire_fichier_texte(chemin)
+
+
+# Nom -> (préparation, tailles)
+NOYAUX = {
+    "graphe_md": (_noyau_graphe, (100, 1000)),
+    "borne_hds": (_noyau_borne_hds, (12, 40)),
+    "passe_opt_ppp": (_noyau_passe_opt_ppp, (50, 200)),
+    "prim": (_noyau_prim, (100, 1000)),
+    "dfs": (_noyau_dfs, (100, 1000)),
+    "longueur_cycle": (_noyau_longueur_cycle, (100, 1000)),
+    "lire_fichier_texte": (_noyau_lire_fichier, (100, 10000)),
+}
+
+
+# --- 2. Mesure
+def mesurer_noyaux(noms=None, echantillons=5, duree_min_ms=20.0):
+    """
+    Chronomètre les noyaux : chaque échantillon est un appel de mesure.mesurer (appels courts répétés),
+    on garde la médiane et le minimum des échantillons.
+
+    Returns:
+        dict: "noyau/n=taille" -> {"mediane_ms", "min_ms", "repetitions"}
+    """
+    resultats = {}
+    for nom in noms or NOYAUX:
+        preparer, tailles = NOYAUX[nom]
+        for n in tailles:
+            fonction = preparer(n)
+            mesures = [mesurer(fonction, duree_min_ms=duree_min_ms, memoire=False) for _ in range(echantillons)]
+            temps = [m.temps_ms for m in mesures]
+            cle = f"{nom}/n={n}"
+            resultats[cle] = {"mediane_ms": float(np.median(temps)), "min_ms": float(min(temps)),
+                              "repetitions": sum(m.repetitions for m in mesures)}
+            print(f"{cle:<28} {resultats[cle]['mediane_ms']:>12.4f} ms", file=sys.stderr)
+    return resultats
+
+
+# --- 3. Enregistrement par commit
+def commit_courant():
+    """ Le commit courant (court), suffixé par "-modifie" si l'arbre de travail a des modifications. """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+        modifie = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True,
+                                 text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "inconnu"
+    return commit + ("-modifie" if modifie else "")
+
+
+def commit_precedent(commit):
+    """
+    Le commit auquel comparer par défaut : HEAD~1, ou HEAD si l'arbre de travail est modifié
+    (les mesures portent alors sur les modifications non commitées).
+
+    Returns:
+        str | None: Le commit (court), ou None hors d'un dépôt git ou sans parent
+    """
+    revision = "HEAD" if commit.endswith("-modifie") else "HEAD~1"
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", revision], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def machine():
+    """ Empreinte de l'environnement : des temps de machines différentes ne sont pas comparables. """
+    return {"machine": platform.machine(), "processeur": platform.processor(),
+            "python": platform.python_version(), "numpy": np.__version__}
+
+
+def enregistrer(repertoire, commit, resultats):
+    os.makedirs(repertoire, exist_ok=True)
+    chemin = os.path.join(repertoire, f"{commit}.json")
+    with open(chemin, 'w') as f:
+        json.dump({"commit": commit, "date": time.time(), "environnement": machine(),
+                   "resultats": resultats}, f, indent=1)
+    return chemin
+
+
+def charger(repertoire, commit=None, exclure=None, precedent=None):
+    """
+    Charge les résultats d'un commit ; sans commit, ceux du commit precedent s'ils existent
+    (voir commit_precedent), sinon ceux du dernier commit mesuré (autre que exclure).
+
+    Returns:
+        dict | None: Le contenu enregistré, ou None s'il n'y en a pas
+    """
+    if commit is not None:
+        chemin = os.path.join(repertoire, f"{commit}.json")
+        if not os.path.exists(chemin):
+            return None
+        with open(chemin) as f:
+            return json.load(f)
+    if precedent is not None and precedent != exclure:
+        resultats = charger(repertoire, precedent)
+        if resultats is not None:
+            return resultats
+    if not os.path.isdir(repertoire):
+        return None
+    enregistres = []
+    for nom in os.listdir(repertoire):
+        if nom.endswith(".json") and nom[:-5] != exclure:
+            with open(os.path.join(repertoire, nom)) as f:
+                enregistres.append(json.load(f))
+    return max(enregistres, key=lambda e: e["date"], default=None)
+
+
+# --- 4. Comparaison
+def comparer(resultats, reference, tolerance, temps_min_ms=0.01):
+    """
+    Signale les noyaux dont la médiane dépasse celle de la référence de plus de `tolerance`
+    (0.2 = +20%). Les noyaux plus courts que temps_min_ms (référence) ne sont pas jugés (bruit).
+
+    Returns:
+        list: Les messages de ralentissement (liste vide si aucun)
+    """
+    ralentissements = []
+    for cle, mesure in sorted(resultats.items()):
+        if cle not in reference:
+            continue
+        avant, apres = reference[cle]["mediane_ms"], mesure["mediane_ms"]
+        if avant >= temps_min_ms and apres > avant * (1 + tolerance):
+            ralentissements.append(f"{cle:<28} {avant:.4f} ms -> {apres:.4f} ms (+{(apres / avant - 1) * 100:.0f}%)")
+    return ralentissements
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Micro-benchmarks des noyaux des solveurs TSP.")
+    parser.add_argument("--noyaux", nargs="+", choices=list(NOYAUX), help="Noyaux à mesurer (défaut : tous)")
+    parser.add_argument("--echantillons", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Ralentissement toléré (0.2 = +20%%)")
+    parser.add_argument("--reference", help="Commit de référence (défaut : le commit parent s'il a été mesuré, "
+                                                  "sinon le dernier commit mesuré)")
+    parser.add_argument("--repertoire", default=".micro_tsp", help="Répertoire des résultats par commit")
+    parser.add_argument("--sans-enregistrer", action="store_true", help="Ne pas enregistrer les résultats")
+    args = parser.parse_args(argv)
+
+    commit = commit_courant()
+    resultats = mesurer_noyaux(args.noyaux, args.echantillons)
+    if not args.sans_enregistrer:
+        print(f"Résultats enregistrés : {enregistrer(args.repertoire, commit, resultats)}", file=sys.stderr)
+
+    reference = charger(args.repertoire, args.reference, exclure=commit, precedent=commit_precedent(commit))
+    if reference is None:
+        print("Aucune référence à comparer.", file=sys.stderr)
+        return 2 if args.reference else 0
+    if reference.get("environnement") != machine():
+        print("Attention : la référence a été mesurée dans un autre environnement.", file=sys.stderr)
+
+    ralentissements = comparer(resultats, reference["resultats"], args.tolerance)
+    for message in ralentissements:
+        print(f"RALENTISSEMENT : {message}", file=sys.stderr)
+    if ralentissements:
+        return 1
+    print(f"Aucun ralentissement par rapport à {reference['commit']}.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+import os
+import hashlib
+import numpy as np
+from structures.graphe_md import GrapheMD
+import utils
+
+# --- CACHE D'INSTANCES (Bundles binaires adressés par contenu) ---
+# Chaque instance est stockée dans un fichier .npz (format binaire numpy) dont le nom
+# est un hash du contenu (points) ou de la source (fichier + date de modification).
+# Un bundle contient :
+#   - "points"  : les coordonnées (n, 2)
+#   - "D"       : la matrice des distances (optionnelle)
+#   - "voisins" : les listes de voisins candidats (optionnelles)
+#   - "cycle" / "longueur" : le meilleur cycle connu (optionnel)
+
+
+# --- 1. Clés du cache
+def hash_points(points):
+    """
+    Calcule la clé d'une instance à partir de ses coordonnées.
+
+    Args:
+        points (list | numpy.ndarray): Les coordonnées (x, y) des villes
+
+    Returns:
+        str: Le hash hexadécimal (sha1) des coordonnées
+    """
+    coords = np.ascontiguousarray(np.asarray(points, dtype=np.float64).reshape(-1, 2))
+    h = hashlib.sha1(b"points:")
+    h.update(str(coords.shape).encode())
+    h.update(coords.tobytes())
+    return h.hexdigest()
+
+
+def hash_fichier(chemin_fichier):
+    """
+    Calcule la clé d'une instance à partir de son fichier source.
+    Le fichier n'est pas relu : on utilise son chemin absolu, sa taille et
+    sa date de modification, la clé change donc dès que le fichier est modifié.
+
+    Args:
+        chemin_fichier (str): Le chemin vers le fichier texte
+
+    Returns:
+        str: Le hash hexadécimal (sha1) de la source
+    """
+    info = os.stat(chemin_fichier)
+    source = f"fichier:{os.path.abspath(chemin_fichier)}:{info.st_size}:{info.st_mtime_ns}"
+    return hashlib.sha1(source.encode()).hexdigest()
+
+
+# --- 2. Le cache
+class CacheInstances:
+    """
+    Répertoire de bundles binaires d'instances TSP, avec éviction LRU bornée en taille.
+
+    Attributes:
+        repertoire (str): Le répertoire contenant les bundles
+        taille_max (int): Taille totale maximale du cache (en octets)
+
+    Methods:
+        contient: Vérifie si une clé est présente dans le cache.
+        charger: Charge le bundle associé à une clé.
+        sauvegarder: Enregistre un bundle puis applique l'éviction LRU.
+        enregistrer_meilleur_cycle: Met à jour le meilleur cycle connu d'une instance.
+        charger_graphe: Construit un GrapheMD en passant par le cache.
+    """
+
+    EXTENSION = ".npz"
+
+    def __init__(self, repertoire=".cache_tsp", taille_max=256 * 1024 * 1024):
+        self.repertoire = repertoire
+        self.taille_max = taille_max
+        os.makedirs(self.repertoire, exist_ok=True)
+
+    def _chemin(self, cle):
+        return os.path.join(self.repertoire, cle + self.EXTENSION)
+
+    def contient(self, cle):
+        """ Vérifie si une clé est présente dans le cache. """
+        return os.path.exists(self._chemin(cle))
+
+    def charger(self, cle):
+        """
+        Charge le bundle associé à une clé.
+        La date de modification du fichier est rafraîchie : elle sert d'horodatage LRU.
+
+        Args:
+            cle (str): La clé de l'instance
+
+        Returns:
+            dict | None: Les tableaux du bundle, ou None si la clé est absente
+        """
+        chemin = self._chemin(cle)
+        if not os.path.exists(chemin):
+            return None
+
+        try:
+            with np.load(chemin, allow_pickle=False) as archive:
+                bundle = {nom: archive[nom] for nom in archive.files}
+        except Exception as e:
+            # Bundle corrompu (ex: écriture interrompue) : on le supprime
+            print(f"Cache : bundle illisible ignoré ({e})")
+            os.remove(chemin)
+            return None
+
+        os.utime(chemin)
+        return bundle
+
+    def sauvegarder(self, cle, points, D=None, voisins=None, cycle=None, longueur=None):
+        """
+        Enregistre un bundle dans le cache (écriture atomique) puis applique l'éviction LRU.
+
+        Args:
+            cle (str): La clé de l'instance
+            points (list | numpy.ndarray): Les coordonnées des villes
+            D (numpy.ndarray): La matrice des distances (optionnelle)
+            voisins (numpy.ndarray): Les listes de voisins candidats (optionnelles)
+            cycle (list): Le meilleur cycle connu (optionnel)
+            longueur (float): La longueur du meilleur cycle connu (optionnelle)
+        """
+        tableaux = {"points": np.asarray(points, dtype=np.float64).reshape(-1, 2)}
+        if D is not None:
+            tableaux["D"] = np.asarray(D)
+        if voisins is not None:
+            tableaux["voisins"] = np.asarray(voisins, dtype=np.int32)
+        if cycle is not None:
+            tableaux["cycle"] = np.asarray(cycle, dtype=np.int32)
+            tableaux["longueur"] = np.float64(longueur)
+
+        # On écrit dans un fichier temporaire puis on le renomme,
+        # pour ne jamais laisser un bundle à moitié écrit
+        chemin = self._chemin(cle)
+        chemin_tmp = chemin + ".tmp"
+        with open(chemin_tmp, 'wb') as f:
+            np.savez(f, **tableaux)
+        os.replace(chemin_tmp, chemin)
+
+        self._evincer()
+
+    def enregistrer_meilleur_cycle(self, cle, cycle, longueur):
+        """
+        Met à jour le meilleur cycle connu d'une instance (seulement s'il est meilleur).
+
+        Args:
+            cle (str): La clé de l'instance
+            cycle (list): Le cycle trouvé
+            longueur (float): La longueur du cycle trouvé
+
+        Returns:
+            bool: True si le bundle a été mis à jour
+        """
+        bundle = self.charger(cle)
+        if bundle is None:
+            return False
+        if "longueur" in bundle and float(bundle["longueur"]) <= longueur:
+            return False
+
+        self.sauvegarder(cle, bundle["points"], D=bundle.get("D"), voisins=bundle.get("voisins"),
+                         cycle=cycle, longueur=longueur)
+        return True
+
+    def _evincer(self):
+        """ Supprime les bundles les moins récemment utilisés tant que le cache dépasse taille_max. """
+        fichiers = []
+        for nom in os.listdir(self.repertoire):
+            if not nom.endswith(self.EXTENSION):
+                continue
+            chemin = os.path.join(self.repertoire, nom)
+            info = os.stat(chemin)
+            fichiers.append((info.st_mtime_ns, info.st_size, chemin))
+
+        taille_totale = sum(taille for _, taille, _ in fichiers)
+        fichiers.sort()  # Du plus ancien au plus récent
+
+        for _, taille, chemin in fichiers:
+            if taille_totale <= self.taille_max:
+                break
+            os.remove(chemin)
+            taille_totale -= taille
+
+    def charger_graphe(self, points=None, chemin_fichier=None, k_voisins=10, avec_matrice=True):
+        """
+        Construit un GrapheMD en passant par le cache.
+        - Démarrage à chaud : aucun prétraitement (ni lecture du texte, ni calcul de D).
+        - Démarrage à froid : lecture/construction habituelle puis enregistrement du bundle.
+
+        Args:
+            points (list): Les coordonnées des villes (si pas de fichier)
+            chemin_fichier (str): Le fichier texte source (prioritaire sur points)
+            k_voisins (int): Le nombre de voisins candidats à précalculer (0 pour aucun)
+            avec_matrice (bool): Stocker aussi la matrice D dans le bundle
+
+        Returns:
+            tuple: (graphe, cle, bundle)
+                graphe (GrapheMD): Le graphe de l'instance
+                cle (str): La clé de l'instance dans le cache
+                bundle (dict): Les tableaux du bundle (voisins, meilleur cycle...)
+        """
+        if chemin_fichier is not None:
+            cle = hash_fichier(chemin_fichier)
+        elif points is not None:
+            cle = hash_points(points)
+        else:
+            raise ValueError("Il faut fournir des points ou un chemin de fichier.")
+
+        bundle = self.charger(cle)
+        if bundle is not None:
+            coords = bundle["points"]
+            graphe = GrapheMD(len(coords), coords, D=bundle.get("D"))
+            return graphe, cle, bundle
+
+        # Démarrage à froid
+        if chemin_fichier is not None:
+            points = utils.lire_fichier_texte(chemin_fichier)
+        graphe = GrapheMD(len(points), points)
+        voisins = utils.calculer_voisins_candidats(graphe, k_voisins) if k_voisins > 0 else None
+
+        self.sauvegarder(cle, points, D=graphe.D if avec_matrice else None, voisins=voisins)
+        bundle = {"points": np.asarray(points, dtype=np.float64).reshape(-1, 2)}
+        if voisins is not None:
+            bundle["voisins"] = voisins
+        return graphe, cle, bundle
@@ -0,0 +1,201 @@
+import os
+import sys
+import csv
+import json
+import argparse
+import numpy as np
+from structures.graphe_md import GrapheMD
+import utils
+from solveur import METHODES, etapes_methode, resoudre_lot
+
+# --- BANC D'ESSAI EN LIGNE DE COMMANDE (sans interface ni matplotlib) ---
+# Exemple (depuis src/) :
+#   python cli.py --algos PPP OptPPP OptPrim --n 10 50 --instances 5 --repetitions 3 \
+#                 --json resultats.json --reference reference.json
+
+CHAMPS = ["instance", "n", "algo", "repetition", "temps_ms", "longueur", "ecart_pct"]
+
+
+# --- 1. Construction du corpus
+def construire_corpus(fichiers, tailles, nb_instances, graine, distribution):
+    """
+    Construit la liste des instances à évaluer.
+
+    Args:
+        fichiers (list): Les fichiers texte d'instances
+        tailles (list): Les tailles N des instances générées
+        nb_instances (int): Le nombre d'instances générées par taille
+        graine (int): La graine du générateur
+        distribution (str): La distribution des points générés
+
+    Returns:
+        list: Une liste de tuples (nom_instance, points)
+    """
+    corpus = []
+    for chemin in fichiers:
+        corpus.append((chemin, utils.lire_fichier_texte(chemin)))
+
+    # Une graine par taille : ajouter une taille ne change pas les instances des autres
+    for N, graine_N in zip(tailles, np.random.SeedSequence(graine).spawn(len(tailles))):
+        instances = utils.generer_instances(nb_instances, N, graine=graine_N, distribution=distribution)
+        for i, points in enumerate(instances):
+            corpus.append((f"{distribution}-n{N}-g{graine}-{i}", points))
+    return corpus
+
+
+# --- 2. Exécution
+def executer(corpus, algos, repetitions, limite_temps=None):
+    """
+    Exécute chaque algorithme (méthode du registre, voir solveur.py) sur chaque instance, plusieurs fois.
+    Le temps d'une méthode en plusieurs étapes les inclut toutes (OptPPP = PPP + 2opt).
+    L'écart (gap) est mesuré par rapport à la meilleure longueur obtenue sur l'instance
+    (la solution optimale si HDS fait partie des algorithmes).
+
+    Returns:
+        list: Les enregistrements (un dictionnaire par exécution)
+    """
+    enregistrements = []
+    for nom_instance, points in corpus:
+        graphe = GrapheMD(len(points), points)
+        lignes_instance = []
+        for algo in algos:
+            for r in range(repetitions):
+                resultat = resoudre_lot([graphe], [algo], limite_temps=limite_temps)[0][algo]
+                lignes_instance.append({
+                    "instance": nom_instance,
+                    "n": graphe.n,
+                    "algo": algo,
+                    "repetition": r,
+                    "temps_ms": resultat.temps_ms,
+                    "longueur": resultat.cout,
+                })
+            print(f"{nom_instance:<28} {algo:<8} {lignes_instance[-1]['longueur']:.4f}", file=sys.stderr)
+
+        meilleure = min(l["longueur"] for l in lignes_instance)
+        for l in lignes_instance:
+            l["ecart_pct"] = (l["longueur"] - meilleure) / meilleure * 100 if meilleure > 0 else 0.0
+        enregistrements.extend(lignes_instance)
+    return enregistrements
+
+
+# --- 3. Écriture des résultats
+def ecrire_json(chemin, enregistrements, parametres):
+    """ Écrit {"parametres", "enregistrements"} dans le fichier, ou sur la sortie standard si chemin vaut "-". """
+    document = {"parametres": parametres, "enregistrements": enregistrements}
+    if chemin == "-":
+        json.dump(document, sys.stdout, indent=1)
+        print()
+        return
+    with open(chemin, 'w') as f:
+        json.dump(document, f, indent=1)
+
+
+def lire_reference(chemin):
+    """ Lit les enregistrements d'une référence : sortie de ecrire_json, ou simple liste d'enregistrements. """
+    with open(chemin) as f:
+        document = json.load(f)
+    return document if isinstance(document, list) else document["enregistrements"]
+
+
+def ecrire_csv(chemin, enregistrements):
+    with open(chemin, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=CHAMPS)
+        writer.writeheader()
+        writer.writerows(enregistrements)
+
+
+# --- 4. Comparaison avec une référence
+def resumer(enregistrements):
+    """ Agrège les enregistrements par (instance, algo) : temps médian et longueur moyenne. """
+    groupes = {}
+    for e in enregistrements:
+        groupes.setdefault((e["instance"], e["algo"]), []).append(e)
+    return {
+        cle: (float(np.median([e["temps_ms"] for e in lignes])), float(np.mean([e["longueur"] for e in lignes])))
+        for cle, lignes in groupes.items()
+    }
+
+
+def comparer(enregistrements, reference, seuil_temps, seuil_qualite, temps_min_ms):
+    """
+    Compare un passage à une référence enregistrée.
+
+    Args:
+        enregistrements (list): Les enregistrements du passage courant
+        reference (list): Les enregistrements de la référence
+        seuil_temps (float): Ralentissement relatif toléré (0.25 = +25%)
+        seuil_qualite (float): Dégradation relative de la longueur tolérée (0.01 = +1%)
+        temps_min_ms (float): En dessous de ce temps (référence), on ne juge pas le temps (bruit)
+
+    Returns:
+        list: Les messages de régression (liste vide si aucune)
+    """
+    courant = resumer(enregistrements)
+    base = resumer(reference)
+    regressions = []
+    for cle, (temps, longueur) in sorted(courant.items()):
+        if cle not in base:
+            continue
+        temps_ref, longueur_ref = base[cle]
+        instance, algo = cle
+        if temps_ref >= temps_min_ms and temps > temps_ref * (1 + seuil_temps):
+            regressions.append(f"TEMPS   {algo:<8} {instance} : {temps_ref:.3f} ms -> {temps:.3f} ms")
+        if longueur > longueur_ref * (1 + seuil_qualite):
+            regressions.append(f"QUALITÉ {algo:<8} {instance} : {longueur_ref:.4f} -> {longueur:.4f}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Banc d'essai TSP non interactif (sorties JSON/CSV).")
+    parser.add_argument("--algos", nargs="+", default=["PPP", "OptPPP", "OptPrim"],
+                        help=f"Méthodes du registre ({', '.join(METHODES)}) ou pipelines (ex: OptPrim+2opt)")
+    parser.add_argument("--fichiers", nargs="*", default=[], help="Fichiers texte d'instances")
+    parser.add_argument("--n", nargs="*", type=int, default=[], help="Tailles des instances générées")
+    parser.add_argument("--instances", type=int, default=10, help="Nombre d'instances générées par taille")
+    parser.add_argument("--graine", type=int, default=0)
+    parser.add_argument("--distribution", choices=utils.DISTRIBUTIONS, default="uniforme")
+    parser.add_argument("--repetitions", type=int, default=1)
+    parser.add_argument("--json", help="Fichier de sortie JSON")
+    parser.add_argument("--csv", help="Fichier de sortie CSV")
+    parser.add_argument("--reference", help="Résultats JSON de référence à comparer")
+    parser.add_argument("--seuil-temps", type=float, default=0.25)
+    parser.add_argument("--seuil-qualite", type=float, default=0.01)
+    parser.add_argument("--temps-min-ms", type=float, default=1.0)
+    parser.add_argument("--limite-temps", type=float, help="Durée maximale d'une résolution (secondes)")
+    args = parser.parse_args(argv)
+
+    if not args.fichiers and not args.n:
+        parser.error("Il faut au moins un fichier (--fichiers) ou une taille (--n).")
+    for algo in args.algos:
+        try:
+            etapes_methode(algo)
+        except ValueError as e:
+            parser.error(str(e))
+
+    corpus = construire_corpus(args.fichiers, args.n, args.instances, args.graine, args.distribution)
+    enregistrements = executer(corpus, args.algos, args.repetitions, args.limite_temps)
+
+    parametres = {k: v for k, v in vars(args).items() if k not in ("json", "csv", "reference")}
+    if args.json:
+        ecrire_json(args.json, enregistrements, parametres)
+    if args.csv:
+        ecrire_csv(args.csv, enregistrements)
+    if not args.json and not args.csv:
+        ecrire_json("-", enregistrements, parametres)
+
+    if args.reference:
+        if not os.path.exists(args.reference):
+            print(f"Référence introuvable : {args.reference}", file=sys.stderr)
+            return 2
+        reference = lire_reference(args.reference)
+        regressions = comparer(enregistrements, reference, args.seuil_temps, args.seuil_qualite, args.temps_min_ms)
+        for message in regressions:
+            print(f"RÉGRESSION : {message}", file=sys.stderr)
+        if regressions:
+            return 1
+        print("Aucune régression par rapport à la référence.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
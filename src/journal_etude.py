@@ -0,0 +1,92 @@
+import os
+import json
+
+# --- JOURNAL D'ÉTUDE (Reprise après interruption) ---
+# Chaque résultat d'essai est ajouté au fichier dès qu'il est disponible (une ligne JSON),
+# puis écrit sur le disque (flush + fsync) : un Ctrl-C ou un plantage ne fait perdre
+# que l'essai en cours. La première ligne contient les paramètres de l'étude.
+
+
+class JournalEtude:
+    """
+    Journal append-only (JSON Lines) des essais d'une étude.
+
+    Attributes:
+        chemin (str): Le fichier du journal
+
+    Methods:
+        lire: Retourne l'en-tête et les enregistrements du journal.
+        ouvrir: Vérifie (ou écrit) l'en-tête et retourne les enregistrements déjà présents.
+        ajouter: Ajoute un enregistrement et l'écrit immédiatement sur le disque.
+    """
+
+    def __init__(self, chemin):
+        self.chemin = chemin
+        self._fichier = None
+
+    def _lire_lignes(self):
+        """ Retourne les lignes valides et la taille (octets) de la partie valide du fichier. """
+        lignes, taille_valide = [], 0
+        if not os.path.exists(self.chemin):
+            return lignes, taille_valide
+        with open(self.chemin, 'rb') as f:
+            for ligne in f:
+                # Une dernière ligne incomplète (écriture interrompue) est ignorée
+                if not ligne.endswith(b"\n"):
+                    break
+                try:
+                    lignes.append(json.loads(ligne))
+                except json.JSONDecodeError:
+                    break
+                taille_valide += len(ligne)
+        return lignes, taille_valide
+
+    def lire(self):
+        """
+        Lit le journal.
+
+        Returns:
+            tuple: (entete, enregistrements) ; (None, []) si le fichier n'existe pas ou est vide
+        """
+        lignes, _ = self._lire_lignes()
+        if not lignes:
+            return None, []
+        return lignes[0], lignes[1:]
+
+    def ouvrir(self, parametres, cles_compatibles):
+        """
+        Ouvre le journal en ajout. S'il existe déjà, ses paramètres doivent être compatibles
+        avec ceux de l'étude (mêmes valeurs pour cles_compatibles) : on reprend alors l'étude.
+
+        Args:
+            parametres (dict): Les paramètres de l'étude (écrits en en-tête d'un nouveau journal)
+            cles_compatibles (tuple): Les paramètres qui doivent être identiques pour reprendre
+
+        Returns:
+            tuple: (entete, enregistrements) ; l'en-tête est celui du journal existant s'il y en a un
+        """
+        lignes, taille_valide = self._lire_lignes()
+        entete, enregistrements = (lignes[0], lignes[1:]) if lignes else (None, [])
+        if entete is not None:
+            differents = [c for c in cles_compatibles if entete.get(c) != parametres.get(c)]
+            if differents:
+                raise ValueError(f"Le journal {self.chemin} a été produit avec d'autres paramètres : "
+                                 f"{', '.join(differents)}")
+        self._fichier = open(self.chemin, 'a', encoding='utf-8')
+        # On retire une éventuelle ligne incomplète avant d'ajouter à la suite
+        self._fichier.truncate(taille_valide)
+        if entete is None:
+            entete = parametres
+            self.ajouter(entete)
+        return entete, enregistrements
+
+    def ajouter(self, enregistrement):
+        """ Ajoute un enregistrement (une ligne JSON) et l'écrit immédiatement sur le disque. """
+        self._fichier.write(json.dumps(enregistrement) + "\n")
+        self._fichier.flush()
+        os.fsync(self._fichier.fileno())
+
+    def fermer(self):
+        if self._fichier is not None:
+            self._fichier.close()
+            self._fichier = None
@@ -1,28 +1,33 @@
 import os
 import sys
 from structures.graphe_md import GrapheMD
+from cache_instances import CacheInstances
 import utils
 
-# Importation des modules d'affichage et de stats
-from plot import afficher_comparaison, afficher_graphe_complet
+# Les modules d'affichage (plot) et de stats (statistics) chargent matplotlib (~0.5 s) :
+# ils ne sont importés que lorsque la fonctionnalité est utilisée (voir mode_demo et main)
 
-from statistics import lancer_etude_statistique , etude_evolution_N
-
-# Importation des algorithmes
-from algos.algo_ppp import algo_ppp
-from algos.opt_ppp import opt_ppp
-from algos.opt_prim import opt_prim
-from algos.hds import hds as algo_hds
+# Les algorithmes passent par le registre du solveur
+from solveur import resoudre
 
 def mode_demo():
+    from plot import afficher_comparaison, afficher_graphe_complet
+
     print("\n--- MODE DÉMONSTRATION (Visualisation) ---")
     choix = input("1. Points aléatoires\n2. Fichier texte\nChoix : ")
     
     points = []
+    graphe = None
+    cache, cle = None, None
     if choix == '2':
         chemin = input("Chemin du fichier (ex: data/exemple.txt) : ")
         if os.path.exists(chemin):
-            points = utils.lire_fichier_texte(chemin)
+            # Passage par le cache : pas de relecture ni de recalcul si le fichier n'a pas changé
+            cache = CacheInstances()
+            graphe, cle, bundle = cache.charger_graphe(chemin_fichier=chemin)
+            points = graphe.points
+            if "longueur" in bundle:
+                print(f"Meilleur coût connu pour cette instance : {float(bundle['longueur']):.4f}")
         else:
             print("Fichier introuvable. Génération aléatoire par défaut.")
             points = utils.generer_points_aleatoires(10)
@@ -33,57 +38,96 @@ def mode_demo():
         points = utils.generer_points_aleatoires(n_val)
 
     # Création du graphe
-    graphe = GrapheMD(len(points), points)
+    if graphe is None:
+        graphe = GrapheMD(len(points), points)
     
     # Affichage du graphe complet si N est petit
     if len(points) <= 20:
         print("Affichage du graphe complet...")
         afficher_graphe_complet(graphe)
 
-    # Exécution des algos
+    # Exécution des algos : l'échec d'une méthode n'empêche pas d'afficher les autres
     resultats = []
-    algos = [
-        ("PPP", lambda g: algo_ppp(g)),
-        ("OptPPP", lambda g: opt_ppp(algo_ppp(g), g)),
-        ("OptPrim", lambda g: opt_prim(g)),
-        ("HDS", lambda g: algo_hds(g))
-    ]
+    methodes = ["PPP", "OptPPP", "OptPrim", "HDS"]
 
     print("\nCalcul en cours...")
-    for nom, func in algos:
+    for nom in methodes:
         try:
-            c = func(graphe)
-            l = utils.calculer_longueur_cycle(c, graphe)
-            resultats.append((nom, c, l))
-            print(f" -> {nom} terminé (Coût: {l:.4f})")
+            r = resoudre(graphe, nom)
         except Exception as e:
-            print(f"Erreur {nom}: {e}")
+            print(f" -> {nom} : erreur ({e})")
+            continue
+        resultats.append((nom, r.cycle, r.cout))
+        print(f" -> {nom} terminé (Coût: {r.cout:.4f})")
+
+    # Mise à jour du meilleur cycle connu dans le cache
+    if cache is not None and resultats:
+        _, meilleur_cycle, meilleur_cout = min(resultats, key=lambda r: r[2])
+        cache.enregistrer_meilleur_cycle(cle, meilleur_cycle, meilleur_cout)
 
     # Affichage final
     afficher_comparaison(points, resultats)
 
+# Résultats mémorisés entre deux études (réutilisés si la graine est fixée)
+FICHIER_MEMO = ".memo_tsp.sqlite"
+
+def memo_pour(graine):
+    """ Une graine aléatoire ne redonne jamais les mêmes instances : le mémo ne ferait que grossir. """
+    return FICHIER_MEMO if graine is not None else None
+
+def demander_graine():
+    """ Une graine fixée permet de rejouer l'étude et de réutiliser les résultats mémorisés. """
+    saisie = input("Graine (vide = aléatoire) : ")
+    return int(saisie) if saisie else None
+
+def demander_journal():
+    """ Un journal permet de reprendre une étude interrompue (Ctrl-C, plantage) et de la retracer. """
+    saisie = input("Fichier journal (vide = aucun, fichier existant = reprise) : ")
+    return saisie or None
+
+def demander_memoire():
+    """ Le pic mémoire demande de relancer chaque algorithme sous tracemalloc (étude au moins deux fois plus longue). """
+    return input("Mesurer le pic mémoire (o/N) : ").strip().lower() == 'o'
+
 def main():
     while True:
         print("\n=== PROJET TSP : MENU PRINCIPAL ===")
         print("1. Démonstration Visuelle (1 seul graphe)")
         print("2. Étude Statistique (100 essais - Demande Prof)")
         print("3. Étude de l'évolution en fonction de N")
-        print("4. Quitter")
+        print("4. Retracer une étude depuis son journal")
+        print("5. Quitter")
         
         choix = input("Votre choix : ")
         
         if choix == '1':
             mode_demo()
         elif choix == '2':
+            from statistics import lancer_etude_statistique
             try:
                 N = int(input("Taille des graphes N (conseil: 10) : ") or 10)
-                lancer_etude_statistique(N=N, nb_essais=100)
-            except ValueError:
-                print("Valeur incorrecte.")
+                nb_workers = int(input(f"Nombre de processus (1 à {os.cpu_count()}, défaut: 1) : ") or 1)
+                graine = demander_graine()
+                journal = demander_journal()
+                lancer_etude_statistique(N=N, nb_essais=100, nb_workers=nb_workers, graine=graine, memo=memo_pour(graine),
+                                         journal=journal, mesurer_memoire=demander_memoire())
+            except ValueError as e:
+                print(f"Valeur incorrecte. {e}")
         elif choix == '3':
-            # Lance la nouvelle fonction
-            etude_evolution_N()
+            from statistics import etude_evolution_N
+            try:
+                graine = demander_graine()
+                etude_evolution_N(graine=graine, memo=memo_pour(graine), journal=demander_journal(),
+                                  mesurer_memoire=demander_memoire())
+            except ValueError as e:
+                print(f"Valeur incorrecte. {e}")
         elif choix == '4':
+            from statistics import retracer_depuis_journal
+            try:
+                retracer_depuis_journal(input("Fichier journal : "))
+            except ValueError as e:
+                print(e)
+        elif choix == '5':
             break
         else:
             print("Choix invalide.")
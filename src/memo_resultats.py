@@ -0,0 +1,194 @@
+import sys
+import json
+import sqlite3
+import hashlib
+import importlib
+
+# --- MÉMOÏSATION DES RÉSULTATS (SQLite) ---
+# Un résultat (cycle, longueur, mesures) est identifié par :
+#   - le hash de l'instance (cache_instances.hash_points)
+#   - le nom de l'algorithme
+#   - ses paramètres (sérialisés en JSON)
+# et il est étiqueté par la version du code de l'algorithme (hash de ses fichiers sources) :
+# dès que ce code change, les anciens résultats ne sont plus réutilisés.
+
+# Modules dont dépend chaque étape des méthodes du solveur (leur contenu définit la version).
+# Une méthode (ex: OptPPP = PPP+2opt) est versionnée par les modules de ses propres étapes :
+# modifier le registre (solveur.py) ou une autre étape n'invalide pas ses résultats.
+# Chaque étape de solveur.CONSTRUCTEURS et solveur.AMELIORATIONS doit y figurer : version_algo
+# refuse une étape sans sources (ses résultats survivraient à toute modification de son code).
+SOURCES_ETAPES = {
+    # Constructions
+    "PPP": ["algos.algo_ppp"],
+    "OptPrim": ["algos.opt_prim", "utils", "structures.tas", "structures.tas_indexe", "structures.graphe_tl"],
+    "Hilbert": ["algos.algo_hilbert"],
+    "HDS": ["algos.hds", "structures.noeud_exploration", "structures.tas_indexe"],
+    "Glouton": ["algos.algo_glouton", "structures.union_find", "utils"],
+    # Zones résolues par OptPPP (PPP+2opt) et raccordées par 2-opt fenêtré
+    "Decomposition": ["algos.decomposition", "algos.algo_hilbert", "algos.algo_ppp", "algos.opt_ppp"],
+    # Départs PPP, OptPrim et aléatoire
+    "ILS": ["algos.ils", "utils", "algos.algo_ppp", "algos.opt_prim", "structures.tas", "structures.tas_indexe",
+            "structures.graphe_tl"],
+    # Améliorations
+    "2opt": ["algos.opt_ppp"],
+    "ils": ["algos.ils", "utils"],
+    "recuit": ["algos.recuit", "utils"],
+}
+
+_versions = {}
+
+
+def version_algo(algo):
+    """
+    Calcule la version du code d'un algorithme : hash de ses étapes et du contenu
+    des fichiers sources de chacune (SOURCES_ETAPES).
+
+    Args:
+        algo (str): Le nom de la méthode (ex: "OptPPP", "OptPrim+2opt")
+
+    Returns:
+        str: Le hash hexadécimal (sha1) des sources
+
+    Raises:
+        ValueError: Si la méthode est inconnue ou si une de ses étapes n'a pas de sources déclarées
+            (ses résultats mémorisés ne seraient jamais invalidés)
+    """
+    if algo not in _versions:
+        from solveur import etapes_methode
+        etapes = etapes_methode(algo)
+        sans_sources = [etape for etape in etapes if not SOURCES_ETAPES.get(etape)]
+        if sans_sources:
+            raise ValueError(f"Étape(s) sans sources déclarées dans SOURCES_ETAPES : {', '.join(sans_sources)} "
+                             f"(impossible de versionner les résultats de {algo})")
+        h = hashlib.sha1("+".join(etapes).encode())
+        for etape in etapes:
+            for nom_module in SOURCES_ETAPES[etape]:
+                module = importlib.import_module(nom_module)
+                with open(module.__file__, 'rb') as f:
+                    h.update(f.read())
+        _versions[algo] = h.hexdigest()
+    return _versions[algo]
+
+
+class MemoResultats:
+    """
+    Magasin persistant de résultats d'algorithmes, partagé entre les études.
+
+    Attributes:
+        chemin (str): Le fichier SQLite
+
+    Methods:
+        chercher: Retourne le résultat mémorisé (s'il est à jour) ou None.
+        enregistrer: Mémorise un résultat.
+        invalider: Supprime les résultats d'un algorithme (ou tous).
+        purger_obsoletes: Supprime les résultats produits par une ancienne version du code.
+        fermer: Ferme la connexion (appelée aussi en sortie de with).
+    """
+
+    def __init__(self, chemin=".memo_tsp.sqlite"):
+        self.chemin = chemin
+        self.connexion = sqlite3.connect(chemin)
+        self.connexion.execute("""
+            CREATE TABLE IF NOT EXISTS resultats (
+                instance TEXT NOT NULL,
+                algo TEXT NOT NULL,
+                params TEXT NOT NULL,
+                version TEXT NOT NULL,
+                cycle TEXT NOT NULL,
+                longueur REAL NOT NULL,
+                mesures TEXT NOT NULL,
+                PRIMARY KEY (instance, algo, params)
+            )""")
+        self.connexion.commit()
+
+    @staticmethod
+    def _params(params):
+        return json.dumps(params or {}, sort_keys=True)
+
+    def chercher(self, instance, algo, params=None):
+        """
+        Retourne le résultat mémorisé pour (instance, algo, params), s'il a été produit
+        par la version actuelle du code de l'algorithme.
+
+        Returns:
+            dict | None: {"cycle": ..., "longueur": ..., "mesures": ...} ou None
+        """
+        ligne = self.connexion.execute(
+            "SELECT cycle, longueur, mesures FROM resultats "
+            "WHERE instance = ? AND algo = ? AND params = ? AND version = ?",
+            (instance, algo, self._params(params), version_algo(algo))).fetchone()
+        if ligne is None:
+            return None
+        return {"cycle": json.loads(ligne[0]), "longueur": ligne[1], "mesures": json.loads(ligne[2])}
+
+    def enregistrer(self, instance, algo, cycle, longueur, mesures, params=None):
+        """ Mémorise (ou remplace) le résultat de algo sur instance. """
+        self.connexion.execute(
+            "INSERT OR REPLACE INTO resultats VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (instance, algo, self._params(params), version_algo(algo),
+             json.dumps([int(v) for v in cycle]), float(longueur), json.dumps(mesures)))
+        self.connexion.commit()
+
+    def invalider(self, algo=None):
+        """
+        Supprime les résultats d'un algorithme, ou tous les résultats si algo est None.
+
+        Returns:
+            int: Le nombre de résultats supprimés
+        """
+        if algo is None:
+            curseur = self.connexion.execute("DELETE FROM resultats")
+        else:
+            curseur = self.connexion.execute("DELETE FROM resultats WHERE algo = ?", (algo,))
+        self.connexion.commit()
+        return curseur.rowcount
+
+    def purger_obsoletes(self):
+        """
+        Supprime les résultats produits par une version du code qui n'est plus l'actuelle,
+        ainsi que ceux des méthodes qui ne peuvent plus être versionnées (retirées du registre).
+
+        Returns:
+            int: Le nombre de résultats supprimés
+        """
+        total = 0
+        for (algo,) in self.connexion.execute("SELECT DISTINCT algo FROM resultats").fetchall():
+            try:
+                version = version_algo(algo)
+            except ValueError:
+                version = None
+            curseur = self.connexion.execute("DELETE FROM resultats WHERE algo = ? AND version IS NOT ?",
+                                             (algo, version))
+            total += curseur.rowcount
+        self.connexion.commit()
+        return total
+
+    def fermer(self):
+        self.connexion.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
+
+
+if __name__ == "__main__":
+    # Exemples (depuis src/) :
+    #   python memo_resultats.py --purger            (supprime les résultats d'anciennes versions)
+    #   python memo_resultats.py --invalider HDS     (supprime tous les résultats de HDS)
+    import argparse
+    parser = argparse.ArgumentParser(description="Gestion du magasin de résultats mémorisés.")
+    parser.add_argument("--chemin", default=".memo_tsp.sqlite")
+    parser.add_argument("--invalider", nargs="?", const="*", metavar="ALGO",
+                        help="Supprime les résultats d'un algorithme (tous si ALGO est omis)")
+    parser.add_argument("--purger", action="store_true", help="Supprime les résultats obsolètes")
+    args = parser.parse_args()
+
+    with MemoResultats(args.chemin) as memo:
+        if args.invalider:
+            n = memo.invalider(None if args.invalider == "*" else args.invalider)
+            print(f"{n} résultat(s) invalidé(s).")
+        if args.purger:
+            print(f"{memo.purger_obsoletes()} résultat(s) obsolète(s) supprimé(s).")
+    sys.exit(0)
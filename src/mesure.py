@@ -0,0 +1,107 @@
+import time
+import tracemalloc
+import numpy as np
+
+# --- COUCHE DE MESURE (Temps mur, temps CPU, mémoire) ---
+# time.time() autour d'un seul appel ne suffit pas pour les algorithmes rapides
+# (PPP à N=10 prend quelques dizaines de microsecondes) : on utilise des horloges
+# en nanosecondes et on répète automatiquement les appels trop courts.
+
+
+class Mesure:
+    """
+    Résultat d'une mesure.
+
+    Attributes:
+        resultat: La valeur retournée par la fonction mesurée
+        temps_ms (float): Temps mur moyen par appel (ms)
+        cpu_ms (float): Temps CPU moyen par appel (ms)
+        repetitions (int): Le nombre d'appels chronométrés
+        memoire_ko (float | None): Pic de mémoire allouée pendant un appel (Ko), None si non mesuré
+    """
+
+    def __init__(self, resultat, temps_ms, cpu_ms, repetitions, memoire_ko=None):
+        self.resultat = resultat
+        self.temps_ms = temps_ms
+        self.cpu_ms = cpu_ms
+        self.repetitions = repetitions
+        self.memoire_ko = memoire_ko
+
+    def vers_dict(self):
+        """ Les grandeurs mesurées (sans le résultat), sous forme sérialisable. """
+        return {"temps_ms": self.temps_ms, "cpu_ms": self.cpu_ms,
+                "repetitions": self.repetitions, "memoire_ko": self.memoire_ko}
+
+
+def mesurer(fonction, *args, duree_min_ms=5.0, repetitions_max=10000, memoire=True):
+    """
+    Mesure une fonction avec perf_counter_ns (temps mur) et process_time_ns (temps CPU).
+
+    Principe :
+        1. Un premier appel sert de sonde (et d'échauffement)
+        2. S'il dure moins de duree_min_ms, il est écarté et la fonction est rappelée
+           jusqu'à cumuler duree_min_ms : on retourne le temps moyen par appel
+        3. Sinon (appel long), la sonde est gardée telle quelle : pas de surcoût
+        4. Le pic mémoire est mesuré par tracemalloc sur un appel séparé,
+           pour que le traçage ne fausse pas les temps
+
+    Args:
+        fonction (callable): La fonction à mesurer
+        *args: Ses arguments
+        duree_min_ms (float): La durée cumulée minimale des appels chronométrés
+        repetitions_max (int): Le nombre maximal d'appels chronométrés
+        memoire (bool): Mesurer aussi le pic mémoire
+
+    Returns:
+        Mesure: Le résultat du dernier appel et les grandeurs mesurées
+    """
+    duree_min_ns = duree_min_ms * 1e6
+
+    # 1. Sonde
+    m0, c0 = time.perf_counter_ns(), time.process_time_ns()
+    resultat = fonction(*args)
+    mur_ns, cpu_ns = time.perf_counter_ns() - m0, time.process_time_ns() - c0
+    repetitions = 1
+
+    # 2. Répétition automatique des appels courts (la sonde sert d'échauffement)
+    if mur_ns < duree_min_ns:
+        mur_ns, cpu_ns, repetitions = 0, 0, 0
+        while mur_ns < duree_min_ns and repetitions < repetitions_max:
+            m0, c0 = time.perf_counter_ns(), time.process_time_ns()
+            resultat = fonction(*args)
+            mur_ns += time.perf_counter_ns() - m0
+            cpu_ns += time.process_time_ns() - c0
+            repetitions += 1
+
+    # 3. Pic mémoire
+    memoire_ko = None
+    if memoire:
+        deja_actif = tracemalloc.is_tracing()
+        if not deja_actif:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        fonction(*args)
+        _, pic = tracemalloc.get_traced_memory()
+        if not deja_actif:
+            tracemalloc.stop()
+        memoire_ko = (pic - base) / 1024
+
+    return Mesure(resultat, mur_ns / repetitions / 1e6, cpu_ns / repetitions / 1e6, repetitions, memoire_ko)
+
+
+def resumer_distribution(valeurs, percentiles=(50, 95)):
+    """
+    Résume une série de mesures : moyenne et percentiles.
+
+    Args:
+        valeurs (list): Les valeurs mesurées
+        percentiles (tuple): Les percentiles à calculer
+
+    Returns:
+        dict: {"moyenne": ..., "p50": ..., "p95": ...}
+    """
+    resume = {"moyenne": float(np.mean(valeurs))}
+    for p, v in zip(percentiles, np.percentile(valeurs, percentiles)):
+        resume[f"p{p}"] = float(v)
+    return resume
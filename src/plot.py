@@ -1,12 +1,55 @@
-import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection
+
+# pyplot (et le choix d'un backend interactif) n'est importé que pour les affichages
+# en fenêtre : le rendu dans un fichier passe directement par Figure.
+
+# Au-delà de ces tailles, le rendu coûte plus cher que la résolution :
+# on n'écrit plus les numéros des villes et on n'affiche qu'un sous-ensemble des points
+# (le cycle, lui, est toujours tracé en entier, en un seul LineCollection).
+SEUIL_ETIQUETTES = 200
+MAX_POINTS_AFFICHES = 20000
+
+
+def _dessiner_villes(ax, P, taille, seuil_etiquettes, max_points):
+    """ Dessine les villes (décimées au-delà de max_points) et leurs numéros (jusqu'à seuil_etiquettes). """
+    n = len(P)
+    pas = max(1, -(-n // max_points))
+    ax.scatter(P[::pas, 0], P[::pas, 1], c='red', s=taille if n <= seuil_etiquettes else 1, zorder=3,
+               rasterized=n > max_points)
+    if n <= seuil_etiquettes:
+        for i, (px, py) in enumerate(P):
+            ax.annotate(str(i), (px, py), xytext=(5, 5), textcoords='offset points')
+
+
+def _dessiner_cycle(ax, P, cycle):
+    """ Dessine le cycle (arête de retour comprise) en un seul LineCollection. """
+    ordre = np.asarray(cycle, dtype=np.int64)
+    segments = np.stack((P[ordre], P[np.roll(ordre, -1)]), axis=1)
+    largeur = 1.5 if len(ordre) <= SEUIL_ETIQUETTES else 0.3
+    ax.add_collection(LineCollection(segments, colors='b', alpha=0.7, linewidths=largeur,
+                                     rasterized=len(ordre) > MAX_POINTS_AFFICHES))
+    ax.autoscale_view()
+
 
 # --- FONCTION D'AFFICHAGE GRAPHIQUE ---
-def afficher_comparaison(points, resultats):
+def afficher_comparaison(points, resultats, chemin=None, seuil_etiquettes=SEUIL_ETIQUETTES,
+                         max_points=MAX_POINTS_AFFICHES):
     """
     Affiche une grille avec :
     1. Les points initiaux
     2. Le résultat de chaque algorithme
+
+    Args:
+        points (list | numpy.ndarray): Les coordonnées des villes
+        resultats (list): Les tuples (nom, cycle, cout) à afficher
+        chemin (str): Si fourni, la figure est enregistrée dans ce fichier (PNG, SVG...)
+            sans passer par une fenêtre : utilisable sur un serveur sans affichage
+        seuil_etiquettes (int): Au-delà de ce nombre de villes, les numéros ne sont pas affichés
+        max_points (int): Au-delà de ce nombre de villes, les points affichés sont décimés
     """
+    P = np.asarray(points, dtype=np.float64).reshape(-1, 2)
     n_algos = len(resultats)
     # On prévoit 1 plot pour l'initial + n_algos plots
     total_plots = n_algos + 1
@@ -15,39 +58,29 @@ def afficher_comparaison(points, resultats):
     cols = 3
     rows = (total_plots // cols) + (1 if total_plots % cols != 0 else 0)
     
-    fig, axes = plt.subplots(rows, cols, figsize=(15, 10))
-    # Aplatir le tableau d'axes pour itérer facilement (qu'il soit 1D ou 2D)
+    # Sans fenêtre : Figure construite directement (moteur Agg/SVG, non interactif)
+    if chemin is not None:
+        fig = Figure(figsize=(15, 10))
+        axes = fig.subplots(rows, cols, squeeze=False)
+    else:
+        import matplotlib.pyplot as plt
+        fig, axes = plt.subplots(rows, cols, figsize=(15, 10), squeeze=False)
+    # Aplatir le tableau d'axes pour itérer facilement
     axes = axes.flatten()
     
     # --- PLOT 1 : Configuration Initiale ---
     ax_init = axes[0]
-    x = [p[0] for p in points]
-    y = [p[1] for p in points]
-    ax_init.scatter(x, y, c='red', s=50)
-    for i, (px, py) in enumerate(points):
-        ax_init.annotate(str(i), (px, py), xytext=(5, 5), textcoords='offset points')
-    ax_init.set_title(f"Configuration Initiale\n({len(points)} villes)")
+    _dessiner_villes(ax_init, P, 50, seuil_etiquettes, max_points)
+    ax_init.set_title(f"Configuration Initiale\n({len(P)} villes)")
     ax_init.set_aspect('equal')
 
     # --- PLOT 2 à N : Les Algorithmes ---
     for i, (nom, cycle, cout) in enumerate(resultats):
         ax = axes[i + 1] # On commence à l'index 1
         
-        # Coordonnées dans l'ordre du cycle
-        x_cycle = [points[j][0] for j in cycle]
-        y_cycle = [points[j][1] for j in cycle]
-        
-        # Fermer la boucle
-        x_cycle.append(x_cycle[0])
-        y_cycle.append(y_cycle[0])
-        
-        # Dessiner
-        ax.plot(x_cycle, y_cycle, 'b-', alpha=0.7) # Lignes bleues
-        ax.scatter([p[0] for p in points], [p[1] for p in points], c='red', s=30) # Points rouges
-        
-        # Numéros
-        for idx, (px, py) in enumerate(points):
-            ax.annotate(str(idx), (px, py), xytext=(5, 5), textcoords='offset points')
+        # Dessiner : lignes bleues (cycle fermé), points rouges et numéros
+        _dessiner_cycle(ax, P, cycle)
+        _dessiner_villes(ax, P, 30, seuil_etiquettes, max_points)
             
         ax.set_title(f"{nom}\nCoût: {cout:.4f}")
         ax.set_aspect('equal')
@@ -56,8 +89,37 @@ def afficher_comparaison(points, resultats):
     for j in range(total_plots, len(axes)):
         axes[j].axis('off')
 
-    plt.tight_layout()
-    plt.show()
+    fig.tight_layout()
+    if chemin is not None:
+        fig.savefig(chemin)
+    else:
+        plt.show()
+
+
+def enregistrer_cycle(points, cycle, chemin, titre=None, taille_pouces=8, dpi=150):
+    """
+    Rend un seul cycle dans un fichier (PNG, SVG...), sans fenêtre ni numéros.
+    Prévu pour les très grandes instances (100 000 villes en environ une seconde).
+
+    Args:
+        points (list | numpy.ndarray): Les coordonnées des villes
+        cycle (list | numpy.ndarray): L'ordre de visite
+        chemin (str): Le fichier de sortie (format déduit de l'extension)
+        titre (str): Le titre de la figure
+        taille_pouces (float): La taille (carrée) de la figure
+        dpi (int): La résolution des formats matriciels
+    """
+    P = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    fig = Figure(figsize=(taille_pouces, taille_pouces))
+    ax = fig.add_subplot()
+    _dessiner_cycle(ax, P, cycle)
+    if len(P) <= SEUIL_ETIQUETTES:
+        _dessiner_villes(ax, P, 30, SEUIL_ETIQUETTES, MAX_POINTS_AFFICHES)
+    ax.set_aspect('equal')
+    ax.axis('off')
+    if titre:
+        ax.set_title(titre)
+    fig.savefig(chemin, dpi=dpi)
 
 
 def afficher_graphe_complet(graphe):
@@ -65,6 +127,8 @@ def afficher_graphe_complet(graphe):
     Affiche le graphe complet avec tous les arcs et leurs coûts.
     Attention : À utiliser seulement pour N petit (<= 10) sinon c'est illisible.
     """
+    import matplotlib.pyplot as plt
+
     points = graphe.points
     n = graphe.n
     D = graphe.D
@@ -103,89 +167,3 @@ def afficher_graphe_complet(graphe):
     plt.title(f"Graphe Complet ({n} villes)\n{n*(n-1)//2} Arcs")
     plt.axis('off') # On cache les axes X/Y pour faire plus propre
     plt.show()
-
-
-import matplotlib.pyplot as plt
-
-def afficher_comparaison(points, resultats):
-    """
-    Affiche une grille avec les points initiaux et le résultat de chaque algo.
-    """
-    n_algos = len(resultats)
-    total_plots = n_algos + 1
-    
-    cols = 3
-    rows = (total_plots // cols) + (1 if total_plots % cols != 0 else 0)
-    
-    fig, axes = plt.subplots(rows, cols, figsize=(15, 10))
-    axes = axes.flatten()
-    
-    # --- PLOT 1 : Configuration Initiale ---
-    ax_init = axes[0]
-    x = [p[0] for p in points]
-    y = [p[1] for p in points]
-    ax_init.scatter(x, y, c='red', s=50)
-    for i, (px, py) in enumerate(points):
-        ax_init.annotate(str(i), (px, py), xytext=(5, 5), textcoords='offset points')
-    ax_init.set_title(f"Configuration Initiale\n({len(points)} villes)")
-    ax_init.set_aspect('equal')
-
-    # --- PLOT 2 à N : Les Algorithmes ---
-    for i, (nom, cycle, cout) in enumerate(resultats):
-        ax = axes[i + 1]
-        
-        x_cycle = [points[j][0] for j in cycle]
-        y_cycle = [points[j][1] for j in cycle]
-        x_cycle.append(x_cycle[0])
-        y_cycle.append(y_cycle[0])
-        
-        ax.plot(x_cycle, y_cycle, 'b-', alpha=0.7)
-        ax.scatter([p[0] for p in points], [p[1] for p in points], c='red', s=30)
-        
-        for idx, (px, py) in enumerate(points):
-            ax.annotate(str(idx), (px, py), xytext=(5, 5), textcoords='offset points')
-            
-        ax.set_title(f"{nom}\nCoût: {cout:.4f}")
-        ax.set_aspect('equal')
-
-    for j in range(total_plots, len(axes)):
-        axes[j].axis('off')
-
-    plt.tight_layout()
-    plt.show()
-
-def afficher_graphe_complet(graphe):
-    """
-    Affiche le graphe complet avec tous les arcs et leurs coûts.
-    """
-    points = graphe.points
-    n = graphe.n
-    D = graphe.D
-    
-    plt.figure(figsize=(10, 10))
-    
-    # Arêtes
-    for i in range(n):
-        for j in range(i + 1, n):
-            p1 = points[i]
-            p2 = points[j]
-            cout = D[i][j]
-            plt.plot([p1[0], p2[0]], [p1[1], p2[1]], c='gray', alpha=0.3, linewidth=0.5)
-            
-            mid_x = (p1[0] + p2[0]) / 2
-            mid_y = (p1[1] + p2[1]) / 2
-            plt.text(mid_x, mid_y, f"{cout:.2f}", fontsize=8, color='blue', 
-                     ha='center', va='center', bbox=dict(facecolor='white', edgecolor='none', alpha=0.7))
-
-    # Sommets
-    x = [p[0] for p in points]
-    y = [p[1] for p in points]
-    plt.scatter(x, y, c='red', s=100, zorder=5)
-    
-    for i, (px, py) in enumerate(points):
-        plt.annotate(str(i), (px, py), xytext=(0, 0), textcoords='offset points',
-                     ha='center', va='center', color='white', weight='bold')
-
-    plt.title(f"Graphe Complet ({n} villes)\n{n*(n-1)//2} Arcs")
-    plt.axis('off')
-    plt.show()
\ No newline at end of file
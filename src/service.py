@@ -0,0 +1,307 @@
+import sys
+import json
+import time
+import asyncio
+import hashlib
+import argparse
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+# --- SERVICE LOCAL DE RÉSOLUTION (HTTP/JSON sur localhost) ---
+# Un seul processus long remplace les appels de scripts à chaque requête :
+# l'interpréteur, les imports et les graphes récents restent chauds dans les processus du pool.
+#
+#   POST /resoudre  {"points": [[x, y], ...], "methode": "OptPPP", "limite_temps": 1.0,
+#                    "graine": 0, "id": "tournee-42"}
+#       -> {"cle", "cycle", "cout", "methode", "temps_ms", "temps_etapes", "stats",
+#           "graphe_ms", "attente_ms", "total_ms", "cache", "partage"}
+#   POST /annuler   {"id": "tournee-42"}  ou  {"cle": "..."}
+#   GET  /etat      -> compteurs du service
+#
+# Exemple (depuis src/) :
+#   python service.py --port 8765 --workers 4
+#   curl -s localhost:8765/resoudre -d '{"points": [[0,0],[1,0],[1,1],[0,1]], "methode": "OptPPP"}'
+
+TAILLE_MAX_CORPS = 64 * 1024 * 1024
+
+
+# --- 1. Côté processus du pool
+_graphes = OrderedDict()  # Graphes récents du processus (hash des points -> GrapheMD)
+GRAPHES_MAX = 16
+
+
+def _initialiser_travailleur():
+    """ Importe le solveur et l'exécute une fois : les requêtes suivantes trouvent un processus chaud. """
+    from solveur import resoudre
+    resoudre([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]], "OptPPP")
+
+
+def _resoudre_travailleur(points, hash_instance, methode, limite_temps, graine):
+    """
+    Résout une requête dans un processus du pool. Le graphe d'une instance déjà vue
+    (même hash) est réutilisé au lieu d'être reconstruit.
+
+    Returns:
+        dict: Le résultat (Resultat.vers_dict) complété par graphe_ms
+    """
+    from solveur import resoudre, etapes_methode, SANS_MATRICE
+    from structures.graphe_md import GrapheMD
+
+    t0 = time.perf_counter_ns()
+    avec_matrice = any(e not in SANS_MATRICE for e in etapes_methode(methode))
+    graphe = _graphes.get(hash_instance)
+    if graphe is None or (avec_matrice and graphe.D is None):
+        graphe = GrapheMD(len(points), points, avec_matrice=avec_matrice)
+        _graphes[hash_instance] = graphe
+        if len(_graphes) > GRAPHES_MAX:
+            _graphes.popitem(last=False)
+    _graphes.move_to_end(hash_instance)
+    graphe_ms = (time.perf_counter_ns() - t0) / 1e6
+
+    resultat = resoudre(graphe, methode, limite_temps=limite_temps, graine=graine).vers_dict()
+    resultat["graphe_ms"] = graphe_ms
+    return resultat
+
+
+# --- 2. Côté service
+class ServiceResolution:
+    """
+    Service asynchrone : file de requêtes vers un pool de processus, avec déduplication
+    des requêtes identiques en cours, cache des résultats et annulation.
+
+    Attributes:
+        nb_workers (int): Le nombre de processus du pool
+        taille_cache (int): Le nombre maximal de résultats gardés en cache
+        compteurs (dict): Les compteurs du service (requêtes, cache, partages, annulations...)
+
+    Methods:
+        resoudre: Résout une requête (ou partage/réutilise un calcul identique).
+        annuler: Annule un calcul en cours, par identifiant de requête ou par clé.
+    """
+
+    def __init__(self, nb_workers=2, taille_cache=1024):
+        self.nb_workers = nb_workers
+        self.taille_cache = taille_cache
+        self.pool = ProcessPoolExecutor(max_workers=nb_workers, initializer=_initialiser_travailleur)
+        self.cache = OrderedDict()   # cle -> résultat
+        self.en_cours = {}           # cle -> [tâche asyncio, nombre de clients en attente]
+        self.identifiants = {}       # id de requête -> cle
+        self.compteurs = {"requetes": 0, "calculs": 0, "cache": 0, "partages": 0,
+                          "annulations": 0, "erreurs": 0}
+
+    @staticmethod
+    def calculer_cle(hash_instance, methode, limite_temps, graine):
+        """ La clé d'un calcul : mêmes points, même méthode, mêmes paramètres. """
+        texte = json.dumps([hash_instance, methode, limite_temps, graine])
+        return hashlib.sha1(texte.encode()).hexdigest()
+
+    async def _calculer(self, cle, points, hash_instance, methode, limite_temps, graine):
+        boucle = asyncio.get_running_loop()
+        self.compteurs["calculs"] += 1
+        try:
+            resultat = await boucle.run_in_executor(self.pool, _resoudre_travailleur, points, hash_instance,
+                                                    methode, limite_temps, graine)
+        finally:
+            # (une requête identique arrivée après une annulation a pu relancer son propre calcul)
+            if cle in self.en_cours and self.en_cours[cle][0] is asyncio.current_task():
+                del self.en_cours[cle]
+        self.cache[cle] = resultat
+        if len(self.cache) > self.taille_cache:
+            self.cache.popitem(last=False)
+        return resultat
+
+    async def resoudre(self, requete):
+        """
+        Résout une requête {"points", "methode", "limite_temps", "graine", "id"}.
+
+        Returns:
+            dict: Le résultat, avec les temps d'attente et l'origine (cache, partage)
+        """
+        from cache_instances import hash_points
+        from solveur import etapes_methode
+
+        t0 = time.perf_counter_ns()
+        self.compteurs["requetes"] += 1
+        points = requete["points"]
+        methode = requete.get("methode", "OptPPP")
+        limite_temps = requete.get("limite_temps")
+        graine = requete.get("graine")
+        etapes_methode(methode)  # ValueError si la méthode est inconnue
+        if len(points) < 3:
+            raise ValueError("Il faut au moins 3 villes.")
+
+        hash_instance = hash_points(points)
+        cle = self.calculer_cle(hash_instance, methode, limite_temps, graine)
+        if "id" in requete:
+            self.identifiants[requete["id"]] = cle
+
+        try:
+            # 1. Résultat déjà connu
+            if cle in self.cache:
+                self.cache.move_to_end(cle)
+                self.compteurs["cache"] += 1
+                return dict(self.cache[cle], cle=cle, cache=True, partage=False, attente_ms=0.0,
+                            total_ms=(time.perf_counter_ns() - t0) / 1e6)
+
+            # 2. Calcul identique en cours : on attend le même résultat
+            partage = cle in self.en_cours
+            if partage:
+                self.compteurs["partages"] += 1
+                self.en_cours[cle][1] += 1
+            else:
+                tache = asyncio.ensure_future(self._calculer(cle, points, hash_instance, methode, limite_temps, graine))
+                self.en_cours[cle] = [tache, 1]
+            tache = self.en_cours[cle][0]
+
+            try:
+                # shield : l'abandon d'un client n'annule pas le calcul des autres clients
+                resultat = await asyncio.shield(tache)
+            except asyncio.CancelledError:
+                if not tache.cancelled() and cle in self.en_cours:
+                    # Ce client abandonne ; sans autre client en attente, le calcul est annulé
+                    self.en_cours[cle][1] -= 1
+                    if self.en_cours[cle][1] == 0:
+                        self._annuler_cle(cle)
+                raise
+
+            total_ms = (time.perf_counter_ns() - t0) / 1e6
+            return dict(resultat, cle=cle, cache=False, partage=partage, total_ms=total_ms,
+                        attente_ms=total_ms - resultat["temps_ms"] - resultat["graphe_ms"])
+        finally:
+            if "id" in requete:
+                self.identifiants.pop(requete["id"], None)
+
+    def _annuler_cle(self, cle):
+        if cle not in self.en_cours:
+            return False
+        tache, _ = self.en_cours.pop(cle)
+        tache.cancel()
+        self.compteurs["annulations"] += 1
+        return True
+
+    def annuler(self, identifiant=None, cle=None):
+        """
+        Annule un calcul en cours (pour tous les clients qui l'attendent).
+        Un calcul encore dans la file n'est jamais exécuté ; un calcul déjà lancé
+        dans un processus va à son terme, mais son résultat est ignoré.
+
+        Returns:
+            bool: True si un calcul a été annulé
+        """
+        if cle is None:
+            cle = self.identifiants.get(identifiant)
+        return self._annuler_cle(cle)
+
+    def etat(self):
+        return dict(self.compteurs, en_cours=len(self.en_cours), en_cache=len(self.cache),
+                    workers=self.nb_workers)
+
+    def fermer(self):
+        for cle in list(self.en_cours):
+            self._annuler_cle(cle)
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+# --- 3. Serveur HTTP minimal (asyncio, sans dépendance)
+STATUTS = {200: "OK", 400: "Bad Request", 404: "Not Found", 409: "Conflict",
+           413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+async def _repondre(writer, statut, contenu):
+    corps = json.dumps(contenu).encode()
+    writer.write(f"HTTP/1.1 {statut} {STATUTS[statut]}\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(corps)}\r\nConnection: close\r\n\r\n".encode() + corps)
+    await writer.drain()
+
+
+async def _attendre_ou_deconnexion(reader, coroutine):
+    """
+    Exécute coroutine, mais l'annule si le client ferme la connexion entre-temps.
+
+    Returns:
+        Le résultat de coroutine, ou None si le client s'est déconnecté
+    """
+    tache = asyncio.ensure_future(coroutine)
+    deconnexion = asyncio.ensure_future(reader.read(1))
+    await asyncio.wait([tache, deconnexion], return_when=asyncio.FIRST_COMPLETED)
+    if tache.done():
+        deconnexion.cancel()
+        return tache.result()
+    tache.cancel()
+    try:
+        await tache
+    except asyncio.CancelledError:
+        pass
+    return None
+
+
+async def _traiter_connexion(service, reader, writer):
+    try:
+        ligne = await reader.readline()
+        methode_http, chemin, _ = ligne.decode("latin-1").split(" ", 2)
+        entetes = {}
+        while True:
+            ligne = await reader.readline()
+            if ligne in (b"\r\n", b"\n", b""):
+                break
+            nom, _, valeur = ligne.decode("latin-1").partition(":")
+            entetes[nom.strip().lower()] = valeur.strip()
+
+        longueur = int(entetes.get("content-length", 0))
+        if longueur > TAILLE_MAX_CORPS:
+            await _repondre(writer, 413, {"erreur": "Requête trop volumineuse."})
+            return
+        requete = json.loads(await reader.readexactly(longueur)) if longueur else {}
+
+        if methode_http == "GET" and chemin == "/etat":
+            await _repondre(writer, 200, service.etat())
+        elif methode_http == "POST" and chemin == "/annuler":
+            annule = service.annuler(identifiant=requete.get("id"), cle=requete.get("cle"))
+            await _repondre(writer, 200, {"annule": annule})
+        elif methode_http == "POST" and chemin == "/resoudre":
+            try:
+                resultat = await _attendre_ou_deconnexion(reader, service.resoudre(requete))
+            except asyncio.CancelledError:
+                # Calcul annulé par /annuler (la connexion, elle, est toujours ouverte)
+                await _repondre(writer, 409, {"erreur": "Calcul annulé."})
+                return
+            if resultat is not None:
+                await _repondre(writer, 200, resultat)
+        else:
+            await _repondre(writer, 404, {"erreur": f"Route inconnue : {methode_http} {chemin}"})
+    except (ValueError, KeyError, TypeError) as e:
+        service.compteurs["erreurs"] += 1
+        await _repondre(writer, 400, {"erreur": str(e)})
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    except Exception as e:
+        service.compteurs["erreurs"] += 1
+        await _repondre(writer, 500, {"erreur": f"{type(e).__name__}: {e}"})
+    finally:
+        writer.close()
+
+
+async def servir(hote="127.0.0.1", port=8765, nb_workers=2, taille_cache=1024):
+    """ Lance le service et le fait tourner jusqu'à son interruption (Ctrl-C). """
+    service = ServiceResolution(nb_workers, taille_cache)
+    serveur = await asyncio.start_server(lambda r, w: _traiter_connexion(service, r, w), hote, port)
+    print(f"Service de résolution sur http://{hote}:{port} ({nb_workers} processus)", file=sys.stderr)
+    try:
+        async with serveur:
+            await serveur.serve_forever()
+    finally:
+        service.fermer()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Service local de résolution TSP (HTTP/JSON).")
+    parser.add_argument("--hote", default="127.0.0.1", help="Adresse d'écoute (locale par défaut)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=2, help="Nombre de processus de calcul")
+    parser.add_argument("--cache", type=int, default=1024, help="Nombre de résultats gardés en cache")
+    args = parser.parse_args()
+    try:
+        asyncio.run(servir(args.hote, args.port, args.workers, args.cache))
+    except KeyboardInterrupt:
+        pass
+    sys.exit(0)
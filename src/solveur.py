@@ -0,0 +1,292 @@
+import time
+import numpy as np
+from structures.graphe_md import GrapheMD
+import utils
+
+# Importation des algorithmes
+from algos.algo_ppp import algo_ppp
+from algos.opt_ppp import opt_ppp
+from algos.opt_prim import opt_prim
+from algos.algo_hilbert import algo_hilbert
+from algos.algo_glouton import algo_glouton
+from algos.hds import hds as algo_hds
+from algos.decomposition import decomposition
+from algos.ils import ils, ameliorer_ils, LIMITE_TEMPS_DEFAUT
+from algos.recuit import recuit_simule
+
+# --- SOLVEUR UNIFIÉ (Registre des méthodes) ---
+# Une méthode est un pipeline : une étape de construction, suivie d'étapes d'amélioration.
+#   resoudre(points, "OptPPP")        -> PPP puis 2-opt
+#   resoudre(points, "OptPrim+2opt")  -> OptPrim puis 2-opt
+# Toutes les étapes d'un pipeline partagent le même graphe et le même contexte
+# (graine, échéance, listes de voisins candidats calculées une seule fois).
+
+
+class Contexte:
+    """
+    État partagé par les étapes d'un pipeline sur une instance.
+
+    Attributes:
+        graphe (GrapheMD): L'instance
+        graine: La graine des étapes aléatoires (int, SeedSequence ou None)
+        echeance (float | None): L'instant (time.perf_counter) à ne pas dépasser
+        k_voisins (int): Le nombre de voisins candidats par ville
+    """
+
+    def __init__(self, graphe, graine=None, echeance=None, k_voisins=10):
+        self.graphe = graphe
+        self.graine = graine
+        self.echeance = echeance
+        self.k_voisins = k_voisins
+        self._voisins = None
+
+    @property
+    def voisins(self):
+        """ Les listes de voisins candidats (n, k), calculées au premier besoin. """
+        if self._voisins is None:
+            self._voisins = utils.calculer_voisins_candidats(self.graphe, self.k_voisins)
+        return self._voisins
+
+    def temps_restant(self):
+        """ Le temps restant avant l'échéance (secondes), ou None s'il n'y a pas de limite. """
+        if self.echeance is None:
+            return None
+        return max(0.0, self.echeance - time.perf_counter())
+
+
+class Resultat:
+    """
+    Résultat d'une résolution.
+
+    Attributes:
+        methode (str): La méthode utilisée
+        cycle (list): Le cycle hamiltonien trouvé
+        cout (float): Sa longueur
+        temps_ms (float): Le temps total des étapes (ms), sans la construction du graphe
+        temps_etapes (dict): Le temps de chaque étape (ms)
+        stats (dict): Les statistiques (StatsRecherche) des étapes instrumentées
+    """
+
+    def __init__(self, methode, cycle, cout, temps_etapes, stats):
+        self.methode = methode
+        self.cycle = cycle
+        self.cout = cout
+        self.temps_etapes = temps_etapes
+        self.temps_ms = sum(temps_etapes.values())
+        self.stats = stats
+
+    def __repr__(self):
+        return f"Resultat({self.methode}, cout={self.cout:.4f}, temps_ms={self.temps_ms:.3f})"
+
+    def vers_dict(self):
+        """ Le résultat sous forme sérialisable (JSON). """
+        return {"methode": self.methode, "cycle": [int(v) for v in self.cycle], "cout": self.cout,
+                "temps_ms": self.temps_ms, "temps_etapes": dict(self.temps_etapes),
+                "stats": {etape: s.vers_dict() for etape, s in self.stats.items()}}
+
+
+# --- 1. Étapes de construction : (contexte) -> (cycle, stats | None)
+def _construire_hds(ctx):
+    # Avec une limite de temps, PPP fournit une première solution : HDS retourne toujours un cycle
+    cycle_initial = algo_ppp(ctx.graphe) if ctx.echeance is not None else None
+    return algo_hds(ctx.graphe, avec_stats=True, limite_temps=ctx.temps_restant(), cycle_initial=cycle_initial)
+
+
+def _duree_ils(ctx):
+    # Sans limite de temps, l'ILS (qui s'arrête seulement à l'échéance) dispose de LIMITE_TEMPS_DEFAUT
+    limite = ctx.temps_restant()
+    return LIMITE_TEMPS_DEFAUT if limite is None else limite
+
+
+CONSTRUCTEURS = {
+    "PPP": lambda ctx: (algo_ppp(ctx.graphe), None),
+    "OptPrim": lambda ctx: opt_prim(ctx.graphe, avec_stats=True),
+    "Hilbert": lambda ctx: (algo_hilbert(ctx.graphe), None),
+    "HDS": _construire_hds,
+    # Arêtes candidates des listes de voisins du contexte (partagées avec les améliorations)
+    "Glouton": lambda ctx: algo_glouton(ctx.graphe, voisins=ctx.voisins, avec_stats=True),
+    # Zones de taille_cluster=1000 villes résolues par OptPPP en parallèle ; pour d'autres réglages :
+    # enregistrer_methode("Decomp500", constructeur=lambda ctx: decomposition(ctx.graphe, taille_cluster=500, ...))
+    "Decomposition": lambda ctx: decomposition(ctx.graphe, limite_temps=ctx.temps_restant(), graine=ctx.graine,
+                                               avec_stats=True),
+    # Départs multiples (PPP, OptPrim, aléatoires) en parallèle, chacun amélioré par ILS
+    "ILS": lambda ctx: ils(ctx.graphe, limite_temps=_duree_ils(ctx), graine=ctx.graine, k_voisins=ctx.k_voisins,
+                           avec_stats=True),
+}
+
+# --- 2. Étapes d'amélioration : (cycle, contexte) -> (cycle, stats | None)
+AMELIORATIONS = {
+    "2opt": lambda cycle, ctx: opt_ppp(cycle, ctx.graphe, avec_stats=True, limite_temps=ctx.temps_restant()),
+    "ils": lambda cycle, ctx: ameliorer_ils(cycle, ctx.graphe, limite_temps=_duree_ils(ctx), voisins=ctx.voisins,
+                                            graine=ctx.graine, avec_stats=True),
+    "recuit": lambda cycle, ctx: recuit_simule(cycle, ctx.graphe, limite_temps=ctx.temps_restant(), voisins=ctx.voisins,
+                                               graine=ctx.graine, avec_stats=True),
+}
+
+# --- 3. Méthodes nommées (noms historiques des études)
+METHODES = {
+    "PPP": ("PPP",),
+    "OptPPP": ("PPP", "2opt"),
+    "OptPrim": ("OptPrim",),
+    "HDS": ("HDS",),
+    "Hilbert": ("Hilbert",),
+    "Decomposition": ("Decomposition",),
+    "ILS": ("ILS",),
+    "Recuit": ("PPP", "recuit"),
+    "Glouton": ("Glouton",),
+    "OptGlouton": ("Glouton", "2opt"),
+}
+
+# Étapes qui n'ont besoin que des coordonnées (pas de matrice D)
+SANS_MATRICE = {"Hilbert", "Decomposition"}
+
+
+def etapes_methode(methode):
+    """
+    Décompose une méthode en étapes : un nom de METHODES, ou "Construction+Amélioration+...".
+
+    Returns:
+        tuple: Les noms des étapes (la première est une construction)
+    """
+    if methode in METHODES:
+        return METHODES[methode]
+    etapes = tuple(methode.split("+"))
+    if etapes[0] not in CONSTRUCTEURS or any(e not in AMELIORATIONS for e in etapes[1:]):
+        raise ValueError(f"Méthode inconnue : {methode} (méthodes : {', '.join(METHODES)} ; "
+                         f"constructions : {', '.join(CONSTRUCTEURS)} ; améliorations : {', '.join(AMELIORATIONS)})")
+    return etapes
+
+
+def enregistrer_methode(nom, constructeur=None, amelioration=None, etapes=None, sources=None):
+    """
+    Ajoute une méthode au registre.
+
+    Args:
+        nom (str): Le nom de la méthode
+        constructeur (callable): Une étape de construction (contexte) -> (cycle, stats | None)
+        amelioration (callable): Une étape d'amélioration (cycle, contexte) -> (cycle, stats | None)
+        etapes (tuple): Les étapes de la méthode (par défaut, l'étape enregistrée seule)
+        sources (list): Les modules dont dépend l'étape enregistrée (memo_resultats.SOURCES_ETAPES) ;
+            sans elles, les résultats de la méthode ne peuvent pas être mémorisés
+    """
+    if sources is not None:
+        from memo_resultats import SOURCES_ETAPES
+        SOURCES_ETAPES[nom] = list(sources)
+    if constructeur is not None:
+        CONSTRUCTEURS[nom] = constructeur
+    if amelioration is not None:
+        AMELIORATIONS[nom] = amelioration
+    METHODES[nom] = etapes or (nom,)
+
+
+def _vers_graphe(points_ou_graphe, avec_matrice=True):
+    if isinstance(points_ou_graphe, GrapheMD):
+        return points_ou_graphe
+    points = np.asarray(points_ou_graphe, dtype=np.float64).reshape(-1, 2)
+    return GrapheMD(len(points), points, avec_matrice=avec_matrice)
+
+
+def _executer_etapes(etapes, ctx, deja_calcules=None):
+    """
+    Exécute les étapes d'un pipeline sur un contexte. Les préfixes de pipeline déjà calculés
+    (deja_calcules : etapes -> (cycle, temps_etapes, stats)) sont réutilisés, puis complétés.
+
+    Returns:
+        tuple: (cycle, temps_etapes, stats)
+    """
+    # Plus long préfixe déjà calculé
+    debut, cycle, temps_etapes, stats = 0, None, {}, {}
+    if deja_calcules:
+        for k in range(len(etapes), 0, -1):
+            if etapes[:k] in deja_calcules:
+                cycle, temps_etapes, stats = deja_calcules[etapes[:k]]
+                temps_etapes, stats = dict(temps_etapes), dict(stats)
+                debut = k
+                break
+
+    for k in range(debut, len(etapes)):
+        etape = etapes[k]
+        t0 = time.perf_counter_ns()
+        if k == 0:
+            cycle, s = CONSTRUCTEURS[etape](ctx)
+        else:
+            cycle, s = AMELIORATIONS[etape](cycle, ctx)
+        temps_etapes[etape] = (time.perf_counter_ns() - t0) / 1e6
+        if s is not None:
+            stats[etape] = s
+        if deja_calcules is not None:
+            deja_calcules[etapes[:k + 1]] = (cycle, dict(temps_etapes), dict(stats))
+    return cycle, temps_etapes, stats
+
+
+def executer_methode(graphe, methode, limite_temps=None, graine=None):
+    """
+    Exécute une méthode sur un graphe, sans calcul du coût ni objet Resultat :
+    c'est la forme la plus légère, utilisée par les études pour chronométrer les algorithmes.
+
+    Returns:
+        tuple: (cycle, stats) avec stats le dictionnaire etape -> StatsRecherche
+    """
+    echeance = None if limite_temps is None else time.perf_counter() + limite_temps
+    cycle, _, stats = _executer_etapes(etapes_methode(methode), Contexte(graphe, graine, echeance))
+    return cycle, stats
+
+
+def resoudre(points_ou_graphe, methode="OptPPP", limite_temps=None, graine=None):
+    """
+    Résout une instance avec une méthode du registre.
+
+    Args:
+        points_ou_graphe (list | numpy.ndarray | GrapheMD): Les coordonnées des villes, ou le graphe
+        methode (str): Une méthode (METHODES) ou un pipeline "Construction+Amélioration"
+        limite_temps (float): Durée maximale (secondes) de l'ensemble des étapes ; les étapes
+            qui la respectent (HDS, 2opt, ILS, recuit) s'arrêtent à temps et retournent leur meilleure solution
+        graine: La graine des étapes aléatoires
+
+    Returns:
+        Resultat: Le cycle, son coût, les temps et les statistiques
+    """
+    return resoudre_lot([points_ou_graphe], [methode], limite_temps=limite_temps, graine=graine)[0][methode]
+
+
+def resoudre_lot(instances, methodes, limite_temps=None, graine=None, k_voisins=10):
+    """
+    Résout plusieurs instances avec plusieurs méthodes.
+    Pour chaque instance, le graphe (et les voisins candidats) n'est construit qu'une fois,
+    et les étapes communes à plusieurs méthodes ne sont exécutées qu'une fois :
+    avec ["PPP", "OptPPP"], le cycle de PPP sert directement de départ au 2-opt.
+
+    Args:
+        instances (list): Les instances (points ou GrapheMD)
+        methodes (list): Les méthodes à appliquer à chaque instance
+        limite_temps (float): Durée maximale de chaque méthode sur chaque instance (secondes)
+        graine: La graine de l'ensemble, int ou SeedSequence (une graine indépendante est dérivée par instance)
+        k_voisins (int): Le nombre de voisins candidats par ville (pour les étapes qui s'en servent)
+
+    Returns:
+        list: Pour chaque instance, un dictionnaire methode -> Resultat
+    """
+    decompositions = {m: etapes_methode(m) for m in methodes}
+    avec_matrice = any(e not in SANS_MATRICE for etapes in decompositions.values() for e in etapes)
+    graines = [None] * len(instances)
+    if graine is not None:
+        sequence = graine if isinstance(graine, np.random.SeedSequence) else np.random.SeedSequence(graine)
+        graines = sequence.spawn(len(instances))
+
+    resultats = []
+    for instance, graine_instance in zip(instances, graines):
+        graphe = _vers_graphe(instance, avec_matrice)
+        ctx = Contexte(graphe, graine_instance, k_voisins=k_voisins)
+        deja_calcules = {}
+        par_methode = {}
+        for methode, etapes in decompositions.items():
+            # La limite de temps s'applique aux étapes restant à exécuter pour cette méthode
+            ctx.echeance = None if limite_temps is None else time.perf_counter() + limite_temps
+            cycle, temps_etapes, stats = _executer_etapes(etapes, ctx, deja_calcules)
+            if graphe.D is None:
+                cout = utils.calculer_longueur_cycle_coords(cycle, graphe.points)
+            else:
+                cout = utils.calculer_longueur_cycle(cycle, graphe)
+            par_methode[methode] = Resultat(methode, cycle, cout, temps_etapes, stats)
+        resultats.append(par_methode)
+    return resultats
@@ -1,66 +1,298 @@
-import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import numpy as np
-import matplotlib.pyplot as plt
 from structures.graphe_md import GrapheMD
 import utils
-from algos.algo_ppp import algo_ppp
-from algos.opt_ppp import opt_ppp
-from algos.opt_prim import opt_prim
-from algos.hds import hds as algo_hds
+from mesure import mesurer, resumer_distribution
+from memo_resultats import MemoResultats
+from cache_instances import hash_points
+from journal_etude import JournalEtude
+from solveur import executer_methode
+from algos.algo_ppp import algo_ppp_lot
+from algos.opt_ppp import opt_ppp_lot
+from structures.stats_recherche import StatsRecherche
+
+ALGOS_ETUDE = ("PPP", "OptPPP", "OptPrim", "HDS")
+# Algorithmes exécutés sur toutes les instances d'un coup avec par_lots=True
+ALGOS_LOT = ("PPP", "OptPPP")
+# Taille maximale des instances exécutées en lot par défaut (au-delà, le lot n'accélère plus)
+N_MAX_LOTS = 50
+
+
+def _mesurer_algos(graphe, mesurer_memoire=False, algos=ALGOS_ETUDE):
+    """
+    Exécute les algorithmes demandés sur un graphe à travers la couche de mesure.
+
+    Args:
+        graphe (GrapheMD): L'instance
+        mesurer_memoire (bool): Mesurer aussi le pic mémoire (un appel supplémentaire par algorithme)
+        algos (tuple): Les méthodes à exécuter (parmi ALGOS_ETUDE, ou toute méthode du registre)
+
+    Returns:
+        tuple: (cycles, mesures) indexés par le nom de l'algorithme ;
+            mesures[algo] contient temps_ms, cpu_ms, repetitions et memoire_ko,
+            et stats (compteurs d'instrumentation) pour OptPPP, OptPrim et HDS
+    """
+    cycles, mesures = {}, {}
+    for k in algos:
+        # Chaque méthode passe par le registre (solveur.py) ; le temps d'OptPPP inclut donc PPP
+        m = mesurer(executer_methode, graphe, k, memoire=mesurer_memoire)
+        cycles[k], stats_etapes = m.resultat
+        mesures[k] = m.vers_dict()
+        if stats_etapes:
+            mesures[k]["stats"] = _fusionner_stats(k, stats_etapes).vers_dict()
+    return cycles, mesures
+
+
+def _fusionner_stats(algo, stats_etapes):
+    """ Regroupe les statistiques des étapes d'une méthode (ex: OptPrim puis 2opt) en une seule. """
+    stats = StatsRecherche(algo)
+    for s in stats_etapes.values():
+        stats.compteurs.update(s.compteurs)
+        stats.chronologie.extend(s.chronologie)
+    return stats
+
+
+def _executer_essai(N, graine_essai, distribution, mesurer_memoire=False, connus=None):
+    """
+    Exécute un essai complet (4 algorithmes sur une instance).
+    Fonction de niveau module pour pouvoir être envoyée à un processus du pool.
+
+    Args:
+        N (int): Le nombre de villes
+        graine_essai (numpy.random.SeedSequence): La graine propre à cet essai
+        distribution (str): La distribution des points
+        mesurer_memoire (bool): Mesurer aussi le pic mémoire
+        connus (dict): Les résultats déjà mémorisés pour cette instance (algo -> résultat),
+            ces algorithmes ne sont pas relancés
+
+    Returns:
+        tuple: (longueurs, mesures, nouveaux) indexés par le nom de l'algorithme ;
+            nouveaux contient les cycles calculés pendant cet essai (à mémoriser)
+    """
+    connus = connus or {}
+    points = utils.generer_instances(1, N, graine=graine_essai, distribution=distribution)[0]
+    graphe = GrapheMD(N, points)
+
+    a_calculer = tuple(k for k in ALGOS_ETUDE if k not in connus)
+    cycles, mesures = _mesurer_algos(graphe, mesurer_memoire, algos=a_calculer) if a_calculer else ({}, {})
+    nouveaux = dict(cycles)
+    for k, resultat in connus.items():
+        cycles[k] = resultat["cycle"]
+        mesures[k] = resultat["mesures"]
+
+    # Évaluation des cycles complets en un seul appel vectorisé ; un cycle incomplet
+    # (HDS interrompu par MAX_ITR retourne []) est évalué à part (0 pour un cycle vide)
+    complets = [k for k in ALGOS_ETUDE if len(cycles[k]) == N]
+    longueurs = {k: utils.calculer_longueur_cycle(cycles[k], graphe) for k in ALGOS_ETUDE if k not in complets}
+    if complets:
+        l_cycles = utils.calculer_longueurs_lot([cycles[k] for k in complets], graphe.D)
+        longueurs.update({k: float(l) for k, l in zip(complets, l_cycles)})
+    longueurs = {k: longueurs[k] for k in ALGOS_ETUDE}
+    mesures = {k: mesures[k] for k in ALGOS_ETUDE}
+    return longueurs, mesures, nouveaux
+
+
+def _mesurer_lot(N, graines, distribution):
+    """
+    Exécute PPP et OptPPP en lot (algo_ppp_lot puis opt_ppp_lot) sur les instances des essais.
+    Les cycles sont ceux de algo_ppp et opt_ppp ; le temps d'un lot est divisé par le nombre
+    d'instances (temps amorti par instance), le pic mémoire n'est pas mesuré.
+
+    Returns:
+        list: Pour chaque essai, algo -> {"cycle", "mesures"} (le format de connus)
+    """
+    points = np.stack([utils.generer_instances(1, N, graine=g, distribution=distribution)[0] for g in graines])
+    D = utils.calculer_matrices_lot(points)
+    m_ppp = mesurer(algo_ppp_lot, D, memoire=False)
+    m_opt = mesurer(opt_ppp_lot, m_ppp.resultat, D, memoire=False)
+    B = len(graines)
+    # Comme avec le registre, le temps d'OptPPP inclut celui de PPP
+    mesures = {"PPP": {"temps_ms": m_ppp.temps_ms / B, "cpu_ms": m_ppp.cpu_ms / B,
+                       "repetitions": m_ppp.repetitions, "memoire_ko": None},
+               "OptPPP": {"temps_ms": (m_ppp.temps_ms + m_opt.temps_ms) / B,
+                          "cpu_ms": (m_ppp.cpu_ms + m_opt.cpu_ms) / B,
+                          "repetitions": m_opt.repetitions, "memoire_ko": None}}
+    cycles = {"PPP": m_ppp.resultat, "OptPPP": m_opt.resultat}
+    return [{k: {"cycle": cycles[k][b].tolist(), "mesures": dict(mesures[k])} for k in ALGOS_LOT}
+            for b in range(B)]
+
+
+def _ouvrir_memo(memo):
+    """
+    Accepte un chemin de fichier, un MemoResultats ou None.
+
+    Returns:
+        tuple: (memo, a_fermer) ; a_fermer est vrai si le mémo a été ouvert ici (chemin) :
+            l'étude le ferme alors en fin d'exécution, même interrompue
+    """
+    if memo is None or isinstance(memo, MemoResultats):
+        return memo, False
+    return MemoResultats(memo), True
+
+
+def _agreger_essais(essais):
+    """
+    Regroupe les résultats des essais (dans l'ordre des essais) par algorithme.
+
+    Args:
+        essais (list): Les tuples (longueurs, mesures) de chaque essai
+
+    Returns:
+        tuple: (longueurs, temps, temps_cpu, memoire, compteurs), dictionnaires algo -> liste
+    """
+    longueurs = {k: [] for k in ALGOS_ETUDE}
+    temps = {k: [] for k in ALGOS_ETUDE}
+    temps_cpu = {k: [] for k in ALGOS_ETUDE}
+    memoire = {k: [] for k in ALGOS_ETUDE}
+    compteurs = {k: [] for k in ALGOS_ETUDE}
+    for l_essai, m_essai in essais:
+        for k in ALGOS_ETUDE:
+            longueurs[k].append(l_essai[k])
+            temps[k].append(m_essai[k]["temps_ms"])
+            temps_cpu[k].append(m_essai[k]["cpu_ms"])
+            if m_essai[k]["memoire_ko"] is not None:
+                memoire[k].append(m_essai[k]["memoire_ko"])
+            # Les résultats mémorisés avant l'instrumentation n'ont pas de stats
+            if "stats" in m_essai[k]:
+                compteurs[k].append(m_essai[k]["stats"]["compteurs"])
+    return longueurs, temps, temps_cpu, memoire, compteurs
+
+
+def charger_etude_statistique(chemin_journal):
+    """
+    Relit le journal d'une étude statistique, sans rien recalculer.
+
+    Returns:
+        tuple: (longueurs, temps, nb_essais, N), les arguments de plot_stats
+    """
+    entete, enregistrements = JournalEtude(chemin_journal).lire()
+    if entete is None or entete.get("etude") != "statistique":
+        raise ValueError(f"{chemin_journal} n'est pas le journal d'une étude statistique.")
+    essais = {e["essai"]: (e["longueurs"], e["mesures"]) for e in enregistrements}
+    longueurs, temps, _, _, _ = _agreger_essais([essais[i] for i in sorted(essais)])
+    return longueurs, temps, len(essais), entete["N"]
 
-def lancer_etude_statistique(N=10, nb_essais=100):
+
+def retracer_depuis_journal(chemin_journal):
+    """ Retrace les graphiques d'une étude (statistique ou d'évolution) à partir de son journal. """
+    entete, _ = JournalEtude(chemin_journal).lire()
+    if entete is not None and entete.get("etude") == "evolution":
+        plot_evolution(*charger_etude_evolution(chemin_journal))
+    else:
+        plot_stats(*charger_etude_statistique(chemin_journal))
+
+
+def lancer_etude_statistique(N=10, nb_essais=100, graine=None, distribution="uniforme", nb_workers=1,
+                             mesurer_memoire=False, memo=None, journal=None, par_lots=None):
     """
     Exécute 100 essais et calcule les moyennes et pourcentages demandés par le prof.
     Affiche ensuite les graphiques comparatifs (Coût ET Temps).
-    """
-    print(f"\n=== LANCEMENT DE L'ÉTUDE STATISTIQUE ({nb_essais} essais, N={N}) ===")
-    
-    # Stockage
-    longueurs = {"PPP": [], "OptPPP": [], "OptPrim": [], "HDS": []}
-    temps = {"PPP": [], "OptPPP": [], "OptPrim": [], "HDS": []}
-
-    # Boucle des 100 essais
-    for i in range(nb_essais):
-        if (i+1) % 10 == 0: print(f"Essai {i+1}/{nb_essais}...")
-            
-        points = utils.generer_points_aleatoires(N)
-        graphe = GrapheMD(N, points)
 
-        # 1. PPP
-        t0 = time.time()
-        c_ppp = algo_ppp(graphe)
-        t_ppp = time.time() - t0
-        l_ppp = utils.calculer_longueur_cycle(c_ppp, graphe)
-
-        # 2. OptPPP
-        t0 = time.time()
-        c_optppp = opt_ppp(c_ppp, graphe)
-        t_optppp = time.time() - t0 + t_ppp # On ajoute le temps de PPP car OptPPP en dépend
-        l_optppp = utils.calculer_longueur_cycle(c_optppp, graphe)
-
-        # 3. OptPrim
-        t0 = time.time()
-        c_prim = opt_prim(graphe)
-        t_prim = time.time() - t0
-        l_prim = utils.calculer_longueur_cycle(c_prim, graphe)
-
-        # 4. HDS
-        t0 = time.time()
-        c_hds = algo_hds(graphe)
-        t_hds = time.time() - t0
-        l_hds = utils.calculer_longueur_cycle(c_hds, graphe)
-
-        # Enregistrement
-        longueurs["PPP"].append(l_ppp)
-        longueurs["OptPPP"].append(l_optppp)
-        longueurs["OptPrim"].append(l_prim)
-        longueurs["HDS"].append(l_hds)
-        
-        # On stocke les temps en millisecondes (ms) pour l'affichage
-        temps["PPP"].append(t_ppp * 1000)
-        temps["OptPPP"].append(t_optppp * 1000)
-        temps["OptPrim"].append(t_prim * 1000)
-        temps["HDS"].append(t_hds * 1000)
+    Chaque essai reçoit sa propre graine (dérivée de la graine de l'étude), les essais peuvent
+    donc être répartis sur nb_workers processus : les résultats sont fusionnés dans l'ordre
+    des essais et les longueurs obtenues ne dépendent pas du nombre de processus.
+    Les temps sont mesurés par la couche mesure.py (répétition des appels courts,
+    temps mur et CPU) et résumés par leur moyenne et leurs percentiles. Avec mesurer_memoire,
+    chaque algorithme est relancé sous tracemalloc pour son pic mémoire (au moins deux fois plus long).
+    Avec memo (chemin SQLite ou MemoResultats), les résultats déjà calculés sur une instance
+    (même hash, même algorithme, même version du code) sont réutilisés au lieu d'être recalculés.
+    Avec journal (chemin), chaque essai terminé est ajouté au fichier : relancer l'étude avec
+    le même journal reprend là où elle s'était arrêtée (la graine de l'étude est lue dans le journal).
+    Avec par_lots, PPP et OptPPP sont exécutés sur toutes les instances restantes d'un coup
+    (algo_ppp_lot, opt_ppp_lot) : mêmes cycles, temps amortis par instance, pas de pic mémoire.
+    Par défaut (None), le lot est utilisé pour N <= N_MAX_LOTS, sauf si le pic mémoire est mesuré.
+    """
+    if par_lots is None:
+        par_lots = N <= N_MAX_LOTS and not mesurer_memoire
+    print(f"\n=== LANCEMENT DE L'ÉTUDE STATISTIQUE ({nb_essais} essais, N={N}, {nb_workers} processus) ===")
+    if par_lots:
+        print("PPP et OptPPP exécutés en lot (temps amortis par instance)")
+
+    memo, fermer_memo = _ouvrir_memo(memo)
+    pool = None
+    try:
+        # Reprise : essais déjà présents dans le journal
+        entropie = np.random.SeedSequence(graine).entropy
+        termines = {}
+        if journal is not None:
+            journal = JournalEtude(journal)
+            parametres = {"etude": "statistique", "N": N, "distribution": distribution,
+                          "mesurer_memoire": mesurer_memoire, "graine": entropie}
+            cles = ("etude", "N", "distribution", "mesurer_memoire") + (("graine",) if graine is not None else ())
+            entete, enregistrements = journal.ouvrir(parametres, cles)
+            entropie = entete["graine"]
+            termines = {e["essai"]: (e["longueurs"], e["mesures"]) for e in enregistrements if e["essai"] < nb_essais}
+            if termines:
+                print(f"Journal : {len(termines)}/{nb_essais} essais déjà terminés")
+
+        # Une graine indépendante par essai
+        graines = np.random.SeedSequence(entropie).spawn(nb_essais)
+        restants = [i for i in range(nb_essais) if i not in termines]
+
+        # Recherche des résultats déjà mémorisés
+        # Les temps amortis d'un lot ne sont pas comparables à ceux d'un appel seul : mémorisés à part
+        params_memo = {k: {"memoire": mesurer_memoire} for k in ALGOS_ETUDE}
+        if par_lots:
+            for k in ALGOS_LOT:
+                params_memo[k] = {"memoire": False, "lot": True}
+        cles = {}
+        connus = {i: {} for i in restants}
+        if memo is not None:
+            for i in restants:
+                cles[i] = hash_points(utils.generer_instances(1, N, graine=graines[i], distribution=distribution)[0])
+                for algo in ALGOS_ETUDE:
+                    resultat = memo.chercher(cles[i], algo, params_memo[algo])
+                    if resultat is not None:
+                        connus[i][algo] = resultat
+            nb_connus = sum(len(c) for c in connus.values())
+            print(f"Mémo : {nb_connus}/{len(restants) * len(ALGOS_ETUDE)} résultats réutilisés")
+
+        # PPP et OptPPP en lot sur les instances où ils ne sont pas connus
+        calcules_lot = {i: {} for i in restants}
+        if par_lots:
+            en_lot = [i for i in restants if any(k not in connus[i] for k in ALGOS_LOT)]
+            if en_lot:
+                for i, resultats_lot in zip(en_lot, _mesurer_lot(N, [graines[i] for i in en_lot], distribution)):
+                    for k, resultat in resultats_lot.items():
+                        if k not in connus[i]:
+                            connus[i][k] = calcules_lot[i][k] = resultat
+
+        arguments = ([N] * len(restants), [graines[i] for i in restants], [distribution] * len(restants),
+                     [mesurer_memoire] * len(restants), [connus[i] for i in restants])
+
+        if nb_workers > 1:
+            pool = ProcessPoolExecutor(max_workers=nb_workers)
+            # Les essais sont traités dans leur ordre de fin : un essai terminé est journalisé
+            # sans attendre un essai précédent plus lent (ex: HDS) ; termines est indexé par essai
+            futurs = {pool.submit(_executer_essai, *args): i for i, args in zip(restants, zip(*arguments))}
+            resultats = ((futurs[f], f.result()) for f in as_completed(futurs))
+        else:
+            resultats = zip(restants, map(_executer_essai, *arguments))
+
+        # Boucle des 100 essais
+        for nb_faits, (i, (l_essai, m_essai, nouveaux)) in enumerate(resultats, len(termines) + 1):
+            if nb_faits % 10 == 0: print(f"Essai {nb_faits}/{nb_essais}...")
+            termines[i] = (l_essai, m_essai)
+
+            # Enregistrement immédiat dans le journal
+            if journal is not None:
+                journal.ajouter({"essai": i, "longueurs": l_essai, "mesures": m_essai})
+
+            # Mémorisation des nouveaux résultats
+            if memo is not None:
+                nouveaux.update({k: r["cycle"] for k, r in calcules_lot[i].items()})
+                for k, cycle in nouveaux.items():
+                    memo.enregistrer(cles[i], k, cycle, l_essai[k], m_essai[k], params_memo[k])
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        if isinstance(journal, JournalEtude):
+            journal.fermer()
+        if fermer_memo:
+            memo.fermer()
+
+    longueurs, temps, temps_cpu, memoire, compteurs = _agreger_essais([termines[i] for i in range(nb_essais)])
 
     # --- CALCULS STATISTIQUES ---
     moyennes_longueurs = {k: np.mean(v) for k, v in longueurs.items()}
@@ -73,20 +305,28 @@ def lancer_etude_statistique(N=10, nb_essais=100):
     ecart_hds = ((lop - lmin) / lmin) * 100
 
     # --- AFFICHAGE CONSOLE ---
-    print(f"\n{'='*65}")
+    print(f"\n{'='*97}")
     print(f"RÉSULTATS MOYENS ({nb_essais} essais, N={N})")
-    print(f"{'-'*65}")
-    print(f"{'ALGO':<10} | {'LONGUEUR':<12} | {'TEMPS (ms)':<12}")
-    print(f"{'-'*65}")
+    print(f"{'-'*97}")
+    print(f"{'ALGO':<10} | {'LONGUEUR':<12} | {'TEMPS (ms)':<12} | {'P50 (ms)':<12} | {'P95 (ms)':<12} | {'CPU (ms)':<12} | {'MÉM (Ko)':<10}")
+    print(f"{'-'*97}")
     for k in moyennes_longueurs:
-        print(f"{k:<10} | {moyennes_longueurs[k]:<12.4f} | {np.mean(temps[k]):<12.4f}")
-    print(f"{'='*65}")
+        t = resumer_distribution(temps[k])
+        mem = f"{max(memoire[k]):<10.1f}" if memoire[k] else f"{'-':<10}"
+        print(f"{k:<10} | {moyennes_longueurs[k]:<12.4f} | {t['moyenne']:<12.4f} | {t['p50']:<12.4f} | {t['p95']:<12.4f} | {np.mean(temps_cpu[k]):<12.4f} | {mem}")
+    print(f"{'='*97}")
     
     print("\nANALYSE :")
     print(f"1. OptPPP améliore PPP de {gain_optppp:.2f}%")
     print(f"2. OptPrim vs OptPPP : {gain_prim:.2f}% (Positif = Prim meilleur)")
     print(f"3. OptPPP est à {ecart_hds:.2f}% de la solution optimale (HDS)")
 
+    print("\nINSTRUMENTATION (moyennes par essai) :")
+    for k, liste in compteurs.items():
+        if liste:
+            valeurs = ", ".join(f"{nom} {np.mean([c[nom] for c in liste]):.1f}" for nom in liste[0])
+            print(f"   {k:<8} : {valeurs}")
+
     # --- GRAPHIQUES STATISTIQUES ---
     plot_stats(longueurs, temps, nb_essais, N)
 
@@ -98,6 +338,8 @@ def plot_stats(longueurs_brutes, temps_bruts, nb_essais, N):
     3. Distribution des longueurs
     4. Distribution des temps (Log scale)
     """
+    # matplotlib n'est chargé que pour tracer (les études elles-mêmes n'en ont pas besoin)
+    import matplotlib.pyplot as plt
     
     # Calcul des moyennes pour les bar charts
     algos = list(longueurs_brutes.keys())
@@ -168,80 +410,257 @@ def plot_stats(longueurs_brutes, temps_bruts, nb_essais, N):
 
 
 
-def etude_evolution_N():
+def _travailleur_evolution(connexion, algo, N, graines, distribution, mesurer_memoire):
+    """
+    Processus fils de etude_evolution_N : exécute un algorithme sur plusieurs instances
+    de taille N et envoie chaque résultat (temps, coût) au processus parent dès qu'il est prêt.
+    """
+    for graine_essai in graines:
+        points = utils.generer_instances(1, N, graine=graine_essai, distribution=distribution)[0]
+        graphe = GrapheMD(N, points)
+        cycles, mesures = _mesurer_algos(graphe, mesurer_memoire, algos=(algo,))
+        mesure = mesures[algo]
+        mesure["cout"] = utils.calculer_longueur_cycle(cycles[algo], graphe)
+        mesure["cycle"] = cycles[algo]
+        connexion.send(mesure)
+    connexion.close()
+
+
+def _executer_point(algo, N, graines, distribution, mesurer_memoire, timeout_s, au_resultat=None):
+    """
+    Exécute un point (algo, N) de l'étude dans un sous-processus.
+    Chaque exécution est bornée par timeout_s : si un résultat n'arrive pas à temps,
+    le sous-processus est tué. au_resultat(indice, mesure), s'il est fourni, est appelé
+    dès qu'un résultat arrive (pour l'écrire dans le journal sans attendre la fin du point).
+
+    Returns:
+        list | None: Les mesures de chaque essai, ou None en cas de dépassement du délai
+    """
+    contexte = multiprocessing.get_context()
+    parent, enfant = contexte.Pipe(duplex=False)
+    processus = contexte.Process(target=_travailleur_evolution,
+                                 args=(enfant, algo, N, graines, distribution, mesurer_memoire),
+                                 daemon=True)
+    processus.start()
+    enfant.close()
+
+    mesures = []
+    try:
+        for indice in range(len(graines)):
+            if not parent.poll(timeout_s):
+                return None
+            mesures.append(parent.recv())
+            if au_resultat is not None:
+                au_resultat(indice, mesures[-1])
+    except EOFError:
+        # Le sous-processus s'est arrêté sans résultat (ex: mémoire insuffisante)
+        return None
+    finally:
+        if processus.is_alive():
+            processus.terminate()
+        processus.join()
+        parent.close()
+    return mesures
+
+
+def ajuster_exposant(liste_N, temps):
+    """
+    Ajuste une loi t = c * N^k par régression linéaire sur les données log-log.
+    On ne garde que la moitié haute de l'échelle des N (au moins 3 points) :
+    aux petites tailles, les temps sont dominés par des coûts fixes.
+
+    Args:
+        liste_N (list): Les tailles mesurées
+        temps (list): Les temps moyens correspondants (ms)
+
+    Returns:
+        tuple | None: (k, c), ou None s'il y a moins de 2 points
+    """
+    if len(liste_N) < 2:
+        return None
+    debut = max(0, min(len(liste_N) // 2, len(liste_N) - 3))
+    k, log_c = np.polyfit(np.log(liste_N[debut:]), np.log(temps[debut:]), 1)
+    return float(k), float(np.exp(log_c))
+
+
+def charger_etude_evolution(chemin_journal):
+    """
+    Relit le journal d'une étude d'évolution, sans rien recalculer.
+    Seuls les points (algo, N) dont tous les essais sont terminés sont retenus.
+
+    Returns:
+        tuple: (echelles_N, couts, temps, exposants), les arguments de plot_evolution
+    """
+    entete, enregistrements = JournalEtude(chemin_journal).lire()
+    if entete is None or entete.get("etude") != "evolution":
+        raise ValueError(f"{chemin_journal} n'est pas le journal d'une étude d'évolution.")
+
+    points = {}
+    for e in enregistrements:
+        if not e.get("delai_depasse"):
+            points.setdefault(e["algo"], {}).setdefault(e["N"], {})[e["essai"]] = e["mesure"]
+
+    echelles_N, couts, temps, exposants = {}, {}, {}, {}
+    for algo, par_N in points.items():
+        complets = sorted(N for N, essais in par_N.items() if len(essais) == entete["nb_essais_par_N"])
+        echelles_N[algo] = complets
+        couts[algo] = [float(np.mean([m["cout"] for m in par_N[N].values()])) for N in complets]
+        temps[algo] = [float(np.mean([m["temps_ms"] for m in par_N[N].values()])) for N in complets]
+        exposants[algo] = ajuster_exposant(complets, temps[algo])
+    return echelles_N, couts, temps, exposants
+
+
+def etude_evolution_N(graine=None, distribution="uniforme", mesurer_memoire=False, algos=ALGOS_ETUDE,
+                      N_depart=5, facteur=1.5, N_max=12000, budget_s=2.0, timeout_s=60.0,
+                      nb_essais_par_N=5, memo=None, journal=None):
     """
     Lance une étude comparative en faisant varier N (nombre de villes).
     Permet de tracer des courbes d'évolution (Complexité).
+
+    Chaque algorithme a sa propre échelle de N, qui croît géométriquement (x facteur)
+    jusqu'à ce que le temps moyen dépasse budget_s, qu'une exécution dépasse timeout_s
+    (délai imposé depuis un sous-processus) ou que N dépasse N_max.
+    HDS s'arrête donc vers N = 15, tandis que PPP et OptPrim montent au-delà de 10 000.
+    L'exposant empirique k (t ~ N^k) est ajusté sur les données log-log.
+    Les temps passent par la couche mesure.py ; pour chaque N on affiche
+    la moyenne, les percentiles, le temps CPU et, avec mesurer_memoire, le pic mémoire.
+    Avec memo (chemin SQLite ou MemoResultats), les points déjà mesurés sont réutilisés.
+    Avec journal (chemin), chaque essai terminé (et chaque dépassement de délai) est ajouté
+    au fichier : relancer l'étude avec le même journal la reprend sans refaire ces essais.
     """
-    # Liste des tailles à tester (Attention : HDS explose après 14/15)
-    # On reste prudent pour que ça ne prenne pas 1 heure.
-    liste_N = [5, 7, 9, 11, 12 , 13 ] 
-    nb_essais_par_N = 20 # On réduit un peu les essais pour aller vite
-    
-    print(f"\n=== ÉTUDE D'ÉVOLUTION (N varie : {liste_N}) ===")
-    
-    # Structures pour stocker les moyennes
-    moyennes_temps = {"PPP": [], "OptPPP": [], "OptPrim": [], "HDS": []}
-    moyennes_couts = {"PPP": [], "OptPPP": [], "OptPrim": [], "HDS": []}
-
-    for N in liste_N:
-        print(f"Traitement N={N}...")
-        
-        # Accumulateurs temporaires pour ce N
-        t_sum = {"PPP": 0, "OptPPP": 0, "OptPrim": 0, "HDS": 0}
-        c_sum = {"PPP": 0, "OptPPP": 0, "OptPrim": 0, "HDS": 0}
-        
-        for _ in range(nb_essais_par_N):
-            points = utils.generer_points_aleatoires(N)
-            graphe = GrapheMD(N, points)
-            
-            # PPP
-            t0 = time.time()
-            c = algo_ppp(graphe)
-            dt = time.time() - t0
-            l = utils.calculer_longueur_cycle(c, graphe)
-            t_sum["PPP"] += dt; c_sum["PPP"] += l
-            c_ppp_res = c # Pour OptPPP
-
-            # OptPPP
-            t0 = time.time()
-            c = opt_ppp(c_ppp_res, graphe)
-            dt = time.time() - t0 + (dt) # Temps cumulé
-            l = utils.calculer_longueur_cycle(c, graphe)
-            t_sum["OptPPP"] += dt; c_sum["OptPPP"] += l
-
-            # OptPrim
-            t0 = time.time()
-            c = opt_prim(graphe)
-            dt = time.time() - t0
-            l = utils.calculer_longueur_cycle(c, graphe)
-            t_sum["OptPrim"] += dt; c_sum["OptPrim"] += l
-
-            # HDS
-            t0 = time.time()
-            c = algo_hds(graphe)
-            dt = time.time() - t0
-            l = utils.calculer_longueur_cycle(c, graphe)
-            t_sum["HDS"] += dt; c_sum["HDS"] += l
-
-        # Calcul des moyennes pour ce N
-        for k in moyennes_temps:
-            moyennes_temps[k].append((t_sum[k] / nb_essais_par_N) * 1000) # en ms
-            moyennes_couts[k].append(c_sum[k] / nb_essais_par_N)
+    params_memo = {"memoire": mesurer_memoire}
+
+    # Graine de base de l'étude : les instances d'une taille N sont les mêmes pour tous les algorithmes
+    base = np.random.SeedSequence(graine).entropy
+
+    # Reprise : essais (algo, N, indice) et dépassements de délai déjà présents dans le journal
+    deja_faits, delais_depasses = {}, set()
+    if journal is not None:
+        journal = JournalEtude(journal)
+        parametres = {"etude": "evolution", "distribution": distribution, "mesurer_memoire": mesurer_memoire,
+                      "nb_essais_par_N": nb_essais_par_N, "graine": base}
+        cles = ("etude", "distribution", "mesurer_memoire", "nb_essais_par_N") + (("graine",) if graine is not None else ())
+        entete, enregistrements = journal.ouvrir(parametres, cles)
+        base = entete["graine"]
+        for e in enregistrements:
+            if e.get("delai_depasse"):
+                delais_depasses.add((e["algo"], e["N"]))
+            else:
+                deja_faits[(e["algo"], e["N"], e["essai"])] = e["mesure"]
+        if deja_faits:
+            print(f"Journal : {len(deja_faits)} essais déjà terminés")
+
+    print(f"\n=== ÉTUDE D'ÉVOLUTION (N = {N_depart} x {facteur}^k, budget {budget_s} s, délai {timeout_s} s) ===")
+
+    # Structures pour stocker les moyennes (une échelle de N par algorithme)
+    echelles_N = {k: [] for k in algos}
+    moyennes_temps = {k: [] for k in algos}
+    moyennes_couts = {k: [] for k in algos}
+    exposants = {}
+
+    memo, fermer_memo = _ouvrir_memo(memo)
+    try:
+        for algo in algos:
+            print(f"\n--- {algo} ---")
+            N = N_depart
+            while N <= N_max:
+                graines = np.random.SeedSequence(base, spawn_key=(N,)).spawn(nb_essais_par_N)
+
+                if (algo, N) in delais_depasses:
+                    print(f"   N={N:<6} délai dépassé (journal) : arrêt de l'échelle")
+                    break
+
+                # Résultats déjà présents dans le journal ou mémorisés pour ce point (algo, N)
+                connus = {i: deja_faits[(algo, N, i)] for i in range(nb_essais_par_N) if (algo, N, i) in deja_faits}
+                if memo is not None:
+                    cles = [hash_points(utils.generer_instances(1, N, graine=g, distribution=distribution)[0])
+                            for g in graines]
+                    for i, cle in enumerate(cles):
+                        if i in connus:
+                            continue
+                        resultat = memo.chercher(cle, algo, params_memo)
+                        if resultat is not None:
+                            connus[i] = dict(resultat["mesures"], cout=resultat["longueur"])
+                            if journal is not None:
+                                journal.ajouter({"algo": algo, "N": N, "essai": i, "mesure": connus[i]})
+
+                a_calculer = [i for i in range(nb_essais_par_N) if i not in connus]
+
+                def au_resultat(indice, mesure):
+                    # Chaque essai est mémorisé et journalisé dès que le sous-processus l'envoie
+                    i = a_calculer[indice]
+                    cycle = mesure.pop("cycle")
+                    if memo is not None:
+                        memo.enregistrer(cles[i], algo, cycle, mesure["cout"],
+                                         {k: v for k, v in mesure.items() if k != "cout"}, params_memo)
+                    if journal is not None:
+                        journal.ajouter({"algo": algo, "N": N, "essai": i, "mesure": mesure})
+                    connus[i] = mesure
+
+                if a_calculer:
+                    calcules = _executer_point(algo, N, [graines[i] for i in a_calculer], distribution,
+                                               mesurer_memoire, timeout_s, au_resultat)
+                    if calcules is None:
+                        if journal is not None:
+                            journal.ajouter({"algo": algo, "N": N, "delai_depasse": True})
+                        print(f"   N={N:<6} délai de {timeout_s} s dépassé : arrêt de l'échelle")
+                        break
+                mesures = [connus[i] for i in range(nb_essais_par_N)]
+
+                t = resumer_distribution([m["temps_ms"] for m in mesures])
+                echelles_N[algo].append(N)
+                moyennes_temps[algo].append(t["moyenne"]) # en ms
+                moyennes_couts[algo].append(float(np.mean([m["cout"] for m in mesures])))
+                mem = f" | mém {max(m['memoire_ko'] for m in mesures):.1f} Ko" if mesurer_memoire else ""
+                print(f"   N={N:<6} moy {t['moyenne']:.4f} ms | p50 {t['p50']:.4f} | p95 {t['p95']:.4f} | cpu {np.mean([m['cpu_ms'] for m in mesures]):.4f} ms{mem}")
+
+                if t["moyenne"] > budget_s * 1000:
+                    print(f"   Budget de {budget_s} s atteint : arrêt de l'échelle")
+                    break
+                N = max(N + 1, int(round(N * facteur)))
+
+            exposants[algo] = ajuster_exposant(echelles_N[algo], moyennes_temps[algo])
+    finally:
+        if journal is not None:
+            journal.fermer()
+        if fermer_memo:
+            memo.fermer()
+
+    print("\nEXPOSANTS EMPIRIQUES (t ~ c * N^k) :")
+    for algo, ajustement in exposants.items():
+        if ajustement is None:
+            print(f"   {algo:<8} : pas assez de points")
+        else:
+            print(f"   {algo:<8} : k = {ajustement[0]:.2f} (N jusqu'à {echelles_N[algo][-1]})")
 
     # --- AFFICHAGE GRAPHIQUE (LINE PLOT) ---
-    plot_evolution(liste_N, moyennes_couts, moyennes_temps)
+    plot_evolution(echelles_N, moyennes_couts, moyennes_temps, exposants)
+
+def plot_evolution(liste_N, data_couts, data_temps, exposants=None):
+    """
+    Trace l'évolution du coût et du temps en fonction de N.
+
+    Args:
+        liste_N (list | dict): Les tailles, communes à tous les algorithmes (liste)
+            ou propres à chaque algorithme (dictionnaire algo -> liste)
+        data_couts (dict): Les coûts moyens par algorithme
+        data_temps (dict): Les temps moyens (ms) par algorithme
+        exposants (dict): Les ajustements (k, c) par algorithme, tracés en pointillés
+    """
+    import matplotlib.pyplot as plt
 
-def plot_evolution(liste_N, data_couts, data_temps):
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
     fig.suptitle("Évolution des Performances en fonction de N (Nombre de villes)", fontsize=16)
     
     markers = {'PPP': 'o', 'OptPPP': 's', 'OptPrim': '^', 'HDS': 'D'}
     colors = {'PPP': '#FF9999', 'OptPPP': '#66B2FF', 'OptPrim': '#99FF99', 'HDS': '#FFCC99'}
 
+    def tailles(algo):
+        return liste_N[algo] if isinstance(liste_N, dict) else liste_N
+
     # GRAPHE 1 : Évolution du Coût
     for algo, vals in data_couts.items():
-        ax1.plot(liste_N, vals, marker=markers[algo], label=algo, color=colors[algo], linewidth=2)
+        ax1.plot(tailles(algo), vals, marker=markers[algo], label=algo, color=colors[algo], linewidth=2)
     ax1.set_title("1. Évolution du Coût Moyen")
     ax1.set_xlabel("Nombre de villes (N)")
     ax1.set_ylabel("Longueur moyenne du cycle")
@@ -250,7 +669,11 @@ def plot_evolution(liste_N, data_couts, data_temps):
 
     # GRAPHE 2 : Évolution du Temps (Log scale)
     for algo, vals in data_temps.items():
-        ax2.plot(liste_N, vals, marker=markers[algo], label=algo, color=colors[algo], linewidth=2)
+        ax2.plot(tailles(algo), vals, marker=markers[algo], label=algo, color=colors[algo], linewidth=2)
+        if exposants and exposants.get(algo):
+            k, c = exposants[algo]
+            N_fit = np.array(tailles(algo), dtype=float)
+            ax2.plot(N_fit, c * N_fit**k, linestyle='--', color=colors[algo], label=f"{algo} ~ N^{k:.2f}")
     ax2.set_title("2. Évolution du Temps de Calcul")
     ax2.set_xlabel("Nombre de villes (N)")
     ax2.set_ylabel("Temps (ms) - Échelle Log")
@@ -258,5 +681,10 @@ def plot_evolution(liste_N, data_couts, data_temps):
     ax2.legend()
     ax2.grid(True, linestyle='--', alpha=0.5)
 
+    # Échelles de N géométriques : axe des N logarithmique
+    if isinstance(liste_N, dict):
+        ax1.set_xscale('log')
+        ax2.set_xscale('log')
+
     plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-    plt.show()
\ No newline at end of file
+    plt.show()
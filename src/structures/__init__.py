@@ -1,4 +1,28 @@
-from .graphe_md import GrapheMD
-from .graphe_tl import GrapheTL
-from .tas import Tas
-from .noeud_exploration import NoeudExploration
\ No newline at end of file
+# Les structures sont chargées à la demande (PEP 562) : importer une seule structure
+# (ex: from structures import Tas) ne charge pas les autres modules du paquet.
+_MODULES = {
+    "GrapheMD": ".graphe_md",
+    "GraphePartage": ".graphe_partage",
+    "PoigneeGraphe": ".graphe_partage",
+    "GrapheTL": ".graphe_tl",
+    "Tas": ".tas",
+    "TasIndexe": ".tas_indexe",
+    "NoeudExploration": ".noeud_exploration",
+    "StatsRecherche": ".stats_recherche",
+    "UnionFind": ".union_find",
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(nom):
+    if nom not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {nom!r}")
+    import importlib
+    valeur = getattr(importlib.import_module(_MODULES[nom], __name__), nom)
+    globals()[nom] = valeur
+    return valeur
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,4 @@
 import numpy as np 
-import heapq # For priority queue implementation
 
 
 # --- STRUCTURE 1 :  GrapheMD (Matrice de Distance) ---
@@ -14,29 +13,138 @@ class GrapheMD:
         n (int): Nombre de sommets dans le graphe.
         points (list of tuples): Liste des coordonnées (x, y) des sommets.
         D (numpy.ndarray): Matrice de distances entre les sommets.
+            Si elle est fournie au constructeur (ex: rechargée depuis le cache
+            d'instances), elle n'est pas recalculée.
+            Vaut None si le graphe est construit avec avec_matrice=False (très grandes
+            instances : seuls les algorithmes basés sur les coordonnées sont alors utilisables).
+            Avec entier=True, les distances sont arrondies à l'entier le plus proche et
+            stockées en int32 (distance EUC_2D de TSPLIB).
+        symetrique (bool): Vrai si D[i][j] == D[j][i] pour tout couple (toujours vrai pour
+            des distances calculées à partir des points)
+        euclidien (bool): Vrai si les distances sont celles des points (faux pour une matrice
+            explicite de depuis_matrice : les méthodes qui ne lisent que les coordonnées la refusent)
     
     Methods:
+        depuis_matrice: Construit le graphe à partir d'une matrice explicite (éventuellement asymétrique).
+        exiger_symetrique: Refuse une matrice asymétrique pour un algorithme qui ne la gère pas.
+        exiger_euclidien: Refuse une matrice explicite pour un algorithme qui ne lit que les coordonnées.
+        partager: Copie la matrice et les coordonnées en mémoire partagée (pools de processus).
         _cacluler_distance_euclidienne: Calcule la distance euclidienne entre deux points.
     """
-    def __init__(self , n , points ) : 
+    def __init__(self , n , points , D=None , avec_matrice=True , entier=False , symetrique=True , euclidien=True ) : 
         self.n = n 
         self.points = points 
-        self.D = np.zeros((n,n))
-        self._calculer_distance_euclidienne()
+        self.symetrique = symetrique
+        self.euclidien = euclidien
+        if D is not None:
+            self.D = D
+        elif not avec_matrice:
+            self.D = None
+        else:
+            self.D = np.zeros((n,n), dtype=np.int32 if entier else np.float64)
+            self._calculer_distance_euclidienne()
+
+    @classmethod
+    def depuis_matrice(cls, D, points=None, dtype=None, symetrique=None):
+        """
+        Construit le graphe à partir d'une matrice de distances explicite
+        (ex: temps de trajet sur un réseau routier, souvent asymétriques).
+
+        Args:
+            D (array-like): La matrice (n, n) ; D[i][j] est le coût du trajet de i vers j
+            points (array-like): Les coordonnées des villes, si elles sont connues (affichage,
+                algorithmes basés sur les coordonnées)
+            dtype: Le type de stockage (np.int32, np.float32, np.float64) ; par défaut celui de D
+            symetrique (bool): La symétrie de D ; vérifiée sur la matrice si elle n'est pas donnée
+
+        Returns:
+            GrapheMD: Le graphe
+
+        Raises:
+            ValueError: Si D n'est pas carrée, contient des valeurs négatives ou non finies,
+                ou si sa diagonale n'est pas nulle
+        """
+        D = np.ascontiguousarray(D, dtype=dtype)
+        if D.ndim != 2 or D.shape[0] != D.shape[1]:
+            raise ValueError(f"La matrice des distances doit être carrée, reçu la forme {D.shape}")
+        if D.dtype.kind not in "iuf":
+            raise ValueError(f"La matrice des distances doit être numérique, reçu le type {D.dtype}")
+        if D.dtype.kind == "f" and not np.isfinite(D).all():
+            raise ValueError("La matrice des distances contient des valeurs non finies")
+        if (D < 0).any():
+            raise ValueError("La matrice des distances contient des valeurs négatives")
+        if np.diagonal(D).any():
+            raise ValueError("La diagonale de la matrice des distances doit être nulle")
+        if symetrique is None:
+            symetrique = bool(np.array_equal(D, D.T))
+        n = D.shape[0]
+        if points is not None:
+            points = np.asarray(points, dtype=np.float64).reshape(n, 2)
+        return cls(n, points, D=D, symetrique=symetrique, euclidien=False)
+
+    def exiger_symetrique(self, algo):
+        """
+        Refuse une matrice asymétrique pour les algorithmes qui supposent D[i][j] == D[j][i]
+        (inversion de segments du 2-opt, arbre couvrant de Prim).
+
+        Raises:
+            ValueError: Si le graphe n'est pas symétrique
+        """
+        if not self.symetrique:
+            raise ValueError(f"{algo} suppose des distances symétriques (D[i][j] == D[j][i]) : "
+                             f"utiliser PPP ou HDS pour une matrice asymétrique")
+
+    def exiger_euclidien(self, algo):
+        """
+        Refuse une matrice explicite (depuis_matrice) pour les algorithmes qui ne lisent que
+        les coordonnées (Hilbert, décomposition, tour dynamique) : ils résoudraient l'instance
+        sur les distances euclidiennes des points, et non sur D.
+
+        Raises:
+            ValueError: Si les distances ne sont pas celles des points, ou s'il n'y a pas de points
+        """
+        if not self.euclidien or self.points is None:
+            raise ValueError(f"{algo} ne lit que les coordonnées des villes : il ne s'applique pas à une "
+                             f"matrice de distances explicite (utiliser PPP, OptPPP, OptPrim, HDS, ILS ou Glouton)")
+
+    def partager(self):
+        """
+        Copie la matrice et les coordonnées dans des blocs de mémoire partagée : les processus
+        d'un pool reçoivent partage.poignee (picklable, quelques octets) au lieu du graphe,
+        et poignee.ouvrir() leur rend le graphe sans copie de D.
+
+        Pour ne garder qu'une copie de D, travailler ensuite sur partage.graphe et libérer
+        le graphe d'origine :
+            partage = G.partager(); del G
+            ils(partage.graphe, nb_workers=4)   # les processus reçoivent partage.poignee
+
+        Returns:
+            GraphePartage: Le partage (à fermer, ou à utiliser dans un bloc with)
+        """
+        from structures.graphe_partage import GraphePartage
+        return GraphePartage(self)
     
 
     def _calculer_distance_euclidienne(self):
         """ Calcule la matrice des distances euclidiennes entre les points. 
         Utilise la formule de la distance euclidienne pour remplir la matrice D.
         La formule est : d = sqrt((x2 - x1)^2 + (y2 - y1)^2)
+        Le calcul est vectorisé par blocs de lignes, pour borner la mémoire temporaire
+        sur les grandes instances. Si D est entière, d est arrondie à l'entier le plus proche.
         """
-        for i in range(self.n):
-            for j in range(self.n):
-                if i != j:
-                    xi , yi = self.points[i]
-                    xj , yj = self.points[j]
-                    self.D[i][j] = np.sqrt((xi - xj)**2 + (yi - yj)**2)
-                else:
-                    self.D[i][j] = 0.0
+        if self.n == 0:
+            return
+        P = np.asarray(self.points, dtype=np.float64).reshape(self.n, 2)
+        x, y = P[:, 0], P[:, 1]
+        taille_bloc = 1024
+        for debut in range(0, self.n, taille_bloc):
+            fin = min(debut + taille_bloc, self.n)
+            dx = x[debut:fin, None] - x[None, :]
+            dy = y[debut:fin, None] - y[None, :]
+            bloc = np.sqrt(dx**2 + dy**2)
+            # Arrondi de TSPLIB : nint(d) = floor(d + 0.5)
+            self.D[debut:fin] = np.floor(bloc + 0.5) if self.D.dtype.kind == "i" else bloc
+        # Diagonale : D[i][i] = 0
+        np.fill_diagonal(self.D, 0.0)
 
     
@@ -0,0 +1,155 @@
+import weakref
+import numpy as np
+from multiprocessing import shared_memory
+from structures.graphe_md import GrapheMD
+
+
+# --- GrapheMD en mémoire partagée (pools de processus) ---
+# Envoyer un GrapheMD à un processus du pool copie (pickle) toute sa matrice : n^2 valeurs par tâche,
+# 3,2 Go pour 20 000 villes. GraphePartage place la matrice et les coordonnées dans des blocs
+# multiprocessing.shared_memory ; les processus reçoivent une PoigneeGraphe (quelques octets)
+# et s'attachent aux blocs sans rien copier.
+#
+#   with G.partager() as partage:
+#       with ProcessPoolExecutor() as pool:
+#           pool.map(tache, [partage.poignee] * nb_taches)   # tache : poignee.ouvrir() -> GrapheMD
+#
+# Le processus qui crée le partage en est le propriétaire : fermer() (ou la sortie du bloc with)
+# détruit les blocs. Les processus attachés gardent leur projection jusqu'à leur fin, la mémoire
+# est rendue au système quand le dernier processus l'a libérée.
+
+
+def _creer_bloc(tableau):
+    """ Copie un tableau dans un nouveau bloc de mémoire partagée ; retourne (bloc, vue). """
+    bloc = shared_memory.SharedMemory(create=True, size=max(1, tableau.nbytes))
+    vue = np.ndarray(tableau.shape, dtype=tableau.dtype, buffer=bloc.buf)
+    vue[...] = tableau
+    return bloc, vue
+
+
+def _liberer(blocs):
+    """ Détruit les blocs (propriétaire). unlink d'abord : c'est lui qui rend la mémoire au système. """
+    for bloc in blocs:
+        try:
+            bloc.unlink()
+        except FileNotFoundError:
+            pass
+        try:
+            bloc.close()
+        except BufferError:
+            # Une vue numpy sur le bloc est encore référencée : la projection sera libérée avec elle
+            pass
+
+
+class PoigneeGraphe:
+    """
+    Référence picklable vers un GrapheMD en mémoire partagée : les noms des blocs,
+    leurs formes et types. Envoyée aux processus à la place du graphe.
+
+    Attributes:
+        n (int): Nombre de sommets
+        symetrique (bool): La symétrie de D
+        euclidien (bool): Vrai si D est calculée à partir des points
+        bloc_D (str | None): Le nom du bloc de la matrice (None si le graphe n'a pas de matrice)
+        forme_D (tuple): La forme de la matrice
+        type_D (str): Le type des distances (ex: "float64", "int32")
+        bloc_points (str | None): Le nom du bloc des coordonnées (n, 2), None s'il n'y en a pas
+
+    Methods:
+        ouvrir: S'attache aux blocs et retourne le graphe (sans copie).
+    """
+
+    def __init__(self, n, symetrique, euclidien, bloc_D, forme_D, type_D, bloc_points):
+        self.n = n
+        self.symetrique = symetrique
+        self.euclidien = euclidien
+        self.bloc_D = bloc_D
+        self.forme_D = forme_D
+        self.type_D = type_D
+        self.bloc_points = bloc_points
+
+    def ouvrir(self):
+        """
+        S'attache aux blocs et retourne un GrapheMD dont D et points sont des vues sur la mémoire
+        partagée (à ne pas modifier). Le dernier graphe ouvert est gardé par le processus :
+        les tâches suivantes d'un même processus du pool ne s'attachent pas à nouveau.
+
+        Returns:
+            GrapheMD: Le graphe partagé
+        """
+        global _DERNIER_OUVERT
+        cle = (self.bloc_D, self.bloc_points)
+        if _DERNIER_OUVERT is not None and _DERNIER_OUVERT[0] == cle:
+            return _DERNIER_OUVERT[1]
+        _DERNIER_OUVERT = None
+
+        blocs, D, points = [], None, None
+        if self.bloc_D is not None:
+            blocs.append(shared_memory.SharedMemory(name=self.bloc_D))
+            D = np.ndarray(self.forme_D, dtype=self.type_D, buffer=blocs[-1].buf)
+        if self.bloc_points is not None:
+            blocs.append(shared_memory.SharedMemory(name=self.bloc_points))
+            points = np.ndarray((self.n, 2), dtype=np.float64, buffer=blocs[-1].buf)
+        graphe = GrapheMD(self.n, points, D=D, avec_matrice=D is not None, symetrique=self.symetrique,
+                          euclidien=self.euclidien)
+        # Les blocs vivent aussi longtemps que le graphe (attribut ajouté après les vues)
+        graphe._blocs_partages = blocs
+        graphe._poignee = self
+        _DERNIER_OUVERT = (cle, graphe)
+        return graphe
+
+    def __repr__(self):
+        return f"PoigneeGraphe(n={self.n}, D={self.bloc_D}, points={self.bloc_points})"
+
+
+# Graphe gardé par ouvrir() dans chaque processus : ((bloc_D, bloc_points), GrapheMD)
+_DERNIER_OUVERT = None
+
+
+class GraphePartage:
+    """
+    Un GrapheMD copié en mémoire partagée, dont ce processus est le propriétaire.
+
+    Attributes:
+        poignee (PoigneeGraphe): La référence à envoyer aux processus
+        graphe (GrapheMD): Le graphe lu dans la mémoire partagée. Le graphe d'origine doit alors
+            être libéré (del G) pour ne pas garder deux copies de la matrice ; les fonctions à pool
+            (ex: ils) qui reçoivent ce graphe réutilisent sa poignée au lieu de le copier à nouveau
+
+    Methods:
+        fermer: Détruit les blocs (appelée aussi en sortie de with, et à la fin du programme
+            si le partage n'a pas été fermé).
+    """
+
+    def __init__(self, G):
+        blocs, D, points = [], None, None
+        try:
+            if G.D is not None:
+                bloc, D = _creer_bloc(np.ascontiguousarray(G.D))
+                blocs.append(bloc)
+            if G.points is not None:
+                bloc, points = _creer_bloc(np.asarray(G.points, dtype=np.float64).reshape(G.n, 2))
+                blocs.append(bloc)
+        except BaseException:
+            _liberer(blocs)
+            raise
+
+        bloc_D = blocs[0].name if D is not None else None
+        bloc_points = blocs[-1].name if points is not None else None
+        self.poignee = PoigneeGraphe(G.n, G.symetrique, G.euclidien, bloc_D, None if D is None else D.shape,
+                                     None if D is None else D.dtype.str, bloc_points)
+        self.graphe = GrapheMD(G.n, points, D=D, avec_matrice=D is not None, symetrique=G.symetrique,
+                               euclidien=G.euclidien)
+        self.graphe._poignee = self.poignee
+        self._finaliseur = weakref.finalize(self, _liberer, blocs)
+
+    def fermer(self):
+        """ Détruit les blocs de mémoire partagée ; self.graphe n'est plus utilisable. """
+        self.graphe = None
+        self._finaliseur()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
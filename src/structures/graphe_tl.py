@@ -1,7 +1,3 @@
-import numpy as np 
-import heapq # For priority queue implementation
-
-
 # --- STRUCTURE 2 :  GrapheTL (Tableau de Listes d'Adjacence) ---
 
 class GrapheTL:
@@ -1,6 +1,3 @@
-import numpy as np
-import heapq
-
 # --- STRUCTURE 4 :  Noeud d'Exploration ---
 
 class NoeudExploration:
@@ -0,0 +1,45 @@
+import time
+
+# --- STRUCTURE 6 :  Statistiques de recherche (Instrumentation) ---
+
+class StatsRecherche:
+    """
+    Compteurs d'instrumentation remplis par un solveur (hds, opt_ppp, prim).
+    Les algorithmes comptent dans des variables locales et ne recopient les valeurs
+    ici qu'à la fin : le surcoût est quasi nul, même quand on ne demande pas les stats.
+
+    Attributes:
+        algo (str): Le nom de l'algorithme instrumenté
+        compteurs (dict): Les compteurs (nom -> entier)
+        chronologie (list): Les améliorations de la meilleure solution, en tuples (temps_s, cout)
+
+    Methods:
+        demarrer: Fixe l'origine des temps de la chronologie.
+        noter_solution: Ajoute une amélioration de la meilleure solution à la chronologie.
+        vers_dict: Retourne les statistiques sous forme sérialisable (JSON).
+    """
+
+    def __init__(self, algo=""):
+        self.algo = algo
+        self.compteurs = {}
+        self.chronologie = []
+        self._t0 = time.perf_counter()
+
+    def __getitem__(self, nom):
+        return self.compteurs[nom]
+
+    def __repr__(self):
+        return f"StatsRecherche({self.algo}, {self.compteurs})"
+
+    def demarrer(self):
+        """ Fixe l'origine des temps de la chronologie. """
+        self._t0 = time.perf_counter()
+
+    def noter_solution(self, cout):
+        """ Ajoute une amélioration de la meilleure solution à la chronologie. """
+        self.chronologie.append((time.perf_counter() - self._t0, float(cout)))
+
+    def vers_dict(self):
+        """ Retourne les statistiques sous forme sérialisable (JSON). """
+        return {"algo": self.algo, "compteurs": dict(self.compteurs),
+                "chronologie": [list(p) for p in self.chronologie]}
@@ -1,4 +1,3 @@
-import numpy as np
 import heapq 
 
 # --- STRUCTURE 3 :  Tas binaire (Min-Heap) ---
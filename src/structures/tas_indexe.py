@@ -0,0 +1,137 @@
+# --- STRUCTURE 5 :  Tas binaire indexé (Min-Heap avec diminution de clé) ---
+
+class TasIndexe:
+    """
+    Représentation d'un tas binaire indexé (min-heap) sur des éléments entiers 0, 1, 2, ...
+    Contrairement à Tas, chaque élément est présent au plus une fois : on peut tester
+    sa présence et diminuer sa priorité en O(log n), sans insérer de doublons.
+
+    Attributes:
+        tas (list): Les éléments, rangés selon l'ordre du tas.
+        cles (list): cles[e] est la priorité de l'élément e.
+        pos (list): pos[e] est la position de e dans tas (-1 si e n'est pas dans le tas).
+
+    Methods:
+        inserer: Insère un nouvel élément dans le tas.
+        extraire_min: Extrait et retourne l'élément avec la plus petite priorité.
+        est_vide: Vérifie si le tas est vide.
+        contient: Vérifie si un élément est dans le tas.
+        diminuer_cle: Diminue la priorité d'un élément déjà présent.
+        entasser: Construit le tas en bloc (heapify) à partir d'éléments et de priorités.
+    """
+
+    def __init__(self, capacite=0):
+        self.tas = []
+        self.cles = [None] * capacite
+        self.pos = [-1] * capacite
+
+    def __len__(self):
+        return len(self.tas)
+
+    def __contains__(self, element):
+        return self.contient(element)
+
+    def _agrandir(self, element):
+        """ Agrandit les tableaux cles/pos pour pouvoir indexer element. """
+        manque = element + 1 - len(self.pos)
+        if manque > 0:
+            # Croissance géométrique pour garder un coût amorti constant
+            manque = max(manque, len(self.pos))
+            self.cles.extend([None] * manque)
+            self.pos.extend([-1] * manque)
+
+    def inserer(self, element, priority):
+        """ Insère un nouvel élément dans le tas. """
+        if self.contient(element):
+            raise ValueError(f"L'élément {element} est déjà dans le tas.")
+        self._agrandir(element)
+        self.cles[element] = priority
+        self.pos[element] = len(self.tas)
+        self.tas.append(element)
+        self._remonter(len(self.tas) - 1)
+
+    def extraire_min(self):
+        """ Extrait et retourne (priorité, élément) pour l'élément de plus petite priorité. """
+        tas = self.tas
+        racine = tas[0]
+        dernier = tas.pop()
+        self.pos[racine] = -1
+        if tas:
+            tas[0] = dernier
+            self.pos[dernier] = 0
+            self._descendre(0)
+        return self.cles[racine], racine
+
+    def est_vide(self):
+        """ Vérifie si le tas est vide. """
+        return len(self.tas) == 0
+
+    def contient(self, element):
+        """ Vérifie si l'élément est actuellement dans le tas. """
+        return element < len(self.pos) and self.pos[element] != -1
+
+    def diminuer_cle(self, element, priority):
+        """ Diminue la priorité d'un élément déjà présent dans le tas. """
+        if not self.contient(element):
+            raise KeyError(f"L'élément {element} n'est pas dans le tas.")
+        if priority > self.cles[element]:
+            raise ValueError("La nouvelle priorité est supérieure à la priorité actuelle.")
+        self.cles[element] = priority
+        self._remonter(self.pos[element])
+
+    def entasser(self, elements, priorites):
+        """
+        Construit le tas en bloc en O(n) (heapify) : remplace le contenu actuel.
+
+        Args:
+            elements (iterable): Les éléments (entiers distincts)
+            priorites (iterable): Les priorités associées, dans le même ordre
+        """
+        for e in self.tas:
+            self.pos[e] = -1
+        self.tas = list(elements)
+        if self.tas:
+            self._agrandir(max(self.tas))
+        for i, (e, p) in enumerate(zip(self.tas, priorites)):
+            self.cles[e] = p
+            self.pos[e] = i
+        for i in range(len(self.tas) // 2 - 1, -1, -1):
+            self._descendre(i)
+
+    def _remonter(self, i):
+        """ Fait remonter l'élément en position i tant qu'il est plus petit que son parent. """
+        tas, cles, pos = self.tas, self.cles, self.pos
+        element = tas[i]
+        cle = cles[element]
+        while i > 0:
+            parent = (i - 1) >> 1
+            e_parent = tas[parent]
+            if not cle < cles[e_parent]:
+                break
+            tas[i] = e_parent
+            pos[e_parent] = i
+            i = parent
+        tas[i] = element
+        pos[element] = i
+
+    def _descendre(self, i):
+        """ Fait descendre l'élément en position i tant qu'un de ses fils est plus petit. """
+        tas, cles, pos = self.tas, self.cles, self.pos
+        n = len(tas)
+        element = tas[i]
+        cle = cles[element]
+        while True:
+            fils = 2 * i + 1
+            if fils >= n:
+                break
+            # Choisir le plus petit des deux fils
+            if fils + 1 < n and cles[tas[fils + 1]] < cles[tas[fils]]:
+                fils += 1
+            e_fils = tas[fils]
+            if not cles[e_fils] < cle:
+                break
+            tas[i] = e_fils
+            pos[e_fils] = i
+            i = fils
+        tas[i] = element
+        pos[element] = i
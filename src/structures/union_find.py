@@ -0,0 +1,56 @@
+# --- STRUCTURE 7 :  Union-Find (ensembles disjoints) ---
+
+class UnionFind:
+    """
+    Représentation d'une partition des éléments 0, 1, ..., n-1 en ensembles disjoints.
+    Sert à savoir si deux villes sont déjà reliées (même fragment), par exemple pour
+    refuser une arête qui fermerait un cycle prématuré.
+
+    Attributes:
+        parent (list): parent[e] est le parent de e dans l'arbre de son ensemble (e si e est la racine).
+        rang (list): rang[r] majore la hauteur de l'arbre de racine r.
+        nb_ensembles (int): Le nombre d'ensembles disjoints.
+
+    Methods:
+        trouver: Retourne le représentant (la racine) de l'ensemble d'un élément.
+        unir: Réunit les ensembles de deux éléments.
+        meme_ensemble: Vérifie si deux éléments sont dans le même ensemble.
+    """
+
+    def __init__(self, n):
+        self.parent = list(range(n))
+        self.rang = [0] * n
+        self.nb_ensembles = n
+
+    def __len__(self):
+        return len(self.parent)
+
+    def trouver(self, e):
+        """ Retourne la racine de l'ensemble de e (compression de chemin par division). """
+        parent = self.parent
+        while parent[e] != e:
+            parent[e] = parent[parent[e]]
+            e = parent[e]
+        return e
+
+    def unir(self, a, b):
+        """
+        Réunit les ensembles de a et b (union par rang).
+
+        Returns:
+            bool: False si a et b étaient déjà dans le même ensemble
+        """
+        ra, rb = self.trouver(a), self.trouver(b)
+        if ra == rb:
+            return False
+        if self.rang[ra] < self.rang[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        if self.rang[ra] == self.rang[rb]:
+            self.rang[ra] += 1
+        self.nb_ensembles -= 1
+        return True
+
+    def meme_ensemble(self, a, b):
+        """ Vérifie si a et b sont dans le même ensemble. """
+        return self.trouver(a) == self.trouver(b)
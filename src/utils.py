@@ -1,7 +1,9 @@
 import random 
 import os 
 import sys 
-from structures.tas import Tas 
+import numpy as np
+from structures.tas_indexe import TasIndexe
+from structures.stats_recherche import StatsRecherche
 from structures.graphe_md import GrapheMD
 from structures.graphe_tl import GrapheTL 
 # --- Helper functions 
@@ -26,6 +28,55 @@ def generer_points_aleatoires(n):
         points.append((x, y))
     return points
 
+# --- 1 bis. Generer un lot d'instances (vectorisé et reproductible)
+DISTRIBUTIONS = ("uniforme", "clusters", "grille")
+
+def generer_instances(nb_instances, n, graine=None, distribution="uniforme", nb_clusters=5, ecart_cluster=0.05):
+    """
+    Génère B instances de n points d'un seul coup, à partir d'un générateur
+    numpy.random.Generator initialisé avec une graine explicite.
+    La même graine redonne exactement le même corpus.
+
+    Distributions disponibles :
+        - "uniforme" : coordonnées uniformes dans [0, 1]
+        - "clusters" : points gaussiens autour de nb_clusters centres uniformes (bornés à [0, 1])
+        - "grille"   : n cases distinctes d'une grille régulière, avec un léger bruit
+
+    Args:
+        nb_instances (int): Le nombre d'instances B
+        n (int): Le nombre de points par instance
+        graine (int | numpy.random.SeedSequence): La graine du générateur
+        distribution (str): La distribution des points
+        nb_clusters (int): Le nombre de centres (distribution "clusters")
+        ecart_cluster (float): L'écart-type autour des centres (distribution "clusters")
+
+    Returns:
+        numpy.ndarray: Un tableau (B, n, 2) des coordonnées générées
+    """
+    rng = np.random.default_rng(graine)
+    B = nb_instances
+
+    if distribution == "uniforme":
+        return rng.random((B, n, 2))
+
+    if distribution == "clusters":
+        centres = rng.random((B, nb_clusters, 2))
+        affectation = rng.integers(0, nb_clusters, size=(B, n))
+        base = np.take_along_axis(centres, affectation[:, :, None], axis=1)
+        points = base + rng.normal(0.0, ecart_cluster, size=(B, n, 2))
+        return np.clip(points, 0.0, 1.0)
+
+    if distribution == "grille":
+        cote = int(np.ceil(np.sqrt(n)))
+        # Tirage sans remise de n cases parmi cote*cote, indépendamment pour chaque instance
+        cases = rng.permuted(np.tile(np.arange(cote * cote), (B, 1)), axis=1)[:, :n]
+        lignes, colonnes = np.divmod(cases, cote)
+        pas = 1.0 / cote
+        points = np.stack([(colonnes + 0.5) * pas, (lignes + 0.5) * pas], axis=-1)
+        return points + rng.uniform(-0.1 * pas, 0.1 * pas, size=(B, n, 2))
+
+    raise ValueError(f"Distribution inconnue : {distribution} (attendu : {', '.join(DISTRIBUTIONS)})")
+
 # --- 2. Lire un fichier texte
 
 def lire_fichier_texte(chemin_fichier):
@@ -71,23 +122,118 @@ def lire_fichier_texte(chemin_fichier):
 def calculer_longueur_cycle(cycle , graphe_md):
     """
     Calcule la longueur totale d'un cycle hamiltonien donné.
+    Les arêtes (cycle[i], cycle[i+1]) sont lues dans D en un seul accès vectorisé (gather numpy).
 
     Args:
-        cycle (list): Une liste de tuples représentant les points du cycle
-        graphe_md (dict): Un dictionnaire représentant le graphe des distances
+        cycle (list): Une liste représentant l'ordre de visite des villes
+        graphe_md (GrapheMD): Le graphe des distances
 
     Returns:
         float: La longueur totale du cycle
     """
-    longueur = 0.0
-    n = len(cycle)
-    D = graphe_md.D 
-    for i in range(n):
-        u = cycle[i] 
-        v = cycle[(i + 1) % n]  # Prochain point, en bouclant au début
-        longueur += D[u][v]
-    
-    return longueur
+    if len(cycle) == 0:
+        return 0.0
+    c = np.asarray(cycle, dtype=np.intp)
+    D = np.asarray(graphe_md.D)
+    # Prochain point, en bouclant au début
+    return float(D[c, np.roll(c, -1)].sum())
+
+
+def calculer_longueur_cycle_coords(cycle, points):
+    """
+    Calcule la longueur d'un cycle directement à partir des coordonnées,
+    sans matrice de distances (utile pour les grandes instances).
+
+    Args:
+        cycle (list): Une liste représentant l'ordre de visite des villes
+        points (list | numpy.ndarray): Les coordonnées (x, y) des villes
+
+    Returns:
+        float: La longueur euclidienne totale du cycle
+    """
+    if len(cycle) == 0:
+        return 0.0
+    P = np.asarray(points, dtype=np.float64)[np.asarray(cycle, dtype=np.intp)]
+    delta = P - np.roll(P, -1, axis=0)
+    return float(np.hypot(delta[:, 0], delta[:, 1]).sum())
+
+
+def calculer_longueurs_lot(cycles, D):
+    """
+    Calcule les longueurs de plusieurs cycles en un seul appel.
+    Combinaisons acceptées :
+        - cycles (T, n) et D (n, n)    : T cycles sur la même instance
+        - cycle  (n,)   et D (B, n, n) : le même cycle sur B instances
+        - cycles (B, n) et D (B, n, n) : le cycle b évalué sur l'instance b
+
+    Args:
+        cycles (list | numpy.ndarray): Un cycle ou un tableau de cycles de même taille
+        D (numpy.ndarray): Une matrice (n, n) ou une pile de matrices (B, n, n)
+
+    Returns:
+        numpy.ndarray: Le tableau des longueurs
+    """
+    cycles = np.asarray(cycles, dtype=np.intp)
+    D = np.asarray(D)
+    suivants = np.roll(cycles, -1, axis=-1)
+
+    if D.ndim == 2:
+        return D[cycles, suivants].sum(axis=-1)
+
+    B, n = D.shape[0], cycles.shape[-1]
+    cycles = np.broadcast_to(cycles, (B, n))
+    suivants = np.broadcast_to(suivants, (B, n))
+    lignes = np.arange(B)[:, None]
+    return D[lignes, cycles, suivants].sum(axis=-1)
+
+
+def calculer_matrices_lot(points):
+    """
+    Calcule les matrices de distances euclidiennes de B instances de même taille
+    (mêmes valeurs que GrapheMD, au bit près).
+
+    Args:
+        points (numpy.ndarray): Les coordonnées (B, n, 2)
+
+    Returns:
+        numpy.ndarray: La pile (B, n, n) des matrices
+    """
+    P = np.asarray(points, dtype=np.float64)
+    x, y = P[:, :, 0], P[:, :, 1]
+    dx = x[:, :, None] - x[:, None, :]
+    dy = y[:, :, None] - y[:, None, :]
+    D = np.sqrt(dx**2 + dy**2)
+    D[:, np.arange(P.shape[1]), np.arange(P.shape[1])] = 0.0
+    return D
+
+
+def calculer_longueurs_lot_coords(cycles, points):
+    """
+    Version par coordonnées de calculer_longueurs_lot (aucune matrice n'est construite).
+    Combinaisons acceptées :
+        - cycles (T, n) et points (n, 2)    : T cycles sur la même instance
+        - cycle  (n,)   et points (B, n, 2) : le même cycle sur B instances
+        - cycles (B, n) et points (B, n, 2) : le cycle b évalué sur l'instance b
+
+    Args:
+        cycles (list | numpy.ndarray): Un cycle ou un tableau de cycles de même taille
+        points (numpy.ndarray): Les coordonnées (n, 2) ou une pile (B, n, 2)
+
+    Returns:
+        numpy.ndarray: Le tableau des longueurs
+    """
+    cycles = np.asarray(cycles, dtype=np.intp)
+    points = np.asarray(points, dtype=np.float64)
+
+    if points.ndim == 2:
+        P = points[cycles]
+    else:
+        B, n = points.shape[0], cycles.shape[-1]
+        cycles = np.broadcast_to(cycles, (B, n))
+        P = np.take_along_axis(points, cycles[:, :, None], axis=1)
+
+    delta = P - np.roll(P, -1, axis=-2)
+    return np.hypot(delta[..., 0], delta[..., 1]).sum(axis=-1)
 
 
 # --- 4. DFS 
@@ -165,47 +311,63 @@ def dfs(GTL) :
 
 
 # --- 5. Prim algorithme 
-def prim(graphe_md) : 
+def prim(graphe_md, avec_stats=False) : 
     """
     Implementation de l'algorithme de Prim pour construire un arbre couvrant de poids minimal (MST)
-    Version optimisée utilisant un tas binaire pour la sélection efficace des arêtes de poids minimal.
+    Version optimisée utilisant un tas binaire indexé : tous les sommets sont placés dans le tas
+    dès le départ (entasser), puis leurs clés sont diminuées sur place (diminuer_cle),
+    sans insertion de doublons ni extraction de sommets déjà visités.
 
     Args :
         graphe_md (GrapheMD) : Le graphe des distances entre les points
+        avec_stats (bool) : Retourner aussi les statistiques du tas
 
     Returns :
         list : le tableau des prédécesseurs (pi) représentant le MST construit 
+        Si avec_stats : tuple (pi, stats) avec stats (StatsRecherche) contenant insertions_tas,
+            diminutions_cle, extractions et extractions_obsoletes (toujours 0 avec le tas indexé)
+
+    Raises :
+        ValueError : Si la matrice est asymétrique (l'arbre couvrant suppose un graphe non orienté)
     """
+    graphe_md.exiger_symetrique("Prim")
     n = graphe_md.n 
     D = graphe_md.D 
+    nb_diminutions = 0
 
     # Initialisations 
-    cle = [float('inf')] * n 
+    cle = np.full(n, np.inf)
     pi = [-1] * n 
-    visite = [False] * n 
+    visite = np.zeros(n, dtype=bool)
+
+    if n == 0 :
+        return (pi, StatsRecherche("Prim")) if avec_stats else pi
 
-    # Initialiser le tas avec les clés 
-    F = Tas()
+    # Initialiser le tas avec les clés (construction en bloc, O(n))
     cle[0] = 0
-    F.inserer(0, cle[0])
+    F = TasIndexe(n)
+    F.entasser(range(n), cle.tolist())
 
     while not F.est_vide() :
-        # Extraire le sommet u avec la clé minimale 
+        # Extraire le sommet s avec la clé minimale 
         _ , s = F.extraire_min()
-
-        if visite[s] :
-            continue
         visite[s] = True
 
-
-        # Mettre à jour les clés des voisins de u 
-        for t in range(n) : 
-            if s == t :
-                continue
-            if not visite[t] and D[s][t] < cle[t] :
-                cle[t] = D[s][t]
-                pi[t] = s 
-                F.inserer(t, cle[t])    
+        # Mettre à jour les clés des voisins de s 
+        # La sélection des voisins améliorés est vectorisée, seules les diminutions passent par le tas
+        Ds = D[s]
+        ameliores = np.flatnonzero(~visite & (Ds < cle))
+        for t in ameliores.tolist() : 
+            cle[t] = Ds[t]
+            pi[t] = s 
+            F.diminuer_cle(t, float(cle[t]))
+        nb_diminutions += len(ameliores)
+
+    if avec_stats :
+        stats = StatsRecherche("Prim")
+        stats.compteurs.update(insertions_tas=n, diminutions_cle=nb_diminutions,
+                               extractions=n, extractions_obsoletes=0)
+        return pi, stats
     return pi
 
 
@@ -228,4 +390,33 @@ def pi_vers_graphe_tl(pi) :
         if u != -1 :
             GTL.ajouter_arc(u, v, 1)  # Poids par défaut de 1 pour le MST
     
-    return GTL
\ No newline at end of file
+    return GTL
+
+
+# --- 7. Listes de voisins candidats
+def calculer_voisins_candidats(graphe_md, k=10) :
+    """
+    Calcule, pour chaque ville, la liste de ses k plus proches voisins
+    (triés par distance croissante) à partir de la matrice D.
+
+    Args :
+        graphe_md (GrapheMD) : Le graphe des distances entre les points
+        k (int) : Le nombre de voisins à conserver par ville (borné par n - 1)
+
+    Returns :
+        numpy.ndarray : Tableau (n, k) d'indices de villes
+    """
+    n = graphe_md.n
+    k = min(k, n - 1)
+    if k <= 0 :
+        return np.zeros((n, 0), dtype=np.int32)
+
+    # On exclut la ville elle-même en mettant sa distance à +inf
+    D = np.array(graphe_md.D, dtype=np.float64)
+    np.fill_diagonal(D, np.inf)
+
+    # Sélection partielle (O(n) par ligne) puis tri des k candidats seulement
+    candidats = np.argpartition(D, k - 1, axis=1)[:, :k]
+    distances = np.take_along_axis(D, candidats, axis=1)
+    ordre = np.argsort(distances, axis=1, kind='stable')
+    return np.take_along_axis(candidats, ordre, axis=1).astype(np.int32)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Les modules du projet s'importent depuis src/ (comme avec python main.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
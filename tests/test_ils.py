@@ -0,0 +1,20 @@
+import time
+import numpy as np
+from structures.graphe_md import GrapheMD
+from algos.algo_ppp import algo_ppp
+from algos.ils import ils
+
+# La construction des départs et la conversion de D sont comptées dans le budget de temps
+
+
+def test_ils_respecte_un_budget_court():
+    n = 1500
+    graphe = GrapheMD(n, np.random.default_rng(0).random((n, 2)))
+    debut = time.perf_counter()
+    cycle, stats = ils(graphe, limite_temps=0.1, nb_workers=1, graine=0, avec_stats=True)
+    assert time.perf_counter() - debut < 0.4
+    assert sorted(cycle) == list(range(n))
+    depart = np.asarray(algo_ppp(graphe))
+    longueur = lambda c: graphe.D[c, np.roll(c, -1)].sum()
+    assert longueur(np.asarray(cycle)) <= longueur(depart) + 1e-9
+    assert stats.compteurs["departs"] >= 1
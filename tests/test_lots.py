@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+from structures.graphe_md import GrapheMD
+from algos.algo_ppp import algo_ppp, algo_ppp_lot
+from algos.opt_ppp import opt_ppp, opt_ppp_lot
+import utils
+
+# Les versions en lot doivent donner exactement les cycles des versions instance par instance
+
+
+@pytest.mark.parametrize("n, distribution", [(2, "uniforme"), (3, "uniforme"), (10, "uniforme"),
+                                             (10, "grille"), (10, "clusters"), (30, "uniforme")])
+def test_lot_identique_aux_versions_sequentielles(n, distribution):
+    points = utils.generer_instances(60, n, graine=n, distribution=distribution)
+    graphes = [GrapheMD(n, p) for p in points]
+    D = utils.calculer_matrices_lot(points)
+    for b, graphe in enumerate(graphes):
+        assert np.array_equal(D[b], graphe.D)
+
+    cycles_ppp = algo_ppp_lot(D)
+    cycles_opt = opt_ppp_lot(cycles_ppp, D)
+    for b, graphe in enumerate(graphes):
+        cycle = algo_ppp(graphe)
+        assert cycles_ppp[b].tolist() == cycle
+        assert cycles_opt[b].tolist() == opt_ppp(cycle, graphe)
+
+
+def test_lot_asymetrique_refuse_par_opt_ppp():
+    D = np.random.default_rng(0).random((4, 6, 6))
+    D[:, np.arange(6), np.arange(6)] = 0.0
+    cycles = algo_ppp_lot(D)
+    assert sorted(cycles[0].tolist()) == list(range(6))
+    with pytest.raises(ValueError):
+        opt_ppp_lot(cycles, D)
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+from structures.graphe_md import GrapheMD
+from algos.tour_dynamique import TourDynamique
+from solveur import resoudre
+
+# Les méthodes qui ne lisent que les coordonnées refusent une matrice explicite
+
+
+@pytest.mark.parametrize("avec_points", [True, False])
+@pytest.mark.parametrize("methode", ["Hilbert", "Decomposition"])
+def test_matrice_explicite_refusee(methode, avec_points):
+    points = np.random.default_rng(0).random((20, 2))
+    D = GrapheMD(20, points).D * 3.0  # symétrique, mais sans rapport avec les coordonnées
+    graphe = GrapheMD.depuis_matrice(D, points if avec_points else None)
+    with pytest.raises(ValueError, match="coordonnées"):
+        resoudre(graphe, methode)
+    with pytest.raises(ValueError, match="coordonnées"):
+        TourDynamique.depuis_graphe(graphe, list(range(20)))
+
+
+def test_graphe_de_points_accepte():
+    graphe = GrapheMD(20, np.random.default_rng(0).random((20, 2)))
+    for methode in ("Hilbert", "Decomposition"):
+        assert sorted(resoudre(graphe, methode).cycle) == list(range(20))
+    with graphe.partager() as partage:
+        assert partage.graphe.euclidien and partage.poignee.ouvrir().euclidien
+
+
+def test_instance_vide():
+    graphe = GrapheMD(0, np.zeros((0, 2)))
+    for methode in ("PPP", "OptPPP", "OptPrim", "Hilbert", "Decomposition", "ILS", "Recuit", "Glouton"):
+        assert resoudre(graphe, methode, limite_temps=0.1).cycle == []
@@ -0,0 +1,35 @@
+import importlib
+import pytest
+import memo_resultats
+from memo_resultats import MemoResultats, SOURCES_ETAPES, version_algo
+from solveur import CONSTRUCTEURS, AMELIORATIONS, METHODES, enregistrer_methode
+
+# Chaque étape du registre versionne ses résultats mémorisés par ses propres sources
+
+
+def test_toutes_les_etapes_ont_des_sources():
+    for etape in list(CONSTRUCTEURS) + list(AMELIORATIONS):
+        assert SOURCES_ETAPES.get(etape), etape
+        for nom_module in SOURCES_ETAPES[etape]:
+            importlib.import_module(nom_module)
+    for methode in METHODES:
+        assert version_algo(methode)
+
+
+def test_etape_sans_sources_refusee(monkeypatch, tmp_path):
+    monkeypatch.setitem(METHODES, "Essai", ("Essai",))
+    monkeypatch.setitem(CONSTRUCTEURS, "Essai", lambda ctx: (list(range(ctx.graphe.n)), None))
+    monkeypatch.setattr(memo_resultats, "_versions", {})
+    with pytest.raises(ValueError, match="sources"):
+        version_algo("Essai")
+    with MemoResultats(str(tmp_path / "memo.sqlite")) as memo, pytest.raises(ValueError):
+        memo.enregistrer("instance", "Essai", [0, 1, 2], 3.0, {})
+
+
+def test_enregistrer_methode_avec_sources(monkeypatch):
+    monkeypatch.setattr(memo_resultats, "_versions", {})
+    monkeypatch.setattr(memo_resultats, "SOURCES_ETAPES", dict(SOURCES_ETAPES))
+    monkeypatch.setitem(METHODES, "Essai", ("Essai",))
+    monkeypatch.setitem(CONSTRUCTEURS, "Essai", None)
+    enregistrer_methode("Essai", constructeur=lambda ctx: ([], None), sources=["algos.algo_ppp"])
+    assert version_algo("Essai") != version_algo("PPP")
@@ -0,0 +1,18 @@
+import numpy as np
+from structures.graphe_md import GrapheMD
+from structures import graphe_partage
+from algos.ils import ils
+
+# Un graphe déjà en mémoire partagée est envoyé aux processus sans nouvelle copie de D
+
+
+def test_ils_reutilise_le_graphe_partage(monkeypatch):
+    partage = GrapheMD(60, np.random.default_rng(0).random((60, 2))).partager()
+    try:
+        def recopie(*args, **kwargs):
+            raise AssertionError("le graphe partagé a été recopié")
+        monkeypatch.setattr(graphe_partage.GraphePartage, "__init__", recopie)
+        cycle = ils(partage.graphe, limite_temps=0.3, nb_workers=2, graine=0)
+        assert sorted(cycle) == list(range(60))
+    finally:
+        partage.fermer()
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+from structures.graphe_md import GrapheMD
+from algos.algo_ppp import algo_ppp
+from algos.recuit import recuit_simule, _sans_chevauchement
+
+# Petites instances (N = 10 dans l'étude statistique) : le recuit part de PPP
+
+
+def _longueur(graphe, cycle):
+    return float(graphe.D[cycle, np.roll(cycle, -1)].sum())
+
+
+@pytest.mark.parametrize("n", [5, 6, 8, 10])
+def test_recuit_jamais_pire_et_reproductible(n):
+    for graine in range(5):
+        graphe = GrapheMD(n, np.random.default_rng(graine).random((n, 2)))
+        depart = list(algo_ppp(graphe))
+        cycle = recuit_simule(depart, graphe, nb_lots=500, graine=graine)
+        assert sorted(cycle) == list(range(n))
+        assert _longueur(graphe, cycle) <= _longueur(graphe, depart) + 1e-9
+        assert recuit_simule(depart, graphe, nb_lots=500, graine=graine) == cycle
+
+
+def test_sans_chevauchement_glouton():
+    i = np.array([0, 3, 0, 2, 5, 3])
+    j = np.array([2, 4, 2, 6, 7, 4])
+    gardes = _sans_chevauchement(i, j)
+    assert sorted(zip(i[gardes].tolist(), j[gardes].tolist())) == [(0, 2), (3, 4), (5, 7)]